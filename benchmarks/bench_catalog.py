@@ -0,0 +1,95 @@
+"""
+Measures the time and the memory kept (decoded catalog included) by
+`IndicatorManager.list_all` on a synthetic catalog shaped like the response of
+`/indicators`, building the indicators with pydantic validation, as trusted
+models, and as trusted models without their raw data.
+
+Run it with ``python -m benchmarks.bench_catalog``.
+"""
+
+import json
+import time
+import tracemalloc
+from typing import Any, Dict, List, Sequence, Tuple
+
+from esiosapy.managers.indicator_manager import IndicatorManager
+
+N_INDICATORS = 2000
+N_ROUNDS = 3
+
+
+class _CatalogRequestHelper:
+    """Returns a freshly decoded catalog, so decoding is not measured."""
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.catalog: List[Dict[str, Any]] = []
+
+    def prepare(self) -> None:
+        self.catalog = json.loads(self.body)["indicators"]
+
+    def get_json(
+        self, path: str, params: Any = None, key_path: Sequence[str] = ()
+    ) -> List[Dict[str, Any]]:
+        return self.catalog
+
+
+def _catalog() -> Dict[str, Any]:
+    description = (
+        "<p>Precio del mercado diario para la zona española, publicado por el "
+        "operador del mercado tras la casación de las ofertas.</p>"
+    ) * 6
+    return {
+        "indicators": [
+            {
+                "id": i,
+                "name": f"Indicador {i} de generación programada",
+                "short_name": f"Indicador {i}",
+                "description": description,
+                "raw_description": description,
+            }
+            for i in range(N_INDICATORS)
+        ]
+    }
+
+
+def _measure(
+    request_helper: _CatalogRequestHelper, **options: bool
+) -> Tuple[float, int]:
+    manager = IndicatorManager(request_helper, **options)  # type: ignore[arg-type]
+
+    best = float("inf")
+    for _ in range(N_ROUNDS):
+        request_helper.prepare()
+        start = time.perf_counter()
+        manager.list_all()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    request_helper.prepare()
+    indicators = manager.list_all()
+    request_helper.catalog = []
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del indicators
+    return best, kept
+
+
+def main() -> None:
+    body = json.dumps(_catalog()).encode()
+    request_helper = _CatalogRequestHelper(body)
+    print(f"catalog: {N_INDICATORS} indicators, {len(body) / 1024:.0f} KB")
+    print(f"{'mode':<24}{'ms':>10}{'kept KB':>12}")
+
+    modes = [
+        ("validated", {}),
+        ("trusted", {"trusted_models": True}),
+        ("trusted, no raw", {"trusted_models": True, "keep_raw": False}),
+    ]
+    for name, options in modes:
+        seconds, kept = _measure(request_helper, **options)
+        print(f"{name:<24}{seconds * 1000:>10.2f}{kept / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
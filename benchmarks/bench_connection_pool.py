@@ -0,0 +1,50 @@
+"""
+Compares requests/sec of one-off `requests.get` calls against the pooled session
+of `RequestHelper`, using a local stub server.
+
+Run it with ``python -m benchmarks.bench_connection_pool``.
+"""
+
+import time
+from typing import Callable
+from urllib.parse import urljoin
+
+import requests
+
+from benchmarks.stub_server import StubServer
+from esiosapy.utils.request_helper import RequestHelper
+
+N_REQUESTS = 500
+PAYLOAD = {"indicator": {"id": 1, "values": [{"value": 1.0}] * 24}}
+
+
+def _requests_per_second(fetch: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        fetch()
+    return N_REQUESTS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    with StubServer(PAYLOAD) as server:
+        request_helper = RequestHelper(server.url, "bench-token")
+        headers = request_helper.add_default_headers({})
+        url = urljoin(server.url, "/indicators/1")
+
+        def unpooled() -> None:
+            requests.get(url, headers=headers).raise_for_status()
+
+        def pooled() -> None:
+            request_helper.get_request("/indicators/1")
+
+        before = _requests_per_second(unpooled)
+        with request_helper:
+            after = _requests_per_second(pooled)
+
+    print(f"requests.get per call: {before:8.1f} req/s")
+    print(f"pooled RequestHelper:  {after:8.1f} req/s")
+    print(f"speedup:               {after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
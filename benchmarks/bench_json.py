@@ -0,0 +1,85 @@
+"""
+Measures the decode time per MB of every installed JSON backend, on a synthetic
+payload shaped like the response of `/indicators/{id}` for a year of
+five-minute values, both decoding the whole body and only `indicator.values`.
+
+Run it with ``python -m benchmarks.bench_json``.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Callable, Dict
+
+from esiosapy.utils.json_backend import JSON_BACKENDS, get_json_backend
+
+N_VALUES = 365 * 24 * 12
+N_ROUNDS = 3
+
+
+def _payload() -> Dict[str, Any]:
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    values = []
+    for i in range(N_VALUES):
+        dt = start + timedelta(minutes=5 * i)
+        values.append(
+            {
+                "value": 20000 + (i % 1000) * 1.5,
+                "datetime": (dt + timedelta(hours=1)).strftime(
+                    "%Y-%m-%dT%H:%M:%S.000+01:00"
+                ),
+                "datetime_utc": dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "tz_time": dt.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "geo_id": 8741,
+                "geo_name": "Península",
+            }
+        )
+    return {
+        "indicator": {
+            "name": "Demanda real",
+            "short_name": "Demanda real",
+            "id": 1293,
+            "composited": False,
+            "step_type": "linear",
+            "disaggregated": False,
+            "magnitud": [{"name": "Potencia", "id": 20}],
+            "tiempo": [{"name": "Cinco minutos", "id": 154}],
+            "geos": [{"geo_id": 8741, "geo_name": "Península"}],
+            "values_updated_at": "2022-01-01T00:00:00.000+01:00",
+            "values": values,
+        }
+    }
+
+
+def _seconds(decode: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(N_ROUNDS):
+        start = time.perf_counter()
+        decode()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    body = json.dumps(_payload()).encode()
+    size_mb = len(body) / 1024 / 1024
+    print(f"payload: {N_VALUES} values, {size_mb:.1f} MB")
+    print(f"{'backend':<10}{'whole ms/MB':>14}{'values ms/MB':>14}")
+
+    for name in JSON_BACKENDS:
+        try:
+            backend = get_json_backend(name)
+        except ImportError:
+            print(f"{name:<10}{'not installed':>28}")
+            continue
+
+        whole = _seconds(partial(backend.loads, body))
+        values = _seconds(partial(backend.loads_path, body, ("indicator", "values")))
+        print(
+            f"{name:<10}{whole * 1000 / size_mb:>14.2f}{values * 1000 / size_mb:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Compares the previous `recursive_unzip`, which extracted nested ZIP files to
+disk and rescanned the tree for them, against the single-pass extractor, on a
+synthetic archive of monthly ZIP files holding daily ZIP files.
+
+Run it with ``python -m benchmarks.bench_unzip``.
+"""
+
+import io
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Union
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from esiosapy.utils.zip_utils import recursive_unzip
+
+N_MONTHS = 12
+N_DAYS = 30
+ROWS_PER_DAY = 2_000
+
+
+def _legacy_recursive_unzip(
+    zip_path: Union[str, Path], unzip_path: Union[str, Path], remove: bool = False
+) -> None:
+    zip_path, unzip_path = Path(zip_path), Path(unzip_path)
+
+    with ZipFile(zip_path, "r") as zip_ref:
+        zip_ref.extractall(unzip_path)
+
+    for zip_subfile in unzip_path.rglob("*.zip"):
+        nested_unzip_path = zip_subfile.parent / zip_subfile.stem
+        with ZipFile(zip_subfile, "r") as zip_ref:
+            zip_ref.extractall(nested_unzip_path)
+
+        _legacy_recursive_unzip(zip_subfile, nested_unzip_path, remove)
+
+        if remove and zip_subfile.exists():
+            zip_subfile.unlink()
+
+    if remove and zip_path.exists():
+        zip_path.unlink()
+
+
+def _zip_bytes(files: dict) -> bytes:
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w", compression=ZIP_DEFLATED) as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+    return buffer.getvalue()
+
+
+def _build_archive(path: Path) -> None:
+    rows = "".join(f"2021-01-01T{i % 24:02}:00;{i}.5\n" for i in range(ROWS_PER_DAY))
+    day = _zip_bytes({"data.csv": rows})
+    month = _zip_bytes({f"{d:02}.zip": day for d in range(1, N_DAYS + 1)})
+    path.write_bytes(_zip_bytes({f"{m:02}.zip": month for m in range(1, N_MONTHS + 1)}))
+
+
+def _seconds(unzip: Callable[[Path, Path, bool], object], archive: Path) -> float:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        zip_path = Path(tmp_dir) / "archive.zip"
+        shutil.copy(archive, zip_path)
+
+        start = time.perf_counter()
+        unzip(zip_path, Path(tmp_dir) / "archive", True)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive = Path(tmp_dir) / "archive.zip"
+        _build_archive(archive)
+
+        before = _seconds(_legacy_recursive_unzip, archive)
+        after = _seconds(recursive_unzip, archive)
+
+    print(f"{N_MONTHS * N_DAYS} nested daily zips")
+    print(f"previous recursive_unzip: {before:8.3f} s")
+    print(f"single-pass extractor:    {after:8.3f} s")
+    print(f"speedup:                  {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import json
+import re
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.payloads import (
+    DEFAULT_GEO_IDS,
+    GEOS,
+    archive_catalog,
+    archive_zip,
+    indicator_catalog,
+    indicator_payload,
+    indicator_values,
+)
+from benchmarks.stub_server import StubServer
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.date_utils import parse_datetime
+
+_INDICATOR = re.compile(r"^/(indicators|offer_indicators)/(\d+)$")
+_ARCHIVE_DOWNLOAD = re.compile(r"^/archives/(\d+)/download$")
+
+
+class _EsiosStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        stub: EsiosStubServer = self.server.stub  # type: ignore
+
+        if url.path in ("/indicators", "/offer_indicators"):
+            self._send(stub.indicator_catalog)
+        elif url.path == "/archives":
+            self._send(stub.archive_catalog)
+        elif _INDICATOR.match(url.path):
+            self._send(self._indicator(int(url.path.rsplit("/", 1)[1]), query))
+        elif _ARCHIVE_DOWNLOAD.match(url.path):
+            self._send(stub.archive_zip, "application/zip")
+        else:
+            self._send(b'{"message": "Not found"}', status=404)
+
+    def _indicator(self, indicator_id: int, query: Dict[str, str]) -> bytes:
+        if "datetime" in query:
+            # Offer indicators are requested by day, with one value per hour
+            # and geographical zone.
+            start = parse_datetime(query["datetime"])
+            values = indicator_values(
+                start.isoformat(),
+                (start + timedelta(days=1, seconds=-1)).isoformat(),
+                TimeTrunc.HOUR.value,
+                list(GEOS),
+            )
+        else:
+            geo_ids = query.get("geo_ids")
+            values = indicator_values(
+                query.get("start_date", "2021-01-01"),
+                query.get("end_date", "2021-01-01T23:59:59"),
+                query.get("time_trunc"),
+                [int(geo_id) for geo_id in geo_ids.split(",")]
+                if geo_ids
+                else DEFAULT_GEO_IDS,
+            )
+        return json.dumps(indicator_payload(indicator_id, values)).encode()
+
+    def _send(
+        self,
+        body: bytes,
+        content_type: str = "application/json",
+        status: int = 200,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class EsiosStubServer(StubServer):
+    """
+    A local HTTP/1.1 server mimicking the endpoints of the ESIOS API used by the
+    benchmarks:
+
+    - `/indicators` and `/offer_indicators`, answering a synthetic catalog;
+    - `/indicators/{id}` and `/offer_indicators/{id}`, answering values for the
+      requested `start_date`, `end_date`, `time_trunc` and `geo_ids`;
+    - `/archives`, answering a synthetic archive listing;
+    - `/archives/{id}/download`, answering a ZIP file of nested daily ZIPs.
+
+    Catalogs and the ZIP file are built once, so serving them costs no more than
+    writing their bytes.
+    """
+
+    handler_class = _EsiosStubHandler
+
+    def __init__(
+        self,
+        n_indicators: int = 2000,
+        n_archives: int = 100,
+        archive_shape: Tuple[int, int] = (30, 2000),
+    ):
+        super().__init__()
+        self._server.stub = self  # type: ignore
+        self.indicator_catalog = json.dumps(indicator_catalog(n_indicators)).encode()
+        self.archive_catalog = json.dumps(archive_catalog(n_archives)).encode()
+        self.archive_zip = archive_zip(*archive_shape)
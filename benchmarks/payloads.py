@@ -0,0 +1,151 @@
+"""
+Synthetic payloads shaped like the responses of the ESIOS API, shared by the
+benchmarks. They are deterministic, so timings can be compared between runs.
+"""
+
+import io
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.date_utils import parse_datetime, shift_datetime
+
+GEOS = {
+    3: "España",
+    8741: "Península",
+    8742: "Canarias",
+    8743: "Baleares",
+    8744: "Ceuta",
+    8745: "Melilla",
+}
+DEFAULT_GEO_IDS = (8741,)
+LOCAL_OFFSET = timezone(timedelta(hours=1))
+
+_DESCRIPTION = (
+    "<p>Precio del mercado diario para la zona española, publicado por el "
+    "operador del mercado tras la casación de las ofertas.</p>"
+) * 6
+
+
+def indicator_catalog(n_indicators: int) -> Dict[str, Any]:
+    """
+    Builds a response of `/indicators` or `/offer_indicators`.
+    """
+    return {
+        "indicators": [
+            {
+                "id": i,
+                "name": f"Indicador {i} de generación programada",
+                "short_name": f"Indicador {i}",
+                "description": _DESCRIPTION,
+                "raw_description": _DESCRIPTION,
+            }
+            for i in range(n_indicators)
+        ]
+    }
+
+
+def indicator_values(
+    start: str,
+    end: str,
+    time_trunc: Optional[str] = None,
+    geo_ids: Sequence[int] = DEFAULT_GEO_IDS,
+) -> List[Dict[str, Any]]:
+    """
+    Builds the values of an indicator between two datetimes, both included.
+
+    Naive datetimes are taken in the local time of the API (UTC+1).
+    """
+    trunc = TimeTrunc(time_trunc) if time_trunc else TimeTrunc.FIVE_MINUTES
+    dt = _local(parse_datetime(start))
+    end_dt = _local(parse_datetime(end))
+
+    values = []
+    i = 0
+    while dt <= end_dt:
+        utc = dt.astimezone(timezone.utc)
+        local = dt.isoformat(timespec="milliseconds")
+        for geo_id in geo_ids:
+            values.append(
+                {
+                    "value": round(50 + 30 * math.sin(i / 12) + geo_id % 7, 2),
+                    "datetime": local,
+                    "datetime_utc": utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "tz_time": utc.isoformat(timespec="milliseconds"),
+                    "geo_id": geo_id,
+                    "geo_name": GEOS.get(geo_id, str(geo_id)),
+                }
+            )
+        dt = shift_datetime(dt, trunc)
+        i += 1
+    return values
+
+
+def indicator_payload(indicator_id: int, values: List[Dict[str, Any]]) -> Any:
+    """
+    Builds a response of `/indicators/{id}` or `/offer_indicators/{id}`.
+    """
+    return {
+        "indicator": {
+            "id": indicator_id,
+            "name": f"Indicador {indicator_id} de generación programada",
+            "short_name": f"Indicador {indicator_id}",
+            "values_updated_at": "2021-01-02T00:00:00.000+01:00",
+            "values": values,
+        }
+    }
+
+
+def archive_catalog(n_archives: int) -> Dict[str, Any]:
+    """
+    Builds a response of `/archives`, whose archives are downloaded from
+    `/archives/{id}/download`.
+    """
+    return {
+        "archives": [
+            {
+                "id": i,
+                "name": f"I90DIA_{i:04}",
+                "horizon": "D",
+                "archive_type": "zip",
+                "download": {
+                    "name": f"I90DIA_{i:04}",
+                    "url": f"/archives/{i}/download",
+                },
+                "date": {"date": "2021-01-01T00:00:00.000+01:00"},
+                "date_times": ["2021-01-01"],
+                "publication_date": ["2021-01-02"],
+                "taxonomy_terms": [
+                    {"id_taxonomy_term": 1, "name": "Mercados", "vocabulary_id": 2}
+                ],
+                "vocabularies": [{"id_vocabulary": 2, "name": "Tipo"}],
+            }
+            for i in range(n_archives)
+        ]
+    }
+
+
+def archive_zip(n_days: int, rows_per_day: int) -> bytes:
+    """
+    Builds an archive holding one nested ZIP file of CSV rows per day, as the
+    monthly archives of the API do.
+    """
+    rows = "".join(
+        f"2021-01-01T{i % 24:02}:00;{i % 1000}.5;{i}\n" for i in range(rows_per_day)
+    )
+    day = _zip_bytes({"data.csv": rows})
+    return _zip_bytes({f"{d:02}.zip": day for d in range(1, n_days + 1)})
+
+
+def _zip_bytes(files: Dict[str, Any]) -> bytes:
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w", compression=ZIP_DEFLATED) as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+    return buffer.getvalue()
+
+
+def _local(dt: datetime) -> datetime:
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=LOCAL_OFFSET)
@@ -0,0 +1,43 @@
+import tracemalloc
+from typing import Any, Callable, Iterator, TypeVar
+
+import pytest
+
+from benchmarks.esios_stub import EsiosStubServer
+from esiosapy.client import ESIOSAPYClient
+
+T = TypeVar("T")
+
+
+@pytest.fixture(scope="session")
+def esios_stub() -> Iterator[EsiosStubServer]:
+    with EsiosStubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(esios_stub: EsiosStubServer) -> Iterator[ESIOSAPYClient]:
+    with ESIOSAPYClient(
+        token="bench-token", base_url=esios_stub.url, retry_policy=None
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def measure_memory(benchmark: Any) -> Callable[[Callable[[], T]], T]:
+    """
+    Runs a function once more under `tracemalloc`, and records its peak memory
+    usage in the extra info of the benchmark.
+    """
+
+    def measure(fn: Callable[[], T]) -> T:
+        tracemalloc.start()
+        try:
+            result = fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory_kb"] = round(peak / 1024)
+        return result
+
+    return measure
@@ -0,0 +1,42 @@
+import shutil
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from benchmarks.esios_stub import EsiosStubServer
+from esiosapy.client import ESIOSAPYClient
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_list_all(client: ESIOSAPYClient, benchmark: Any) -> None:
+    archives = benchmark(client.archives.list_all)
+
+    assert len(archives) == 100
+
+
+def test_download_and_unzip(
+    client: ESIOSAPYClient,
+    esios_stub: EsiosStubServer,
+    benchmark: Any,
+    measure_memory: Callable[[Callable[[], Any]], Any],
+    tmp_path: Path,
+) -> None:
+    archive = client.archives.list_all()[0]
+
+    def setup() -> None:
+        shutil.rmtree(tmp_path / "out", ignore_errors=True)
+        (tmp_path / "out").mkdir()
+
+    def download() -> Any:
+        return archive.download_file(tmp_path / "out", unzip=True)
+
+    benchmark.pedantic(download, setup=setup, rounds=5)
+    setup()
+    measure_memory(download)
+
+    assert len(list((tmp_path / "out").rglob("data.csv"))) == 30
+    benchmark.extra_info["megabytes_per_second"] = (
+        len(esios_stub.archive_zip) / 1024**2 / benchmark.stats["mean"]
+    )
@@ -0,0 +1,102 @@
+from typing import Any, Callable
+
+import pytest
+
+from esiosapy.client import ESIOSAPYClient
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+
+pytest.importorskip("pytest_benchmark")
+
+MeasureMemory = Callable[[Callable[[], Any]], Any]
+
+
+@pytest.mark.parametrize("trusted_models", [False, True], ids=["validated", "trusted"])
+def test_list_all(
+    esios_stub: Any, benchmark: Any, measure_memory: MeasureMemory, trusted_models: bool
+) -> None:
+    with ESIOSAPYClient(
+        token="bench-token",
+        base_url=esios_stub.url,
+        retry_policy=None,
+        trusted_models=trusted_models,
+    ) as client:
+        indicators = benchmark(client.indicators.list_all)
+        measure_memory(client.indicators.list_all)
+
+    assert len(indicators) == 2000
+
+
+def test_get_data_day(client: ESIOSAPYClient, benchmark: Any) -> None:
+    values = benchmark(
+        client.indicators.get_data,
+        600,
+        "2021-01-01",
+        "2021-01-01T23:59:59",
+        time_trunc=TimeTrunc.FIVE_MINUTES,
+    )
+
+    assert len(values) == 288
+
+
+def test_get_data_year_chunked(
+    client: ESIOSAPYClient, benchmark: Any, measure_memory: MeasureMemory
+) -> None:
+    indicator = client.indicators.list_all()[600]
+
+    def get_data() -> Any:
+        return indicator.get_data(
+            "2021-01-01",
+            "2021-12-31T23:59:59",
+            time_trunc=TimeTrunc.HOUR,
+            chunk_size=TimeTrunc.MONTH,
+            max_workers=8,
+        )
+
+    values = benchmark(get_data)
+    measure_memory(get_data)
+
+    assert len(values) == 8760
+
+
+def test_iter_values_year(
+    client: ESIOSAPYClient, benchmark: Any, measure_memory: MeasureMemory
+) -> None:
+    indicator = client.indicators.list_all()[600]
+
+    def consume() -> int:
+        return sum(
+            1
+            for _ in indicator.iter_values(
+                "2021-01-01",
+                "2021-12-31T23:59:59",
+                time_trunc=TimeTrunc.HOUR,
+                chunk_size=TimeTrunc.MONTH,
+            )
+        )
+
+    assert benchmark(consume) == 8760
+    measure_memory(consume)
+
+
+def test_get_data_many(client: ESIOSAPYClient, benchmark: Any) -> None:
+    results = benchmark(
+        client.indicators.get_data_many,
+        range(50),
+        "2021-01-01",
+        "2021-01-07T23:59:59",
+        time_trunc=TimeTrunc.HOUR,
+        max_workers=8,
+    )
+
+    assert all(result.ok for result in results.values())
+    benchmark.extra_info["indicators_per_second"] = (
+        len(results) / benchmark.stats["mean"]
+    )
+
+
+def test_offer_indicator_get_data(client: ESIOSAPYClient, benchmark: Any) -> None:
+    offer_indicator = client.offer_indicators.list_all()[10]
+
+    values = benchmark(offer_indicator.get_data_by_date, "2021-01-01")
+
+    assert len(values) == 24 * 6
@@ -0,0 +1,156 @@
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Union
+from urllib.parse import urljoin, urlparse
+
+from esiosapy.client import ESIOS_API_URL
+from esiosapy.managers.async_archive_manager import AsyncArchiveManager
+from esiosapy.managers.async_indicator_manager import AsyncIndicatorManager
+from esiosapy.managers.async_offer_indicator_manager import (
+    AsyncOfferIndicatorManager,
+)
+from esiosapy.utils.async_request_helper import AsyncRequestHelper
+from esiosapy.utils.instrumentation import RequestHook
+from esiosapy.utils.json_backend import JsonBackend
+from esiosapy.utils.rate_limiter import RateLimiter
+from esiosapy.utils.request_helper import (
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    Timeout,
+)
+from esiosapy.utils.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncESIOSAPYClient:
+    """
+    An asyncio client for interacting with the ESIOS API.
+
+    This client is the awaitable counterpart of ESIOSAPYClient. All its managers
+    share one async connection pool and an optional concurrency limit, so many
+    requests can be awaited concurrently. It can be used as an async context
+    manager to release its connections when done.
+
+    It requires the optional `httpx` package.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = ESIOS_API_URL,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        max_concurrency: Optional[int] = None,
+        json_backend: Optional[Union[str, JsonBackend]] = None,
+        trusted_models: bool = False,
+        keep_raw: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        hooks: Optional[Sequence[RequestHook]] = None,
+    ):
+        """
+        Initializes the AsyncESIOSAPYClient with an API token and a base URL.
+
+        :param token: The API token used for authentication.
+        :type token: str
+        :param base_url: The base URL for the ESIOS API. Defaults to ESIOS_API_URL.
+        :type base_url: str, optional
+        :param pool_maxsize: The maximum number of connections kept open to the
+                             API. Defaults to DEFAULT_POOL_MAXSIZE.
+        :type pool_maxsize: int, optional
+        :param keep_alive: Whether to keep connections alive between requests.
+                           Defaults to True.
+        :type keep_alive: bool, optional
+        :param max_concurrency: The maximum number of requests in flight at the
+                                same time. Defaults to None (no limit besides
+                                the pool size).
+        :type max_concurrency: Optional[int], optional
+        :param json_backend: The JSON backend used to decode responses, by name
+                             or as an instance. If not provided, the fastest
+                             installed backend is used. Defaults to None.
+        :type json_backend: Optional[Union[str, JsonBackend]], optional
+        :param trusted_models: Whether the managers build the API objects without
+                               pydantic validation, which is much faster for
+                               large listings. Defaults to False.
+        :type trusted_models: bool, optional
+        :param keep_raw: Whether the API objects keep their source data in their
+                         `raw` attribute. Defaults to True.
+        :type keep_raw: bool, optional
+        :param rate_limiter: An optional rate limiter shared by every request of
+                             the client, and possibly by other clients. Defaults
+                             to None.
+        :type rate_limiter: Optional[RateLimiter], optional
+        :param retry_policy: How requests failing with transient errors are
+                             retried, or None to never retry them. Defaults to
+                             DEFAULT_RETRY_POLICY.
+        :type retry_policy: Optional[RetryPolicy], optional
+        :param timeout: The timeout of every request, in seconds, either for both
+                        phases or as `(connect, read)`, or None to wait forever.
+                        Defaults to DEFAULT_TIMEOUT.
+        :type timeout: Timeout, optional
+        :param hooks: Hooks called around every request, e.g. a MetricsCollector
+                      to profile the requests of the client. Defaults to None.
+        :type hooks: Optional[Sequence[RequestHook]], optional
+        """
+        self.token = token
+        self.base_url = base_url
+        self.request_helper = AsyncRequestHelper(
+            base_url,
+            token,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            max_concurrency=max_concurrency,
+            json_backend=json_backend,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            hooks=hooks,
+        )
+
+        model_options = {"trusted_models": trusted_models, "keep_raw": keep_raw}
+        self.archives: AsyncArchiveManager = AsyncArchiveManager(
+            self.request_helper, **model_options
+        )
+        self.indicators: AsyncIndicatorManager = AsyncIndicatorManager(
+            self.request_helper, **model_options
+        )
+        self.offer_indicators: AsyncOfferIndicatorManager = AsyncOfferIndicatorManager(
+            self.request_helper, **model_options
+        )
+
+    async def raw_request(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> "httpx.Response":
+        """
+        Makes a raw awaitable GET request to a specified URL with optional headers.
+
+        :param url: The URL to which the GET request is made. If the URL is
+                    relative, it will be joined with the base URL.
+        :type url: str
+        :param headers: Optional headers to include in the request. If not provided,
+                        default headers will be added. Defaults to None.
+        :type headers: Optional[Dict[str, str]], optional
+        :return: The response object resulting from the GET request.
+        :rtype: httpx.Response
+        """
+        if headers is None:
+            headers = {}
+        headers = self.request_helper.add_default_headers(headers)
+
+        if urlparse(url).netloc == "":
+            url = urljoin(self.base_url, url)
+
+        return await self.request_helper.async_client.get(url, headers=headers)
+
+    async def aclose(self) -> None:
+        """
+        Closes the connection pools shared by all the managers.
+        """
+        await self.request_helper.aclose()
+
+    async def __aenter__(self) -> "AsyncESIOSAPYClient":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
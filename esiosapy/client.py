@@ -1,4 +1,5 @@
-from typing import Dict, Optional
+from types import TracebackType
+from typing import Dict, Optional, Sequence, Type, Union
 from urllib.parse import urljoin, urlparse
 
 import requests
@@ -6,7 +7,19 @@ import requests
 from esiosapy.managers.archive_manager import ArchiveManager
 from esiosapy.managers.indicator_manager import IndicatorManager
 from esiosapy.managers.offer_indicator_manager import OfferIndicatorManager
-from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.instrumentation import RequestHook
+from esiosapy.utils.json_backend import JsonBackend
+from esiosapy.utils.rate_limiter import AdaptiveConcurrency, RateLimiter
+from esiosapy.utils.request_helper import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    RequestHelper,
+    Timeout,
+)
+from esiosapy.utils.response_cache import ResponseCache
+from esiosapy.utils.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+from esiosapy.utils.ttl_cache import TTLCache
 
 ESIOS_API_URL = "https://api.esios.ree.es/"
 
@@ -19,9 +32,31 @@ class ESIOSAPYClient:
     types of requests to the ESIOS API, such as archives, indicators, and
     offer indicators. It simplifies the process of making requests by
     managing authentication and constructing the necessary URLs.
+
+    All managers share a single pooled HTTP session. The client can be used as
+    a context manager to release its connections when done.
     """
 
-    def __init__(self, token: str, base_url: str = ESIOS_API_URL):
+    def __init__(
+        self,
+        token: str,
+        base_url: str = ESIOS_API_URL,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        cache: Optional[ResponseCache] = None,
+        catalog_cache: Optional[TTLCache] = None,
+        json_backend: Optional[Union[str, JsonBackend]] = None,
+        trusted_models: bool = False,
+        keep_raw: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        coalesce_requests: bool = False,
+    ):
         """
         Initializes the ESIOSAPYClient with an API token and a base URL.
 
@@ -29,15 +64,90 @@ class ESIOSAPYClient:
         :type token: str
         :param base_url: The base URL for the ESIOS API. Defaults to ESIOS_API_URL.
         :type base_url: str, optional
+        :param pool_connections: The number of per-host connection pools to keep
+                                 cached. Defaults to DEFAULT_POOL_CONNECTIONS.
+        :type pool_connections: int, optional
+        :param pool_maxsize: The maximum number of connections kept open to a
+                             single host. Defaults to DEFAULT_POOL_MAXSIZE.
+        :type pool_maxsize: int, optional
+        :param pool_block: Whether to block when a host pool has no free
+                           connection. Defaults to False.
+        :type pool_block: bool, optional
+        :param keep_alive: Whether to keep connections alive between requests.
+                           Defaults to True.
+        :type keep_alive: bool, optional
+        :param cache: An optional persistent cache for API responses.
+                      Defaults to None.
+        :type cache: Optional[ResponseCache], optional
+        :param catalog_cache: An optional in-memory cache for the indicator and
+                              offer indicator catalogs, which can be shared between
+                              clients. Defaults to None.
+        :type catalog_cache: Optional[TTLCache], optional
+        :param json_backend: The JSON backend used to decode responses, by name
+                             (e.g. `"orjson"`) or as an instance. If not provided,
+                             the fastest installed backend is used. Defaults to
+                             None.
+        :type json_backend: Optional[Union[str, JsonBackend]], optional
+        :param trusted_models: Whether the managers build the API objects without
+                               pydantic validation, which is much faster for
+                               large listings. Defaults to False.
+        :type trusted_models: bool, optional
+        :param keep_raw: Whether the API objects keep their source data in their
+                         `raw` attribute. Defaults to True.
+        :type keep_raw: bool, optional
+        :param rate_limiter: An optional rate limiter shared by every request of
+                             the client, and possibly by other clients. Defaults
+                             to None.
+        :type rate_limiter: Optional[RateLimiter], optional
+        :param concurrency: An optional controller adapting the number of
+                            requests in flight to the server load, backing off on
+                            429 and server errors. Defaults to None.
+        :type concurrency: Optional[AdaptiveConcurrency], optional
+        :param retry_policy: How requests failing with transient errors are
+                             retried, or None to never retry them. Defaults to
+                             DEFAULT_RETRY_POLICY.
+        :type retry_policy: Optional[RetryPolicy], optional
+        :param timeout: The timeout of every request, in seconds, either for both
+                        phases or as `(connect, read)`, or None to wait forever.
+                        Defaults to DEFAULT_TIMEOUT.
+        :type timeout: Timeout, optional
+        :param hooks: Hooks called around every request, e.g. a MetricsCollector
+                      to profile the requests of the client. Defaults to None.
+        :type hooks: Optional[Sequence[RequestHook]], optional
+        :param coalesce_requests: Whether concurrent identical requests, e.g. from
+                                  several threads asking for the same indicator
+                                  data, share one request and its decoded
+                                  result. Defaults to False.
+        :type coalesce_requests: bool, optional
         """
         self.token = token
         self.base_url = base_url
-        self.request_helper = RequestHelper(base_url, token)
+        self.request_helper = RequestHelper(
+            base_url,
+            token,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            cache=cache,
+            json_backend=json_backend,
+            rate_limiter=rate_limiter,
+            concurrency=concurrency,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            hooks=hooks,
+            coalesce_requests=coalesce_requests,
+        )
 
-        self.archives: ArchiveManager = ArchiveManager(self.request_helper)
-        self.indicators: IndicatorManager = IndicatorManager(self.request_helper)
+        model_options = {"trusted_models": trusted_models, "keep_raw": keep_raw}
+        self.archives: ArchiveManager = ArchiveManager(
+            self.request_helper, **model_options
+        )
+        self.indicators: IndicatorManager = IndicatorManager(
+            self.request_helper, catalog_cache=catalog_cache, **model_options
+        )
         self.offer_indicators: OfferIndicatorManager = OfferIndicatorManager(
-            self.request_helper
+            self.request_helper, catalog_cache=catalog_cache, **model_options
         )
 
     def raw_request(
@@ -66,4 +176,23 @@ class ESIOSAPYClient:
         if urlparse(url).netloc == "":
             url = urljoin(self.base_url, url)
 
-        return requests.get(url, headers=headers)
+        return self.request_helper.session.get(
+            url, headers=headers, timeout=self.request_helper.timeout
+        )
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP session shared by all the managers.
+        """
+        self.request_helper.close()
+
+    def __enter__(self) -> "ESIOSAPYClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
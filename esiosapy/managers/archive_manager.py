@@ -1,10 +1,23 @@
-from datetime import datetime
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from esiosapy.models.archive.archive import Archive
 from esiosapy.models.archive.archive_date_type import ArchiveDateType
+from esiosapy.models.archive.archive_sync_result import ArchiveSyncResult
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.archive_index import ArchiveIndex
+from esiosapy.utils.archive_manifest import DEFAULT_MANIFEST_NAME, ArchiveManifest
+from esiosapy.utils.date_utils import (
+    format_datetime,
+    parse_datetime,
+    split_date_range,
+)
 from esiosapy.utils.request_helper import RequestHelper
 
+DEFAULT_SYNC_WORKERS = 4
+
 
 class ArchiveManager:
     """
@@ -14,14 +27,28 @@ class ArchiveManager:
     API, such as listing all archives or filtering them by date or date range.
     """
 
-    def __init__(self, request_helper: RequestHelper) -> None:
+    def __init__(
+        self,
+        request_helper: RequestHelper,
+        trusted_models: bool = False,
+        keep_raw: bool = True,
+    ) -> None:
         """
         Initializes the ArchiveManager with a RequestHelper.
 
         :param request_helper: An instance of RequestHelper used to make API requests.
         :type request_helper: RequestHelper
+        :param trusted_models: Whether to build the archive objects without
+                               pydantic validation, which is much faster for
+                               large listings. Defaults to False.
+        :type trusted_models: bool, optional
+        :param keep_raw: Whether to keep the API data of each archive in its `raw`
+                         attribute. Defaults to True.
+        :type keep_raw: bool, optional
         """
         self.request_helper = request_helper
+        self.trusted_models = trusted_models
+        self.keep_raw = keep_raw
 
     def _init_archive(self, archive: Dict[str, Union[str, int]]) -> Archive:
         """
@@ -32,7 +59,15 @@ class ArchiveManager:
         :return: An Archive object initialized with the provided data.
         :rtype: Archive
         """
-        return Archive(**archive, raw=archive, _request_helper=self.request_helper)
+        if self.trusted_models:
+            return Archive.from_trusted(
+                archive, self.request_helper, keep_raw=self.keep_raw
+            )
+        return Archive(
+            **archive,
+            raw=archive if self.keep_raw else {},
+            _request_helper=self.request_helper,
+        )
 
     def list_all(self) -> List[Archive]:
         """
@@ -44,8 +79,8 @@ class ArchiveManager:
         :return: A list of Archive objects representing all archives.
         :rtype: List[Archive]
         """
-        response = self.request_helper.get_request("/archives")
-        return [self._init_archive(archive) for archive in response.json()["archives"]]
+        archives = self.request_helper.get_json("/archives", key_path=("archives",))
+        return [self._init_archive(archive) for archive in archives]
 
     def list_by_date(
         self,
@@ -80,8 +115,10 @@ class ArchiveManager:
         if taxonomy_terms:
             params["taxonomy_terms[]"] = taxonomy_terms
 
-        response = self.request_helper.get_request("/archives", params=params)
-        return [self._init_archive(archive) for archive in response.json()["archives"]]
+        archives = self.request_helper.get_json(
+            "/archives", params=params, key_path=("archives",)
+        )
+        return [self._init_archive(archive) for archive in archives]
 
     def list_by_date_range(
         self,
@@ -126,5 +163,216 @@ class ArchiveManager:
         if taxonomy_terms:
             params["taxonomy_terms[]"] = taxonomy_terms
 
-        response = self.request_helper.get_request("/archives", params=params)
-        return [self._init_archive(archive) for archive in response.json()["archives"]]
+        archives = self.request_helper.get_json(
+            "/archives", params=params, key_path=("archives",)
+        )
+        return [self._init_archive(archive) for archive in archives]
+
+    def query(
+        self,
+        target_dt_start: Optional[Union[datetime, str]] = None,
+        target_dt_end: Optional[Union[datetime, str]] = None,
+        date_type: Optional[ArchiveDateType] = None,
+        taxonomy_terms: Optional[List[str]] = None,
+        archive_type: Optional[str] = None,
+        horizon: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        predicate: Optional[Callable[[Archive], bool]] = None,
+        window: Optional[Union[timedelta, TimeTrunc]] = None,
+    ) -> Iterator[Archive]:
+        """
+        Lazily yields the archives matching every given filter.
+
+        The filters supported by the `/archives` endpoint (the date or date
+        range, `date_type` and `taxonomy_terms`) are sent with the request. The
+        other ones are applied to every archive as it is decoded, before its
+        model is even built, so that no list of all the archives is ever made.
+        With `ijson` installed, responses are also decoded incrementally.
+
+        With `window`, a date range is requested one window at a time, as the
+        archives are consumed, like pages. Archives listed by several windows
+        are only yielded once.
+
+        :param target_dt_start: The date of the archives, or the start of their
+                                date range if `target_dt_end` is given. Defaults
+                                to None (every archive).
+        :type target_dt_start: Optional[Union[datetime, str]], optional
+        :param target_dt_end: The end of the date range, defaults to None.
+        :type target_dt_end: Optional[Union[datetime, str]], optional
+        :param date_type: The type of date to filter by (e.g., publication date),
+                          defaults to None.
+        :type date_type: Optional[ArchiveDateType], optional
+        :param taxonomy_terms: A list of taxonomy terms to further filter the archives,
+                               defaults to None.
+        :type taxonomy_terms: Optional[List[str]], optional
+        :param archive_type: The type of the archives, defaults to None.
+        :type archive_type: Optional[str], optional
+        :param horizon: The horizon of the archives, defaults to None.
+        :type horizon: Optional[str], optional
+        :param name_prefix: The beginning of the name of the archives, e.g.
+                            `I90DIA`, defaults to None.
+        :type name_prefix: Optional[str], optional
+        :param predicate: A function selecting the archives to yield, called on
+                          the archives passing every other filter. Defaults to
+                          None.
+        :type predicate: Optional[Callable[[Archive], bool]], optional
+        :param window: The size of the windows a date range is requested in,
+                       either as a fixed duration or as a TimeTrunc level (e.g.
+                       `TimeTrunc.MONTH`). Defaults to None (a single request).
+        :type window: Optional[Union[timedelta, TimeTrunc]], optional
+        :raises ValueError: If `target_dt_end` is given without
+                            `target_dt_start`.
+        :return: An iterator over the matching archives, in the order they are
+                 listed.
+        :rtype: Iterator[Archive]
+        """
+        if target_dt_end is not None and target_dt_start is None:
+            raise ValueError("A date range needs a start date.")
+
+        pages: List[Dict[str, Union[str, int, List[str]]]] = []
+        if target_dt_start is None:
+            pages.append({})
+        elif target_dt_end is None:
+            pages.append({"date": format_datetime(target_dt_start)})
+        elif window is None:
+            pages.append(
+                {
+                    "start_date": format_datetime(target_dt_start),
+                    "end_date": format_datetime(target_dt_end),
+                }
+            )
+        else:
+            pages.extend(
+                {
+                    "start_date": format_datetime(window_start),
+                    "end_date": format_datetime(window_end),
+                }
+                for window_start, window_end in split_date_range(
+                    parse_datetime(target_dt_start),
+                    parse_datetime(target_dt_end),
+                    window,
+                )
+            )
+
+        def matches(archive: Dict[str, Any]) -> bool:
+            return (
+                (archive_type is None or archive.get("archive_type") == archive_type)
+                and (horizon is None or archive.get("horizon") == horizon)
+                and (
+                    name_prefix is None
+                    or str(archive.get("name", "")).startswith(name_prefix)
+                )
+            )
+
+        seen: Set[Tuple[Any, Any]] = set()
+        for params in pages:
+            if date_type:
+                params["date_type"] = date_type.value
+            if taxonomy_terms:
+                params["taxonomy_terms[]"] = taxonomy_terms
+
+            for data in self.request_helper.iter_json(
+                "/archives", params=params, key_path=("archives",)
+            ):
+                if len(pages) > 1:
+                    key = (data.get("id"), data.get("name"))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                if not matches(data):
+                    continue
+                archive = self._init_archive(data)
+                if predicate is None or predicate(archive):
+                    yield archive
+
+    def sync(
+        self,
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        dest: Union[str, Path],
+        date_type: Optional[ArchiveDateType] = None,
+        taxonomy_terms: Optional[List[str]] = None,
+        workers: int = DEFAULT_SYNC_WORKERS,
+        unzip: bool = True,
+        remove_zip: bool = True,
+        index: Optional[ArchiveIndex] = None,
+    ) -> List[ArchiveSyncResult]:
+        """
+        Downloads every archive of a date range to a directory, concurrently.
+
+        The archives are listed with `list_by_date_range`, deduplicated on their
+        ID and name, and downloaded (and optionally unzipped) on a thread pool.
+        Every downloaded archive is recorded in a manifest file inside `dest`, so
+        later runs skip the archives already synchronized and only fetch new
+        ones. A failure only affects the result of its own archive, which holds
+        the raised error, so the rest of the batch is still synchronized.
+
+        If an `index` is given, archives recorded in it are skipped too, and every
+        synchronized archive, including the ones skipped by the manifest, is
+        recorded in it with its files.
+
+        :param target_dt_start: The start date for filtering archives. Can be a datetime
+                                object or an ISO 8601 formatted string.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date for filtering archives. Can be a datetime
+                              object or an ISO 8601 formatted string.
+        :type target_dt_end: Union[datetime, str]
+        :param dest: The directory where the archives are saved. It is created if
+                     it does not exist.
+        :type dest: Union[str, Path]
+        :param date_type: The type of date to filter by (e.g., publication date),
+                          defaults to None.
+        :type date_type: Optional[ArchiveDateType], optional
+        :param taxonomy_terms: A list of taxonomy terms to further filter the archives,
+                               defaults to None.
+        :type taxonomy_terms: Optional[List[str]], optional
+        :param workers: The maximum number of archives downloaded concurrently,
+                        defaults to DEFAULT_SYNC_WORKERS.
+        :type workers: int, optional
+        :param unzip: Whether to unzip the downloaded files, defaults to True.
+        :type unzip: bool, optional
+        :param remove_zip: Whether to remove the zip files after unzipping,
+                           defaults to True.
+        :type remove_zip: bool, optional
+        :param index: A local index of the downloaded archives, defaults to None.
+        :type index: Optional[ArchiveIndex], optional
+        :return: The result of every archive, in the order they were listed.
+        :rtype: List[ArchiveSyncResult]
+        """
+        dest = Path(dest)
+        dest.mkdir(parents=True, exist_ok=True)
+        manifest = ArchiveManifest(dest / DEFAULT_MANIFEST_NAME)
+
+        archives = {
+            ArchiveManifest.make_key(archive.id, archive.name): archive
+            for archive in self.list_by_date_range(
+                target_dt_start,
+                target_dt_end,
+                date_type=date_type,
+                taxonomy_terms=taxonomy_terms,
+            )
+        }
+
+        def sync_one(key: str) -> ArchiveSyncResult:
+            archive = archives[key]
+            indexed = None if index is None else index.get(archive.id, archive.name)
+            path = manifest.get(key) if indexed is None else indexed.path
+            if path is not None:
+                if index is not None and indexed is None:
+                    index.add(archive, path)
+                return ArchiveSyncResult(archive, path=path, skipped=True)
+
+            try:
+                path = archive.download_file(
+                    dest, unzip=unzip, remove_zip=remove_zip, overwrite=False
+                )
+            except Exception as e:
+                return ArchiveSyncResult(archive, error=e)
+
+            manifest.add(key, path)
+            if index is not None:
+                index.add(archive, path)
+            return ArchiveSyncResult(archive, path=path)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return list(executor.map(sync_one, archives))
@@ -0,0 +1,302 @@
+import asyncio
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from esiosapy.models.archive.archive import (
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    Archive,
+    ProgressCallback,
+)
+from esiosapy.models.archive.archive_date_type import ArchiveDateType
+from esiosapy.utils.async_request_helper import AsyncRequestHelper
+from esiosapy.utils.download_utils import (
+    expected_size,
+    extract_archive,
+    finish_download,
+    has_zip_directory,
+    part_path_for,
+    range_headers,
+)
+
+
+class AsyncArchiveManager:
+    """
+    Manages archive-related operations for the ESIOS API using asyncio.
+
+    This class is the awaitable counterpart of ArchiveManager. On top of listing
+    archives, it can download archive files without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        request_helper: AsyncRequestHelper,
+        trusted_models: bool = False,
+        keep_raw: bool = True,
+    ) -> None:
+        """
+        Initializes the AsyncArchiveManager with an AsyncRequestHelper.
+
+        :param request_helper: An instance of AsyncRequestHelper used to make
+                               API requests.
+        :type request_helper: AsyncRequestHelper
+        :param trusted_models: Whether to build the archive objects without
+                               pydantic validation, which is much faster for
+                               large listings. Defaults to False.
+        :type trusted_models: bool, optional
+        :param keep_raw: Whether to keep the API data of each archive in its `raw`
+                         attribute. Defaults to True.
+        :type keep_raw: bool, optional
+        """
+        self.request_helper = request_helper
+        self.trusted_models = trusted_models
+        self.keep_raw = keep_raw
+
+    def _init_archive(self, archive: Dict[str, Union[str, int]]) -> Archive:
+        """
+        Initializes an Archive object from a dictionary of archive data.
+
+        :param archive: A dictionary containing archive data.
+        :type archive: Dict[str, Union[str, int]]
+        :return: An Archive object initialized with the provided data.
+        :rtype: Archive
+        """
+        if self.trusted_models:
+            return Archive.from_trusted(
+                archive, self.request_helper, keep_raw=self.keep_raw
+            )
+        return Archive(
+            **archive,
+            raw=archive if self.keep_raw else {},
+            _request_helper=self.request_helper,
+        )
+
+    async def _list(
+        self, params: Optional[Dict[str, Union[str, int, List[str]]]] = None
+    ) -> List[Archive]:
+        """
+        Requests the `/archives` endpoint with the given query parameters.
+
+        :param params: The query parameters of the request, defaults to None.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]], optional
+        :return: A list of Archive objects returned by the API.
+        :rtype: List[Archive]
+        """
+        archives = await self.request_helper.aget_json(
+            "/archives", params=params, key_path=("archives",)
+        )
+        return [self._init_archive(archive) for archive in archives]
+
+    async def list_all(self) -> List[Archive]:
+        """
+        Retrieves a list of all archives.
+
+        :return: A list of Archive objects representing all archives.
+        :rtype: List[Archive]
+        """
+        return await self._list()
+
+    async def list_by_date(
+        self,
+        target_dt: Union[datetime, str],
+        date_type: Optional[ArchiveDateType] = None,
+        taxonomy_terms: Optional[List[str]] = None,
+    ) -> List[Archive]:
+        """
+        Retrieves a list of archives filtered by a specific date.
+
+        :param target_dt: The target date for filtering archives. Can be a datetime
+                          object or an ISO 8601 formatted string.
+        :type target_dt: Union[datetime, str]
+        :param date_type: The type of date to filter by (e.g., publication date),
+                          defaults to None.
+        :type date_type: Optional[ArchiveDateType], optional
+        :param taxonomy_terms: A list of taxonomy terms to further filter the archives,
+                               defaults to None.
+        :type taxonomy_terms: Optional[List[str]], optional
+        :return: A list of Archive objects filtered by the specified date.
+        :rtype: List[Archive]
+        """
+        if isinstance(target_dt, datetime):
+            target_dt = target_dt.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+
+        params: Dict[str, Union[str, int, List[str]]] = {"date": target_dt}
+        if date_type:
+            params["date_type"] = date_type.value
+        if taxonomy_terms:
+            params["taxonomy_terms[]"] = taxonomy_terms
+
+        return await self._list(params)
+
+    async def list_by_date_range(
+        self,
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        date_type: Optional[ArchiveDateType] = None,
+        taxonomy_terms: Optional[List[str]] = None,
+    ) -> List[Archive]:
+        """
+        Retrieves a list of archives filtered by a date range.
+
+        :param target_dt_start: The start date for filtering archives. Can be a datetime
+                                object or an ISO 8601 formatted string.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date for filtering archives. Can be a datetime
+                              object or an ISO 8601 formatted string.
+        :type target_dt_end: Union[datetime, str]
+        :param date_type: The type of date to filter by (e.g., publication date),
+                          defaults to None.
+        :type date_type: Optional[ArchiveDateType], optional
+        :param taxonomy_terms: A list of taxonomy terms to further filter the archives,
+                               defaults to None.
+        :type taxonomy_terms: Optional[List[str]], optional
+        :return: A list of Archive objects filtered by the specified date range.
+        :rtype: List[Archive]
+        """
+        if isinstance(target_dt_start, datetime):
+            target_dt_start = target_dt_start.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+        if isinstance(target_dt_end, datetime):
+            target_dt_end = target_dt_end.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+
+        params: Dict[str, Union[str, int, List[str]]] = {
+            "start_date": target_dt_start,
+            "end_date": target_dt_end,
+        }
+        if date_type:
+            params["date_type"] = date_type.value
+        if taxonomy_terms:
+            params["taxonomy_terms[]"] = taxonomy_terms
+
+        return await self._list(params)
+
+    async def download_file(
+        self,
+        archive: Archive,
+        path: Optional[Union[str, Path]] = None,
+        unzip: bool = True,
+        remove_zip: bool = True,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        overwrite: bool = True,
+    ) -> Path:
+        """
+        Downloads the file of an archive and optionally unzips it.
+
+        The file is streamed to a `.part` file that is verified and renamed once
+        the download completes, interrupted downloads are resumed and, unless
+        `overwrite` is True, files already present are skipped, like
+        `Archive.download_file` does. Disk writes and
+        unzipping happen in the default executor, so the event loop is not blocked.
+
+        :param archive: The archive whose file is downloaded.
+        :type archive: Archive
+        :param path: The directory where the file should be downloaded. If not provided,
+                     the current working directory is used.
+        :type path: Optional[Union[str, Path]], optional
+        :param unzip: Whether to unzip the downloaded file, defaults to True.
+        :type unzip: bool, optional
+        :param remove_zip: Whether to remove the original zip file after unzipping,
+                           defaults to True.
+        :type remove_zip: bool, optional
+        :param chunk_size: The size in bytes of the chunks written to disk,
+                           defaults to DEFAULT_DOWNLOAD_CHUNK_SIZE.
+        :type chunk_size: int, optional
+        :param progress_callback: A function called after every chunk with the
+                                  number of bytes downloaded so far and the total
+                                  size, if the server sent it. Defaults to None.
+        :type progress_callback: Optional[ProgressCallback], optional
+        :param overwrite: Whether to download the file again even if it is already
+                          present on disk, replacing it. If False, a file already
+                          downloaded (or extracted) is returned as is. Defaults
+                          to True.
+        :type overwrite: bool, optional
+        :raises IncompleteDownloadError: If the server closed the connection before
+                                         sending the whole file.
+        :raises BadZipFile: If the downloaded file is corrupted.
+        :return: The path of the extracted directory if `unzip` is True, or the
+                 path of the zip file otherwise.
+        :rtype: Path
+        """
+        if path is None:
+            path = Path.cwd()
+
+        zip_path = Path(os.path.join(path, f"{archive.name}.zip"))
+        extract_path = zip_path.parent / zip_path.stem
+        part_path = part_path_for(zip_path)
+
+        loop = asyncio.get_event_loop()
+        if not overwrite and unzip and extract_path.exists():
+            return extract_path
+
+        if overwrite or not await loop.run_in_executor(
+            None, has_zip_directory, zip_path
+        ):
+            await self._download(
+                archive, zip_path, part_path, chunk_size, progress_callback
+            )
+
+        if not unzip:
+            return zip_path
+
+        await loop.run_in_executor(
+            None, extract_archive, zip_path, extract_path, remove_zip
+        )
+        return extract_path
+
+    async def _download(
+        self,
+        archive: Archive,
+        zip_path: Path,
+        part_path: Path,
+        chunk_size: int,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        """
+        Downloads the file of an archive to `zip_path`, resuming `part_path` if
+        present.
+
+        :param archive: The archive whose file is downloaded.
+        :type archive: Archive
+        :param zip_path: The final path of the zip file.
+        :type zip_path: Path
+        :param part_path: The path of the partial file.
+        :type part_path: Path
+        :param chunk_size: The size in bytes of the chunks written to disk.
+        :type chunk_size: int
+        :param progress_callback: A function called after every chunk, if any.
+        :type progress_callback: Optional[ProgressCallback]
+        """
+        import httpx
+
+        offset, headers = range_headers(part_path)
+        try:
+            response = await self.request_helper.aget_request(
+                archive.download.url, headers=headers, stream=True
+            )
+        except httpx.HTTPStatusError as e:
+            if offset and e.response.status_code == 416:
+                # The partial file does not match the remote one anymore.
+                part_path.unlink()
+                return await self._download(
+                    archive, zip_path, part_path, chunk_size, progress_callback
+                )
+            raise
+
+        loop = asyncio.get_event_loop()
+        try:
+            append, total = expected_size(
+                response.status_code, response.headers, offset
+            )
+            downloaded = offset if append else 0
+
+            with open(part_path, "ab" if append else "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    await loop.run_in_executor(None, f.write, chunk)
+                    downloaded += len(chunk)
+                    if progress_callback is not None:
+                        progress_callback(downloaded, total)
+        finally:
+            await response.aclose()
+
+        await loop.run_in_executor(None, finish_download, part_path, zip_path, total)
@@ -0,0 +1,278 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from esiosapy.models.indicator.geo_agg import GeoAgg
+from esiosapy.models.indicator.geo_trunc import GeoTrunc
+from esiosapy.models.indicator.indicator import Indicator
+from esiosapy.models.indicator.indicator_data_result import IndicatorDataResult
+from esiosapy.models.indicator.output_format import OutputFormat
+from esiosapy.models.indicator.time_agg import TimeAgg
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.async_request_helper import AsyncRequestHelper
+from esiosapy.utils.columnar import check_output_format, convert_columns
+
+
+class AsyncIndicatorManager:
+    """
+    Manages indicator-related operations for the ESIOS API using asyncio.
+
+    This class is the awaitable counterpart of IndicatorManager. On top of listing
+    and searching indicators, it can retrieve indicator data by ID, so many
+    indicators can be fetched concurrently with `asyncio.gather`.
+    """
+
+    def __init__(
+        self,
+        request_helper: AsyncRequestHelper,
+        trusted_models: bool = False,
+        keep_raw: bool = True,
+    ) -> None:
+        """
+        Initializes the AsyncIndicatorManager with an AsyncRequestHelper.
+
+        :param request_helper: An instance of AsyncRequestHelper used to make
+                               API requests.
+        :type request_helper: AsyncRequestHelper
+        :param trusted_models: Whether to build the indicator objects without
+                               pydantic validation, which is much faster for
+                               large listings. Defaults to False.
+        :type trusted_models: bool, optional
+        :param keep_raw: Whether to keep the API data of each indicator in its `raw`
+                         attribute. Defaults to True.
+        :type keep_raw: bool, optional
+        """
+        self.request_helper = request_helper
+        self.trusted_models = trusted_models
+        self.keep_raw = keep_raw
+
+    def _init_indicator(self, indicator: Dict[str, Union[str, int]]) -> Indicator:
+        """
+        Initializes an Indicator object from a dictionary of indicator data.
+
+        :param indicator: A dictionary containing indicator data.
+        :type indicator: Dict[str, Union[str, int]]
+        :return: An Indicator object initialized with the provided data.
+        :rtype: Indicator
+        """
+        if self.trusted_models:
+            return Indicator.from_trusted(
+                indicator, self.request_helper, keep_raw=self.keep_raw
+            )
+        return Indicator(
+            **indicator,
+            raw=indicator if self.keep_raw else {},
+            _request_helper=self.request_helper,
+        )
+
+    async def list_all(
+        self, taxonomy_terms: Optional[List[str]] = None
+    ) -> List[Indicator]:
+        """
+        Retrieves a list of all indicators, optionally filtered by taxonomy terms.
+
+        :param taxonomy_terms: A list of taxonomy terms to filter the indicators,
+                               defaults to None.
+        :type taxonomy_terms: Optional[List[str]], optional
+        :return: A list of Indicator objects representing all (or filtered) indicators.
+        :rtype: List[Indicator]
+        """
+        params: Dict[str, Union[str, int, List[str]]] = {}
+        if taxonomy_terms:
+            params["taxonomy_terms[]"] = taxonomy_terms
+
+        indicators = await self.request_helper.aget_json(
+            "/indicators", params=params, key_path=("indicators",)
+        )
+        return [self._init_indicator(indicator) for indicator in indicators]
+
+    async def search(self, name: str) -> List[Indicator]:
+        """
+        Searches for indicators by name.
+
+        :param name: The name or part of the name to search for in indicators.
+        :type name: str
+        :return: A list of Indicator objects that match the search query.
+        :rtype: List[Indicator]
+        """
+        indicators = await self.request_helper.aget_json(
+            "/indicators", params={"text": name}, key_path=("indicators",)
+        )
+        return [self._init_indicator(indicator) for indicator in indicators]
+
+    async def get_data(
+        self,
+        indicator: Union[Indicator, int],
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        geo_ids: Optional[List[str]] = None,
+        geo_agg: Optional[GeoAgg] = None,
+        geo_trunc: Optional[GeoTrunc] = None,
+        time_agg: Optional[TimeAgg] = None,
+        time_trunc: Optional[TimeTrunc] = None,
+        all_raw_data: bool = False,
+        output_format: OutputFormat = OutputFormat.RECORDS,
+    ) -> Any:
+        """
+        Retrieves the data for an indicator based on the specified parameters.
+
+        :param indicator: The indicator, or its ID, whose data is retrieved.
+        :type indicator: Union[Indicator, int]
+        :param target_dt_start: The start date and time for data retrieval.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date and time for data retrieval.
+        :type target_dt_end: Union[datetime, str]
+        :param geo_ids: A list of geographical identifiers
+                        to filter data, defaults to None.
+        :type geo_ids: Optional[List[str]], optional
+        :param geo_agg: The geographical aggregation method, defaults to None.
+        :type geo_agg: Optional[GeoAgg], optional
+        :param geo_trunc: The geographical truncation level, defaults to None.
+        :type geo_trunc: Optional[GeoTrunc], optional
+        :param time_agg: The time aggregation method, defaults to None.
+        :type time_agg: Optional[TimeAgg], optional
+        :param time_trunc: The time truncation level, defaults to None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :param all_raw_data: Whether to return all raw data or just
+                             the indicator values, defaults to False.
+        :type all_raw_data: bool, optional
+        :param output_format: The format of the returned values. Columnar formats
+                              require `numpy` (and `pandas` or `pyarrow`) and
+                              cannot be combined with `all_raw_data`. Defaults to
+                              OutputFormat.RECORDS.
+        :type output_format: OutputFormat, optional
+        :raises ValueError: If `all_raw_data` is combined with a columnar format.
+        :return: The retrieved indicator data, either as raw JSON or processed values.
+        :rtype: Any
+        """
+        check_output_format(all_raw_data, output_format)
+        params = Indicator.build_data_params(
+            target_dt_start,
+            target_dt_end,
+            geo_ids=geo_ids,
+            geo_agg=geo_agg,
+            geo_trunc=geo_trunc,
+            time_agg=time_agg,
+            time_trunc=time_trunc,
+        )
+        indicator_id = indicator.id if isinstance(indicator, Indicator) else indicator
+
+        return await self._get_data(indicator_id, params, all_raw_data, output_format)
+
+    async def get_data_many(
+        self,
+        indicators: Iterable[Union[Indicator, int]],
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        geo_ids: Optional[List[str]] = None,
+        geo_agg: Optional[GeoAgg] = None,
+        geo_trunc: Optional[GeoTrunc] = None,
+        time_agg: Optional[TimeAgg] = None,
+        time_trunc: Optional[TimeTrunc] = None,
+        all_raw_data: bool = False,
+        output_format: OutputFormat = OutputFormat.RECORDS,
+    ) -> Dict[int, IndicatorDataResult]:
+        """
+        Retrieves the data of many indicators concurrently, with shared parameters.
+
+        Concurrency is bounded by the request helper. A failure only affects the
+        result of its own indicator, which holds the raised error instead of the
+        data, so the rest of the batch is still retrieved.
+
+        :param indicators: The indicators, or their IDs, whose data is retrieved.
+                           Duplicated IDs are only fetched once.
+        :type indicators: Iterable[Union[Indicator, int]]
+        :param target_dt_start: The start date and time for data retrieval.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date and time for data retrieval.
+        :type target_dt_end: Union[datetime, str]
+        :param geo_ids: A list of geographical identifiers
+                        to filter data, defaults to None.
+        :type geo_ids: Optional[List[str]], optional
+        :param geo_agg: The geographical aggregation method, defaults to None.
+        :type geo_agg: Optional[GeoAgg], optional
+        :param geo_trunc: The geographical truncation level, defaults to None.
+        :type geo_trunc: Optional[GeoTrunc], optional
+        :param time_agg: The time aggregation method, defaults to None.
+        :type time_agg: Optional[TimeAgg], optional
+        :param time_trunc: The time truncation level, defaults to None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :param all_raw_data: Whether to return all raw data or just
+                             the indicator values, defaults to False.
+        :type all_raw_data: bool, optional
+        :param output_format: The format of the returned values. Columnar formats
+                              require `numpy` (and `pandas` or `pyarrow`) and
+                              cannot be combined with `all_raw_data`. Defaults to
+                              OutputFormat.RECORDS.
+        :type output_format: OutputFormat, optional
+        :raises ValueError: If `all_raw_data` is combined with a columnar format.
+        :return: The result of every indicator, keyed by indicator ID in the order
+                 they were given.
+        :rtype: Dict[int, IndicatorDataResult]
+        """
+        check_output_format(all_raw_data, output_format)
+        params = Indicator.build_data_params(
+            target_dt_start,
+            target_dt_end,
+            geo_ids=geo_ids,
+            geo_agg=geo_agg,
+            geo_trunc=geo_trunc,
+            time_agg=time_agg,
+            time_trunc=time_trunc,
+        )
+        indicator_ids = list(
+            dict.fromkeys(
+                indicator.id if isinstance(indicator, Indicator) else indicator
+                for indicator in indicators
+            )
+        )
+
+        async def fetch(indicator_id: int) -> IndicatorDataResult:
+            try:
+                data = await self._get_data(
+                    indicator_id, params, all_raw_data, output_format
+                )
+            except Exception as e:
+                return IndicatorDataResult(indicator_id, error=e)
+            return IndicatorDataResult(indicator_id, data=data)
+
+        results = await asyncio.gather(*(fetch(i) for i in indicator_ids))
+
+        return {result.indicator_id: result for result in results}
+
+    async def _get_data(
+        self,
+        indicator_id: int,
+        params: Dict[str, Union[str, int, List[str]]],
+        all_raw_data: bool,
+        output_format: OutputFormat = OutputFormat.RECORDS,
+    ) -> Any:
+        """
+        Requests the data of an indicator with already built query parameters.
+
+        :param indicator_id: The ID of the indicator whose data is retrieved.
+        :type indicator_id: int
+        :param params: The query parameters of the request.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :param all_raw_data: Whether to return all raw data or just
+                             the indicator values.
+        :type all_raw_data: bool
+        :param output_format: The format of the returned values, defaults to
+                              OutputFormat.RECORDS.
+        :type output_format: OutputFormat, optional
+        :return: The retrieved indicator data, either as raw JSON or processed values.
+        :rtype: Any
+        """
+        if output_format != OutputFormat.RECORDS:
+            columns = await self.request_helper.aget_json_columns(
+                f"/indicators/{indicator_id}",
+                params=params,
+                key_path=("indicator", "values"),
+            )
+            return convert_columns(columns, output_format)
+
+        return await self.request_helper.aget_json(
+            f"/indicators/{indicator_id}",
+            params=params,
+            key_path=() if all_raw_data else ("indicator", "values"),
+        )
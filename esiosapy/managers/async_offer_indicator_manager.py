@@ -0,0 +1,177 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+from esiosapy.models.offer_indicator.offer_indicator import OfferIndicator
+from esiosapy.utils.async_request_helper import AsyncRequestHelper
+
+
+class AsyncOfferIndicatorManager:
+    """
+    Manages offer indicator-related operations for the ESIOS API using asyncio.
+
+    This class is the awaitable counterpart of OfferIndicatorManager. On top of
+    listing offer indicators, it can retrieve offer indicator data by ID.
+    """
+
+    def __init__(
+        self,
+        request_helper: AsyncRequestHelper,
+        trusted_models: bool = False,
+        keep_raw: bool = True,
+    ) -> None:
+        """
+        Initializes the AsyncOfferIndicatorManager with an AsyncRequestHelper.
+
+        :param request_helper: An instance of AsyncRequestHelper used to make
+                               API requests.
+        :type request_helper: AsyncRequestHelper
+        :param trusted_models: Whether to build the offer indicator objects without
+                               pydantic validation, which is much faster for
+                               large listings. Defaults to False.
+        :type trusted_models: bool, optional
+        :param keep_raw: Whether to keep the API data of each offer indicator in
+                         its `raw` attribute. Defaults to True.
+        :type keep_raw: bool, optional
+        """
+        self.request_helper = request_helper
+        self.trusted_models = trusted_models
+        self.keep_raw = keep_raw
+
+    def _init_indicator(self, indicator: Dict[str, Union[str, int]]) -> OfferIndicator:
+        """
+        Initializes an OfferIndicator object from a dictionary of indicator data.
+
+        :param indicator: A dictionary containing offer indicator data.
+        :type indicator: Dict[str, Union[str, int]]
+        :return: An OfferIndicator object initialized with the provided data.
+        :rtype: OfferIndicator
+        """
+        if self.trusted_models:
+            return OfferIndicator.from_trusted(
+                indicator, self.request_helper, keep_raw=self.keep_raw
+            )
+        return OfferIndicator(
+            **indicator,
+            raw=indicator if self.keep_raw else {},
+            _request_helper=self.request_helper,
+        )
+
+    async def list_all(
+        self, taxonomy_terms: Optional[List[str]] = None
+    ) -> List[OfferIndicator]:
+        """
+        Retrieves a list of all offer indicators, optionally filtered by taxonomy terms.
+
+        :param taxonomy_terms: A list of taxonomy terms to filter the offer indicators,
+                               defaults to None.
+        :type taxonomy_terms: Optional[List[str]], optional
+        :return: A list of OfferIndicator objects representing all (or filtered)
+                 offer indicators.
+        :rtype: List[OfferIndicator]
+        """
+        params: Dict[str, Union[str, int, List[str]]] = {}
+        if taxonomy_terms:
+            params["taxonomy_terms[]"] = taxonomy_terms
+
+        indicators = await self.request_helper.aget_json(
+            "/offer_indicators", params=params, key_path=("indicators",)
+        )
+
+        return [self._init_indicator(indicator) for indicator in indicators]
+
+    async def get_data_by_date(
+        self,
+        indicator: Union[OfferIndicator, int],
+        target_dt: Union[datetime, str],
+        all_raw_data: bool = False,
+    ) -> Any:
+        """
+        Retrieve the offer indicator data for a specific date.
+
+        :param indicator: The offer indicator, or its ID, whose data is retrieved.
+        :type indicator: Union[OfferIndicator, int]
+        :param target_dt: The target date for which to retrieve data,
+                          either as a datetime object or a string.
+        :type target_dt: Union[datetime, str]
+        :param all_raw_data: If True, returns the entire raw JSON response; otherwise,
+                             only returns the indicator values.
+        :type all_raw_data: bool, optional
+        :return: The requested data, either as a raw JSON or
+                 as specific indicator values.
+        :rtype: Any
+        """
+        if isinstance(target_dt, datetime):
+            target_dt = target_dt.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+
+        params: Dict[str, Union[str, int, List[str]]] = {
+            "datetime": target_dt,
+        }
+
+        return await self._get_data(indicator, params, all_raw_data)
+
+    async def get_data_by_date_range(
+        self,
+        indicator: Union[OfferIndicator, int],
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        all_raw_data: bool = False,
+    ) -> Any:
+        """
+        Retrieve the offer indicator data for a specific date range.
+
+        :param indicator: The offer indicator, or its ID, whose data is retrieved.
+        :type indicator: Union[OfferIndicator, int]
+        :param target_dt_start: The start date for the range,
+                                either as a datetime object or a string.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date for the range,
+                              either as a datetime object or a string.
+        :type target_dt_end: Union[datetime, str]
+        :param all_raw_data: If True, returns the entire raw JSON response; otherwise,
+                             only returns the indicator values.
+        :type all_raw_data: bool, optional
+        :return: The requested data, either as a raw JSON or
+                 as specific indicator values.
+        :rtype: Any
+        """
+        if isinstance(target_dt_start, datetime):
+            target_dt_start = target_dt_start.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+        if isinstance(target_dt_end, datetime):
+            target_dt_end = target_dt_end.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+
+        params: Dict[str, Union[str, int, List[str]]] = {
+            "start_date": target_dt_start,
+            "end_date": target_dt_end,
+        }
+
+        return await self._get_data(indicator, params, all_raw_data)
+
+    async def _get_data(
+        self,
+        indicator: Union[OfferIndicator, int],
+        params: Dict[str, Union[str, int, List[str]]],
+        all_raw_data: bool,
+    ) -> Any:
+        """
+        Requests the data of an offer indicator with the given query parameters.
+
+        :param indicator: The offer indicator, or its ID, whose data is retrieved.
+        :type indicator: Union[OfferIndicator, int]
+        :param params: The query parameters of the request.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :param all_raw_data: If True, returns the entire raw JSON response; otherwise,
+                             only returns the indicator values.
+        :type all_raw_data: bool
+        :return: The requested data, either as a raw JSON or
+                 as specific indicator values.
+        :rtype: Any
+        """
+        indicator_id = (
+            indicator.id if isinstance(indicator, OfferIndicator) else indicator
+        )
+
+        return await self.request_helper.aget_json(
+            f"/offer_indicators/{indicator_id}",
+            params=params,
+            key_path=() if all_raw_data else ("indicator", "values"),
+        )
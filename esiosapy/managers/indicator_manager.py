@@ -1,7 +1,82 @@
-from typing import Dict, List, Optional, Union
+import html
+import re
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
 
-from esiosapy.models.indicator.indicator import Indicator
+from esiosapy.models.indicator.geo_agg import GeoAgg
+from esiosapy.models.indicator.geo_trunc import GeoTrunc
+from esiosapy.models.indicator.indicator import (
+    DEFAULT_ITER_MAX_ROWS_PER_CHUNK,
+    DEFAULT_MAX_WORKERS,
+    Indicator,
+)
+from esiosapy.models.indicator.indicator_data_result import IndicatorDataResult
+from esiosapy.models.indicator.indicator_sync_result import IndicatorSyncResult
+from esiosapy.models.indicator.output_format import OutputFormat
+from esiosapy.models.indicator.time_agg import TimeAgg
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.columnar import check_output_format, convert_columns
+from esiosapy.utils.date_utils import estimate_window, parse_datetime, split_date_range
+from esiosapy.utils.indicator_store import IndicatorStore
 from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.ttl_cache import TTLCache, freeze_params
+
+DEFAULT_REVISION_WINDOW = timedelta(days=1)
+
+
+def _normalize_text(text: str) -> str:
+    """
+    Normalizes a text for accent and case insensitive matching.
+
+    :param text: The text to normalize.
+    :type text: str
+    :return: The text without diacritics, case folded.
+    :rtype: str
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def _as_utc(dt: Union[datetime, str]) -> datetime:
+    """
+    Parses a datetime, taking naive ones as UTC.
+
+    :param dt: The datetime, or an ISO 8601 string.
+    :type dt: Union[datetime, str]
+    :return: The timezone-aware datetime.
+    :rtype: datetime
+    """
+    parsed = parse_datetime(dt)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+_HTML_TAG = re.compile(r"<[^>]*>")
+
+
+def _search_texts(indicator: Indicator) -> Tuple[str, str]:
+    """
+    Returns the normalized texts an indicator is searched on.
+
+    :param indicator: The indicator.
+    :type indicator: Indicator
+    :return: Its name and short name, then its description, without HTML tags,
+             and the names of its taxonomy terms, if its raw data has any.
+    :rtype: Tuple[str, str]
+    """
+    terms = [
+        str(term.get("name", ""))
+        for term in indicator.raw.get("taxonomy_terms") or []
+        if isinstance(term, dict)
+    ]
+    description = html.unescape(_HTML_TAG.sub(" ", indicator.description))
+    return (
+        _normalize_text(f"{indicator.name} {indicator.short_name}"),
+        _normalize_text(" ".join([description, *terms])),
+    )
 
 
 class IndicatorManager:
@@ -9,18 +84,40 @@ class IndicatorManager:
     Manages indicator-related operations for the ESIOS API.
 
     This class provides methods to retrieve and search for indicators from the
-    ESIOS API, including listing all available indicators and searching for
-    indicators by name.
+    ESIOS API, including listing all available indicators, searching for
+    indicators by name and retrieving the data of many indicators at once.
+
+    If a catalog cache is given, listings and searches are memoized in memory,
+    and searches can be answered locally from the cached catalog.
     """
 
-    def __init__(self, request_helper: RequestHelper) -> None:
+    def __init__(
+        self,
+        request_helper: RequestHelper,
+        catalog_cache: Optional[TTLCache] = None,
+        trusted_models: bool = False,
+        keep_raw: bool = True,
+    ) -> None:
         """
         Initializes the IndicatorManager with a RequestHelper.
 
         :param request_helper: An instance of RequestHelper used to make API requests.
         :type request_helper: RequestHelper
+        :param catalog_cache: An optional cache memoizing the indicator listings,
+                              which can be shared between clients. Defaults to None.
+        :type catalog_cache: Optional[TTLCache], optional
+        :param trusted_models: Whether to build the indicator objects without
+                               pydantic validation, which is much faster for
+                               large listings. Defaults to False.
+        :type trusted_models: bool, optional
+        :param keep_raw: Whether to keep the API data of each indicator in its `raw`
+                         attribute. Defaults to True.
+        :type keep_raw: bool, optional
         """
         self.request_helper = request_helper
+        self.catalog_cache = catalog_cache
+        self.trusted_models = trusted_models
+        self.keep_raw = keep_raw
 
     def _init_indicator(self, indicator: Dict[str, Union[str, int]]) -> Indicator:
         """
@@ -31,8 +128,62 @@ class IndicatorManager:
         :return: An Indicator object initialized with the provided data.
         :rtype: Indicator
         """
+        if self.trusted_models:
+            return Indicator.from_trusted(
+                indicator, self.request_helper, keep_raw=self.keep_raw
+            )
         return Indicator(
-            **indicator, raw=indicator, _request_helper=self.request_helper
+            **indicator,
+            raw=indicator if self.keep_raw else {},
+            _request_helper=self.request_helper,
+        )
+
+    def _catalog_key(
+        self, kind: str, params: Dict[str, Union[str, int, List[str]]]
+    ) -> Hashable:
+        """
+        Builds the catalog cache key of a listing.
+
+        The key includes the base URL and token, so a cache can be safely shared
+        between clients.
+
+        :param kind: The kind of cached entry (e.g. the endpoint path).
+        :type kind: str
+        :param params: The query parameters of the listing.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :return: The cache key.
+        :rtype: Hashable
+        """
+        return (
+            type(self).__name__,
+            self.request_helper.base_url,
+            self.request_helper.token,
+            kind,
+            freeze_params(params),
+        )
+
+    def _list(self, params: Dict[str, Union[str, int, List[str]]]) -> List[Indicator]:
+        """
+        Requests the `/indicators` endpoint, going through the catalog cache if any.
+
+        :param params: The query parameters of the request.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :return: A list of Indicator objects returned by the API.
+        :rtype: List[Indicator]
+        """
+
+        def fetch() -> List[Indicator]:
+            indicators = self.request_helper.get_json(
+                "/indicators", params=params, key_path=("indicators",)
+            )
+            return [self._init_indicator(indicator) for indicator in indicators]
+
+        if self.catalog_cache is None:
+            return fetch()
+        return list(
+            self.catalog_cache.get_or_set(
+                self._catalog_key("/indicators", params), fetch
+            )
         )
 
     def list_all(self, taxonomy_terms: Optional[List[str]] = None) -> List[Indicator]:
@@ -53,13 +204,14 @@ class IndicatorManager:
         if taxonomy_terms:
             params["taxonomy_terms[]"] = taxonomy_terms
 
-        response = self.request_helper.get_request("/indicators", params=params)
-        return [
-            self._init_indicator(indicator)
-            for indicator in response.json()["indicators"]
-        ]
+        return self._list(params)
 
-    def search(self, name: str) -> List[Indicator]:
+    def search(
+        self,
+        name: str,
+        local: bool = False,
+        taxonomy_terms: Optional[List[str]] = None,
+    ) -> List[Indicator]:
         """
         Searches for indicators by name.
 
@@ -67,13 +219,369 @@ class IndicatorManager:
         search query, returning a list of Indicator objects that match the
         specified name.
 
+        If `local` is True, the search is answered from the indicator catalog
+        instead, without any request once the catalog is cached. An indicator
+        matches when every word of `name` appears in its name, short name,
+        description or taxonomy terms, ignoring case and accents. Indicators
+        matching on their name or short name alone come first. Taxonomy terms
+        are read from the raw data, so they are not searched when the catalog
+        is built with `keep_raw=False`.
+
         :param name: The name or part of the name to search for in indicators.
         :type name: str
+        :param local: Whether to search the catalog locally, defaults to False.
+        :type local: bool, optional
+        :param taxonomy_terms: A list of taxonomy terms to restrict the search to,
+                               defaults to None.
+        :type taxonomy_terms: Optional[List[str]], optional
         :return: A list of Indicator objects that match the search query.
         :rtype: List[Indicator]
         """
-        response = self.request_helper.get_request("/indicators", params={"text": name})
-        return [
-            self._init_indicator(indicator)
-            for indicator in response.json()["indicators"]
-        ]
+        params: Dict[str, Union[str, int, List[str]]] = {}
+        if taxonomy_terms:
+            params["taxonomy_terms[]"] = taxonomy_terms
+
+        if not local:
+            return self._list({"text": name, **params})
+
+        words = _normalize_text(name).split()
+        by_name = []
+        by_details = []
+        for (names, details), indicator in self._search_index(params):
+            if all(word in names for word in words):
+                by_name.append(indicator)
+            elif all(word in names or word in details for word in words):
+                by_details.append(indicator)
+        return by_name + by_details
+
+    def _search_index(
+        self, params: Dict[str, Union[str, int, List[str]]]
+    ) -> List[Tuple[Tuple[str, str], Indicator]]:
+        """
+        Builds the local search index of a catalog listing.
+
+        The index is memoized in the catalog cache, if any, next to the listing.
+
+        :param params: The query parameters of the catalog listing.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :return: The normalized searchable texts of every indicator, with the
+                 indicator itself.
+        :rtype: List[Tuple[Tuple[str, str], Indicator]]
+        """
+
+        def build() -> List[Tuple[Tuple[str, str], Indicator]]:
+            return [
+                (_search_texts(indicator), indicator)
+                for indicator in self._list(params)
+            ]
+
+        if self.catalog_cache is None:
+            return build()
+        return self.catalog_cache.get_or_set(
+            self._catalog_key("search_index", params), build
+        )
+
+    def get_data(
+        self,
+        indicator: Union[Indicator, int],
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        geo_ids: Optional[List[str]] = None,
+        geo_agg: Optional[GeoAgg] = None,
+        geo_trunc: Optional[GeoTrunc] = None,
+        time_agg: Optional[TimeAgg] = None,
+        time_trunc: Optional[TimeTrunc] = None,
+        all_raw_data: bool = False,
+        output_format: OutputFormat = OutputFormat.RECORDS,
+    ) -> Any:
+        """
+        Retrieves the data for an indicator based on the specified parameters.
+
+        Unlike `Indicator.get_data`, the indicator can be given by its ID, so its
+        metadata does not need to be listed first.
+
+        :param indicator: The indicator, or its ID, whose data is retrieved.
+        :type indicator: Union[Indicator, int]
+        :param target_dt_start: The start date and time for data retrieval.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date and time for data retrieval.
+        :type target_dt_end: Union[datetime, str]
+        :param geo_ids: A list of geographical identifiers
+                        to filter data, defaults to None.
+        :type geo_ids: Optional[List[str]], optional
+        :param geo_agg: The geographical aggregation method, defaults to None.
+        :type geo_agg: Optional[GeoAgg], optional
+        :param geo_trunc: The geographical truncation level, defaults to None.
+        :type geo_trunc: Optional[GeoTrunc], optional
+        :param time_agg: The time aggregation method, defaults to None.
+        :type time_agg: Optional[TimeAgg], optional
+        :param time_trunc: The time truncation level, defaults to None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :param all_raw_data: Whether to return all raw data or just
+                             the indicator values, defaults to False.
+        :type all_raw_data: bool, optional
+        :param output_format: The format of the returned values. Columnar formats
+                              require `numpy` (and `pandas` or `pyarrow`) and
+                              cannot be combined with `all_raw_data`. Defaults to
+                              OutputFormat.RECORDS.
+        :type output_format: OutputFormat, optional
+        :raises ValueError: If `all_raw_data` is combined with a columnar format.
+        :return: The retrieved indicator data, either as raw JSON or processed values.
+        :rtype: Any
+        """
+        check_output_format(all_raw_data, output_format)
+        params = Indicator.build_data_params(
+            target_dt_start,
+            target_dt_end,
+            geo_ids=geo_ids,
+            geo_agg=geo_agg,
+            geo_trunc=geo_trunc,
+            time_agg=time_agg,
+            time_trunc=time_trunc,
+        )
+        indicator_id = indicator.id if isinstance(indicator, Indicator) else indicator
+
+        return self._get_data(indicator_id, params, all_raw_data, output_format)
+
+    def get_data_many(
+        self,
+        indicators: Iterable[Union[Indicator, int]],
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        geo_ids: Optional[List[str]] = None,
+        geo_agg: Optional[GeoAgg] = None,
+        geo_trunc: Optional[GeoTrunc] = None,
+        time_agg: Optional[TimeAgg] = None,
+        time_trunc: Optional[TimeTrunc] = None,
+        all_raw_data: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        output_format: OutputFormat = OutputFormat.RECORDS,
+    ) -> Dict[int, IndicatorDataResult]:
+        """
+        Retrieves the data of many indicators concurrently, with shared parameters.
+
+        The indicators are fetched on a thread pool. A failure only affects the
+        result of its own indicator, which holds the raised error instead of the
+        data, so the rest of the batch is still retrieved.
+
+        :param indicators: The indicators, or their IDs, whose data is retrieved.
+                           Duplicated IDs are only fetched once.
+        :type indicators: Iterable[Union[Indicator, int]]
+        :param target_dt_start: The start date and time for data retrieval.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date and time for data retrieval.
+        :type target_dt_end: Union[datetime, str]
+        :param geo_ids: A list of geographical identifiers
+                        to filter data, defaults to None.
+        :type geo_ids: Optional[List[str]], optional
+        :param geo_agg: The geographical aggregation method, defaults to None.
+        :type geo_agg: Optional[GeoAgg], optional
+        :param geo_trunc: The geographical truncation level, defaults to None.
+        :type geo_trunc: Optional[GeoTrunc], optional
+        :param time_agg: The time aggregation method, defaults to None.
+        :type time_agg: Optional[TimeAgg], optional
+        :param time_trunc: The time truncation level, defaults to None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :param all_raw_data: Whether to return all raw data or just
+                             the indicator values, defaults to False.
+        :type all_raw_data: bool, optional
+        :param max_workers: The maximum number of indicators fetched concurrently,
+                            defaults to DEFAULT_MAX_WORKERS.
+        :type max_workers: int, optional
+        :param output_format: The format of the returned values. Columnar formats
+                              require `numpy` (and `pandas` or `pyarrow`) and
+                              cannot be combined with `all_raw_data`. Defaults to
+                              OutputFormat.RECORDS.
+        :type output_format: OutputFormat, optional
+        :raises ValueError: If `all_raw_data` is combined with a columnar format.
+        :return: The result of every indicator, keyed by indicator ID in the order
+                 they were given.
+        :rtype: Dict[int, IndicatorDataResult]
+        """
+        check_output_format(all_raw_data, output_format)
+        params = Indicator.build_data_params(
+            target_dt_start,
+            target_dt_end,
+            geo_ids=geo_ids,
+            geo_agg=geo_agg,
+            geo_trunc=geo_trunc,
+            time_agg=time_agg,
+            time_trunc=time_trunc,
+        )
+        indicator_ids = list(
+            dict.fromkeys(
+                indicator.id if isinstance(indicator, Indicator) else indicator
+                for indicator in indicators
+            )
+        )
+
+        def fetch(indicator_id: int) -> IndicatorDataResult:
+            try:
+                data = self._get_data(indicator_id, params, all_raw_data, output_format)
+            except Exception as e:
+                return IndicatorDataResult(indicator_id, error=e)
+            return IndicatorDataResult(indicator_id, data=data)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(fetch, indicator_ids))
+
+        return {result.indicator_id: result for result in results}
+
+    def sync(
+        self,
+        indicators: Iterable[Union[Indicator, int]],
+        store: IndicatorStore,
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Optional[Union[datetime, str]] = None,
+        geo_ids: Optional[List[str]] = None,
+        geo_agg: Optional[GeoAgg] = None,
+        geo_trunc: Optional[GeoTrunc] = None,
+        time_agg: Optional[TimeAgg] = None,
+        time_trunc: Optional[TimeTrunc] = None,
+        revision_window: timedelta = DEFAULT_REVISION_WINDOW,
+        chunk_size: Optional[Union[timedelta, TimeTrunc]] = None,
+        max_rows_per_chunk: int = DEFAULT_ITER_MAX_ROWS_PER_CHUNK,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Dict[int, IndicatorSyncResult]:
+        """
+        Incrementally syncs the values of many indicators into a local store.
+
+        The first sync of an indicator requests the whole range from
+        `target_dt_start`. Later syncs only request the values after the
+        high-water mark of the indicator in the store, minus `revision_window`,
+        so that late corrections of recent values are picked up too. Re-fetched
+        values replace the stored ones. Naive datetimes are taken as UTC, like
+        the store does.
+
+        The range of every indicator is split into windows, like
+        `Indicator.iter_values` does, which are requested one after another and
+        stored as they arrive, so a long first sync neither hits the size limit
+        of a single response nor holds the whole range in memory.
+
+        The indicators are synced on a thread pool. A failure only affects the
+        result of its own indicator, which holds the raised error instead. The
+        windows stored before the failure are kept, so the next sync resumes
+        after them.
+
+        :param indicators: The indicators, or their IDs, to sync. Duplicated IDs
+                           are only synced once.
+        :type indicators: Iterable[Union[Indicator, int]]
+        :param store: The store holding the values and high-water marks.
+        :type store: IndicatorStore
+        :param target_dt_start: The start of the range requested on the first
+                                sync of an indicator.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end of the requested range, defaults to now.
+        :type target_dt_end: Optional[Union[datetime, str]], optional
+        :param geo_ids: A list of geographical identifiers
+                        to filter data, defaults to None.
+        :type geo_ids: Optional[List[str]], optional
+        :param geo_agg: The geographical aggregation method, defaults to None.
+        :type geo_agg: Optional[GeoAgg], optional
+        :param geo_trunc: The geographical truncation level, defaults to None.
+        :type geo_trunc: Optional[GeoTrunc], optional
+        :param time_agg: The time aggregation method, defaults to None.
+        :type time_agg: Optional[TimeAgg], optional
+        :param time_trunc: The time truncation level, defaults to None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :param revision_window: How far before the high-water mark values are
+                                requested again, defaults to
+                                DEFAULT_REVISION_WINDOW.
+        :type revision_window: timedelta, optional
+        :param chunk_size: The size of every window, either as a fixed duration or
+                           as a TimeTrunc level (e.g. `TimeTrunc.MONTH`), defaults
+                           to None.
+        :type chunk_size: Optional[Union[timedelta, TimeTrunc]], optional
+        :param max_rows_per_chunk: The maximum number of rows wanted per window,
+                                   used to estimate the window size from
+                                   `time_trunc` when `chunk_size` is not given,
+                                   defaults to DEFAULT_ITER_MAX_ROWS_PER_CHUNK.
+        :type max_rows_per_chunk: int, optional
+        :param max_workers: The maximum number of indicators synced concurrently,
+                            defaults to DEFAULT_MAX_WORKERS.
+        :type max_workers: int, optional
+        :return: The result of every indicator, keyed by indicator ID in the order
+                 they were given.
+        :rtype: Dict[int, IndicatorSyncResult]
+        """
+        end = _as_utc(
+            datetime.now(timezone.utc) if target_dt_end is None else target_dt_end
+        )
+        if chunk_size is None:
+            chunk_size = estimate_window(
+                max_rows_per_chunk, time_trunc, len(geo_ids) if geo_ids else 1
+            )
+
+        indicator_ids = list(
+            dict.fromkeys(
+                indicator.id if isinstance(indicator, Indicator) else indicator
+                for indicator in indicators
+            )
+        )
+        store_geo_ids = [int(geo_id) for geo_id in geo_ids] if geo_ids else None
+
+        def sync_one(indicator_id: int) -> IndicatorSyncResult:
+            start: Optional[Union[datetime, str]] = None
+            rows = 0
+            try:
+                mark = store.high_water_mark(indicator_id, time_trunc, store_geo_ids)
+                start = target_dt_start if mark is None else mark - revision_window
+                for window_start, window_end in split_date_range(
+                    _as_utc(start), end, chunk_size
+                ):
+                    params = Indicator.build_data_params(
+                        window_start,
+                        window_end,
+                        geo_ids=geo_ids,
+                        geo_agg=geo_agg,
+                        geo_trunc=geo_trunc,
+                        time_agg=time_agg,
+                        time_trunc=time_trunc,
+                    )
+                    values = self._get_data(indicator_id, params, False)
+                    rows += store.upsert_values(indicator_id, values, time_trunc)
+            except Exception as e:
+                return IndicatorSyncResult(indicator_id, start=start, error=e)
+            return IndicatorSyncResult(indicator_id, start=start, rows=rows)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(sync_one, indicator_ids))
+
+        return {result.indicator_id: result for result in results}
+
+    def _get_data(
+        self,
+        indicator_id: int,
+        params: Dict[str, Union[str, int, List[str]]],
+        all_raw_data: bool,
+        output_format: OutputFormat = OutputFormat.RECORDS,
+    ) -> Any:
+        """
+        Requests the data of an indicator with already built query parameters.
+
+        :param indicator_id: The ID of the indicator whose data is retrieved.
+        :type indicator_id: int
+        :param params: The query parameters of the request.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :param all_raw_data: Whether to return all raw data or just
+                             the indicator values.
+        :type all_raw_data: bool
+        :param output_format: The format of the returned values, defaults to
+                              OutputFormat.RECORDS.
+        :type output_format: OutputFormat, optional
+        :return: The retrieved indicator data, either as raw JSON or processed values.
+        :rtype: Any
+        """
+        if output_format != OutputFormat.RECORDS:
+            columns = self.request_helper.get_json_columns(
+                f"/indicators/{indicator_id}",
+                params=params,
+                key_path=("indicator", "values"),
+            )
+            return convert_columns(columns, output_format)
+
+        return self.request_helper.get_json(
+            f"/indicators/{indicator_id}",
+            params=params,
+            key_path=() if all_raw_data else ("indicator", "values"),
+        )
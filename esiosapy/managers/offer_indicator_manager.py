@@ -1,7 +1,8 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, Hashable, List, Optional, Union
 
 from esiosapy.models.offer_indicator.offer_indicator import OfferIndicator
 from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.ttl_cache import TTLCache, freeze_params
 
 
 class OfferIndicatorManager:
@@ -10,17 +11,37 @@ class OfferIndicatorManager:
 
     This class provides methods to retrieve offer indicators from the ESIOS API,
     including listing all available offer indicators with optional filtering by
-    taxonomy terms.
+    taxonomy terms. If a catalog cache is given, listings are memoized in memory.
     """
 
-    def __init__(self, request_helper: RequestHelper) -> None:
+    def __init__(
+        self,
+        request_helper: RequestHelper,
+        catalog_cache: Optional[TTLCache] = None,
+        trusted_models: bool = False,
+        keep_raw: bool = True,
+    ) -> None:
         """
         Initializes the OfferIndicatorManager with a RequestHelper.
 
         :param request_helper: An instance of RequestHelper used to make API requests.
         :type request_helper: RequestHelper
+        :param catalog_cache: An optional cache memoizing the offer indicator
+                              listings, which can be shared between clients.
+                              Defaults to None.
+        :type catalog_cache: Optional[TTLCache], optional
+        :param trusted_models: Whether to build the offer indicator objects without
+                               pydantic validation, which is much faster for
+                               large listings. Defaults to False.
+        :type trusted_models: bool, optional
+        :param keep_raw: Whether to keep the API data of each offer indicator in
+                         its `raw` attribute. Defaults to True.
+        :type keep_raw: bool, optional
         """
         self.request_helper = request_helper
+        self.catalog_cache = catalog_cache
+        self.trusted_models = trusted_models
+        self.keep_raw = keep_raw
 
     def _init_indicator(self, indicator: Dict[str, Union[str, int]]) -> OfferIndicator:
         """
@@ -31,8 +52,14 @@ class OfferIndicatorManager:
         :return: An OfferIndicator object initialized with the provided data.
         :rtype: OfferIndicator
         """
+        if self.trusted_models:
+            return OfferIndicator.from_trusted(
+                indicator, self.request_helper, keep_raw=self.keep_raw
+            )
         return OfferIndicator(
-            **indicator, raw=indicator, _request_helper=self.request_helper
+            **indicator,
+            raw=indicator if self.keep_raw else {},
+            _request_helper=self.request_helper,
         )
 
     def list_all(
@@ -56,9 +83,32 @@ class OfferIndicatorManager:
         if taxonomy_terms:
             params["taxonomy_terms[]"] = taxonomy_terms
 
-        response = self.request_helper.get_request("/offer_indicators", params=params)
+        def fetch() -> List[OfferIndicator]:
+            indicators = self.request_helper.get_json(
+                "/offer_indicators", params=params, key_path=("indicators",)
+            )
+            return [self._init_indicator(indicator) for indicator in indicators]
 
-        return [
-            self._init_indicator(indicator)
-            for indicator in response.json()["indicators"]
-        ]
+        if self.catalog_cache is None:
+            return fetch()
+        return list(self.catalog_cache.get_or_set(self._catalog_key(params), fetch))
+
+    def _catalog_key(self, params: Dict[str, Union[str, int, List[str]]]) -> Hashable:
+        """
+        Builds the catalog cache key of a listing.
+
+        The key includes the base URL and token, so a cache can be safely shared
+        between clients.
+
+        :param params: The query parameters of the listing.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :return: The cache key.
+        :rtype: Hashable
+        """
+        return (
+            type(self).__name__,
+            self.request_helper.base_url,
+            self.request_helper.token,
+            "/offer_indicators",
+            freeze_params(params),
+        )
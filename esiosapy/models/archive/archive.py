@@ -1,15 +1,33 @@
 import os
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import requests
 from pydantic import BaseModel
 
 from esiosapy.models.archive.archive_download import ArchiveDownload
 from esiosapy.models.archive.taxonomy_term import TaxonomyTerm
 from esiosapy.models.archive.vocabulary import Vocabulary
+from esiosapy.utils.download_utils import (
+    expected_size,
+    extract_archive,
+    finish_download,
+    has_zip_directory,
+    part_path_for,
+    range_headers,
+)
+from esiosapy.utils.model_utils import (
+    construct_trusted,
+    dataclass_from_dict,
+    parse_date,
+)
 from esiosapy.utils.request_helper import RequestHelper
-from esiosapy.utils.zip_utils import recursive_unzip
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+"""A callback receiving the downloaded bytes so far and the total size, if known."""
 
 
 class Archive(BaseModel):
@@ -105,12 +123,60 @@ class Archive(BaseModel):
         super().__init__(**data)
         self._request_helper = data["_request_helper"]
 
+    @classmethod
+    def from_trusted(
+        cls,
+        data: Dict[str, Any],
+        request_helper: RequestHelper,
+        keep_raw: bool = True,
+    ) -> "Archive":
+        """
+        Builds an Archive from trusted API data, skipping pydantic validation.
+
+        This is much cheaper than the regular constructor when building whole
+        catalogs, but the data is not type checked. The nested download
+        information, dates and taxonomy are still converted to their types.
+        `data` is kept by reference as `raw` instead of being copied.
+
+        :param data: The API data of the archive.
+        :type data: Dict[str, Any]
+        :param request_helper: The request helper attached to the archive.
+        :type request_helper: RequestHelper
+        :param keep_raw: Whether to keep `data` as the `raw` attribute, or an
+                         empty dictionary instead. Defaults to True.
+        :type keep_raw: bool, optional
+        :return: The Archive object.
+        :rtype: Archive
+        """
+        return construct_trusted(
+            cls,
+            data,
+            request_helper,
+            keep_raw=keep_raw,
+            download=dataclass_from_dict(ArchiveDownload, data["download"]),
+            date_times=[parse_date(value) for value in data.get("date_times", [])],
+            publication_date=[
+                parse_date(value) for value in data.get("publication_date", [])
+            ],
+            taxonomy_terms=[
+                dataclass_from_dict(TaxonomyTerm, term)
+                for term in data.get("taxonomy_terms", [])
+            ],
+            vocabularies=[
+                dataclass_from_dict(Vocabulary, vocabulary)
+                for vocabulary in data.get("vocabularies", [])
+            ],
+        )
+
     def download_file(
         self,
         path: Optional[Union[str, Path]] = None,
         unzip: bool = True,
         remove_zip: bool = True,
-    ) -> None:
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        overwrite: bool = True,
+    ) -> Path:
         """
         Downloads the archive file and optionally unzips it.
 
@@ -118,6 +184,14 @@ class Archive(BaseModel):
         path. The file can be automatically unzipped and the original zip file can
         be removed based on the provided options.
 
+        The file is streamed to disk in chunks, so memory usage does not depend on
+        its size. It is first written to a `.part` file next to the final one,
+        which is only renamed once its size and ZIP checksums have been verified.
+        If a download is interrupted, the `.part` file is kept and the next call
+        resumes it with an HTTP Range request. With `overwrite` set to False, files
+        that are already fully downloaded (or extracted) are not downloaded again,
+        so re-runs are cheap.
+
         :param path: The directory where the file should be downloaded. If not provided,
                      the current working directory is used.
         :type path: Optional[Union[str, Path]], optional
@@ -126,17 +200,90 @@ class Archive(BaseModel):
         :param remove_zip: Whether to remove the original zip file after unzipping,
                            defaults to True.
         :type remove_zip: bool, optional
-        :return: None
+        :param chunk_size: The size in bytes of the chunks written to disk,
+                           defaults to DEFAULT_DOWNLOAD_CHUNK_SIZE.
+        :type chunk_size: int, optional
+        :param progress_callback: A function called after every chunk with the
+                                  number of bytes downloaded so far and the total
+                                  size, if the server sent it. Defaults to None.
+        :type progress_callback: Optional[ProgressCallback], optional
+        :param overwrite: Whether to download the file again even if it is already
+                          present on disk, replacing it. If False, a file already
+                          downloaded (or extracted) is returned as is. Defaults
+                          to True.
+        :type overwrite: bool, optional
+        :raises IncompleteDownloadError: If the server closed the connection before
+                                         sending the whole file.
+        :raises BadZipFile: If the downloaded file is corrupted.
+        :return: The path of the extracted directory if `unzip` is True, or the
+                 path of the zip file otherwise.
+        :rtype: Path
         """
         if path is None:
             path = Path.cwd()
 
-        response = self._request_helper.get_request(self.download.url)
-
         zip_path = Path(os.path.join(path, f"{self.name}.zip"))
+        extract_path = zip_path.parent / zip_path.stem
+        part_path = part_path_for(zip_path)
 
-        with open(zip_path, "wb") as f:
-            f.write(response.content)
+        if not overwrite and unzip and extract_path.exists():
+            return extract_path
 
-        if unzip:
-            recursive_unzip(zip_path, zip_path.stem, remove=remove_zip)
+        # Downloads are verified before being renamed, so a file already present
+        # only needs its central directory to open.
+        if overwrite or not has_zip_directory(zip_path):
+            self._download(zip_path, part_path, chunk_size, progress_callback)
+
+        if not unzip:
+            return zip_path
+
+        extract_archive(zip_path, extract_path, remove_zip)
+        return extract_path
+
+    def _download(
+        self,
+        zip_path: Path,
+        part_path: Path,
+        chunk_size: int,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        """
+        Downloads the archive file to `zip_path`, resuming `part_path` if present.
+
+        :param zip_path: The final path of the zip file.
+        :type zip_path: Path
+        :param part_path: The path of the partial file.
+        :type part_path: Path
+        :param chunk_size: The size in bytes of the chunks written to disk.
+        :type chunk_size: int
+        :param progress_callback: A function called after every chunk, if any.
+        :type progress_callback: Optional[ProgressCallback]
+        """
+        offset, headers = range_headers(part_path)
+        try:
+            response = self._request_helper.get_request(
+                self.download.url, headers=headers, stream=True
+            )
+        except requests.HTTPError as e:
+            if offset and e.response is not None and e.response.status_code == 416:
+                # The partial file does not match the remote one anymore.
+                part_path.unlink()
+                return self._download(
+                    zip_path, part_path, chunk_size, progress_callback
+                )
+            raise
+
+        with response:
+            append, total = expected_size(
+                response.status_code, response.headers, offset
+            )
+            downloaded = offset if append else 0
+
+            with open(part_path, "ab" if append else "wb") as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    if progress_callback is not None:
+                        progress_callback(downloaded, total)
+
+        finish_download(part_path, zip_path, total)
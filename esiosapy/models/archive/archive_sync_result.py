@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from esiosapy.models.archive.archive import Archive
+
+
+@dataclass
+class ArchiveSyncResult:
+    """
+    Represents the outcome of synchronizing one archive in a batch.
+
+    This dataclass holds either the local path of the archive or the error raised
+    while downloading it, so that one failing archive does not abort the whole
+    synchronization.
+    """
+
+    archive: Archive
+    """The synchronized archive.
+
+    :type: Archive
+    """
+
+    path: Optional[Path] = None
+    """The local path of the archive (the extracted directory or the zip file),
+    or None if the download failed.
+
+    :type: Optional[Path]
+    """
+
+    skipped: bool = False
+    """Whether the archive was already synchronized by a previous run.
+
+    :type: bool
+    """
+
+    error: Optional[Exception] = None
+    """The error raised while downloading the archive, or None if it succeeded.
+
+    :type: Optional[Exception]
+    """
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the archive was synchronized successfully.
+
+        :return: True if no error was raised, False otherwise.
+        :rtype: bool
+        """
+        return self.error is None
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+
+@dataclass
+class IndexedArchive:
+    """
+    Represents an archive recorded in a local ArchiveIndex.
+
+    This dataclass holds the metadata of a downloaded archive along with the local
+    paths of its files, so they can be opened without walking the filesystem.
+    """
+
+    archive_id: int
+    """The unique identifier of the archive.
+
+    :type: int
+    """
+
+    name: str
+    """The name of the archive, which includes its date.
+
+    :type: str
+    """
+
+    archive_type: str
+    """The type/category of the archive.
+
+    :type: str
+    """
+
+    horizon: str
+    """The horizon associated with the archive.
+
+    :type: str
+    """
+
+    path: Path
+    """The local path of the archive (the extracted directory or the zip file).
+
+    :type: Path
+    """
+
+    files: List[Path] = field(default_factory=list)
+    """The local paths of the files of the archive, sorted.
+
+    :type: List[Path]
+    """
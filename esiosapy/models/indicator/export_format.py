@@ -0,0 +1,19 @@
+from enum import Enum
+
+
+class ExportFormat(Enum):
+    """
+    Enum representing the file formats into which indicator values can be
+    exported.
+
+    :cvar PARQUET: Represents Apache Parquet files, one row group per request.
+    :vartype PARQUET: str
+    :cvar ARROW: Represents Arrow IPC stream files, one record batch per request.
+    :vartype ARROW: str
+    """
+
+    PARQUET = "parquet"
+    """Represents Apache Parquet files, one row group per request."""
+
+    ARROW = "arrow"
+    """Represents Arrow IPC stream files, one record batch per request."""
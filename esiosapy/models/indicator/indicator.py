@@ -1,14 +1,35 @@
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel
 
+from esiosapy.models.indicator.export_format import ExportFormat
 from esiosapy.models.indicator.geo_agg import GeoAgg
 from esiosapy.models.indicator.geo_trunc import GeoTrunc
+from esiosapy.models.indicator.output_format import OutputFormat
 from esiosapy.models.indicator.time_agg import TimeAgg
 from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.columnar import (
+    check_output_format,
+    convert_columns,
+    merge_columns,
+)
+from esiosapy.utils.concurrency import bounded_map
+from esiosapy.utils.date_utils import (
+    estimate_window,
+    format_datetime,
+    parse_datetime,
+    split_date_range,
+)
+from esiosapy.utils.export import split_by_partition, write_values
+from esiosapy.utils.model_utils import construct_trusted
 from esiosapy.utils.request_helper import RequestHelper
 
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_ITER_MAX_ROWS_PER_CHUNK = 10000
+
 
 class Indicator(BaseModel):
     """
@@ -71,6 +92,32 @@ class Indicator(BaseModel):
         super().__init__(**data)
         self._request_helper = data["_request_helper"]
 
+    @classmethod
+    def from_trusted(
+        cls,
+        data: Dict[str, Any],
+        request_helper: RequestHelper,
+        keep_raw: bool = True,
+    ) -> "Indicator":
+        """
+        Builds an Indicator from trusted API data, skipping pydantic validation.
+
+        This is much cheaper than the regular constructor when building whole
+        catalogs, but the data is not type checked. `data` is kept by reference
+        as `raw` instead of being copied.
+
+        :param data: The API data of the indicator.
+        :type data: Dict[str, Any]
+        :param request_helper: The request helper attached to the indicator.
+        :type request_helper: RequestHelper
+        :param keep_raw: Whether to keep `data` as the `raw` attribute, or an
+                         empty dictionary instead. Defaults to True.
+        :type keep_raw: bool, optional
+        :return: The Indicator object.
+        :rtype: Indicator
+        """
+        return construct_trusted(cls, data, request_helper, keep_raw=keep_raw)
+
     def prettify_description(self) -> str:
         """
         Converts the HTML description of the indicator into a plain text format
@@ -94,6 +141,50 @@ class Indicator(BaseModel):
 
         return str(text)
 
+    @staticmethod
+    def build_data_params(
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        geo_ids: Optional[List[str]] = None,
+        geo_agg: Optional[GeoAgg] = None,
+        geo_trunc: Optional[GeoTrunc] = None,
+        time_agg: Optional[TimeAgg] = None,
+        time_trunc: Optional[TimeTrunc] = None,
+    ) -> Dict[str, Union[str, int, List[str]]]:
+        """
+        Builds the query parameters used to retrieve indicator data.
+
+        Parameters that are not provided are left out of the query.
+
+        :param target_dt_start: The start date and time for data retrieval.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date and time for data retrieval.
+        :type target_dt_end: Union[datetime, str]
+        :param geo_ids: A list of geographical identifiers
+                        to filter data, defaults to None.
+        :type geo_ids: Optional[List[str]], optional
+        :param geo_agg: The geographical aggregation method, defaults to None.
+        :type geo_agg: Optional[GeoAgg], optional
+        :param geo_trunc: The geographical truncation level, defaults to None.
+        :type geo_trunc: Optional[GeoTrunc], optional
+        :param time_agg: The time aggregation method, defaults to None.
+        :type time_agg: Optional[TimeAgg], optional
+        :param time_trunc: The time truncation level, defaults to None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :return: The query parameters for the `/indicators/{id}` endpoint.
+        :rtype: Dict[str, Union[str, int, List[str]]]
+        """
+        params: Dict[str, Optional[Union[str, int, List[str]]]] = {
+            "start_date": format_datetime(target_dt_start),
+            "end_date": format_datetime(target_dt_end),
+            "geo_ids": ",".join(geo_ids) if geo_ids else None,
+            "geo_agg": geo_agg.value if geo_agg else None,
+            "geo_trunc": geo_trunc.value if geo_trunc else None,
+            "time_agg": time_agg.value if time_agg else None,
+            "time_trunc": time_trunc.value if time_trunc else None,
+        }
+        return {k: v for k, v in params.items() if v is not None}
+
     def get_data(
         self,
         target_dt_start: Union[datetime, str],
@@ -104,10 +195,21 @@ class Indicator(BaseModel):
         time_agg: Optional[TimeAgg] = None,
         time_trunc: Optional[TimeTrunc] = None,
         all_raw_data: bool = False,
+        chunk_size: Optional[Union[timedelta, TimeTrunc]] = None,
+        max_rows_per_chunk: Optional[int] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        output_format: OutputFormat = OutputFormat.RECORDS,
     ) -> Any:
         """
         Retrieves the data for the indicator based on the specified parameters.
 
+        By default, the whole date range is requested at once. If `chunk_size` or
+        `max_rows_per_chunk` is given, the range is split into consecutive windows
+        that are requested concurrently, and their values are stitched back in
+        order, without duplicates at the window boundaries. Windows should be a
+        multiple of `time_trunc`, so that no period is aggregated across two
+        requests.
+
         :param target_dt_start: The start date and time for data retrieval.
         :type target_dt_start: Union[datetime, str]
         :param target_dt_end: The end date and time for data retrieval.
@@ -124,31 +226,336 @@ class Indicator(BaseModel):
         :param time_trunc: The time truncation level, defaults to None.
         :type time_trunc: Optional[TimeTrunc], optional
         :param all_raw_data: Whether to return all raw data or just
-                             the indicator values, defaults to False.
+                             the indicator values, defaults to False. When the
+                             range is chunked, the raw data of the first window
+                             is returned with the stitched values of all windows.
         :type all_raw_data: bool, optional
+        :param chunk_size: The size of every window, either as a fixed duration or
+                           as a TimeTrunc level (e.g. `TimeTrunc.MONTH`), defaults
+                           to None.
+        :type chunk_size: Optional[Union[timedelta, TimeTrunc]], optional
+        :param max_rows_per_chunk: The maximum number of rows wanted per window,
+                                   used to estimate the window size from
+                                   `time_trunc` when `chunk_size` is not given,
+                                   defaults to None.
+        :type max_rows_per_chunk: Optional[int], optional
+        :param max_workers: The maximum number of windows requested concurrently,
+                            defaults to DEFAULT_MAX_WORKERS.
+        :type max_workers: int, optional
+        :param output_format: The format of the returned values. Columnar formats
+                              require `numpy` (and `pandas` or `pyarrow`) and
+                              cannot be combined with `all_raw_data`. Defaults to
+                              OutputFormat.RECORDS.
+        :type output_format: OutputFormat, optional
+        :raises ValueError: If `all_raw_data` is combined with a columnar format.
         :return: The retrieved indicator data, either as raw JSON or processed values.
         :rtype: Any
         """
-        if isinstance(target_dt_start, datetime):
-            target_dt_start = target_dt_start.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
-        if isinstance(target_dt_end, datetime):
-            target_dt_end = target_dt_end.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+        check_output_format(all_raw_data, output_format)
+        key_path = () if all_raw_data else ("indicator", "values")
+        # Columnar formats decode the values straight into columns, without
+        # building one dict per value.
+        get_json = (
+            self._request_helper.get_json
+            if output_format == OutputFormat.RECORDS
+            else self._request_helper.get_json_columns
+        )
 
-        params: Dict[str, Optional[Union[str, int, List[str]]]] = {
-            "start_date": target_dt_start,
-            "end_date": target_dt_end,
-            "geo_ids": ",".join(geo_ids) if geo_ids else None,
-            "geo_agg": geo_agg.value if geo_agg else None,
-            "geo_trunc": geo_trunc.value if geo_trunc else None,
-            "time_agg": time_agg.value if time_agg else None,
-            "time_trunc": time_trunc.value if time_trunc else None,
-        }
-        clean_params = {k: v for k, v in params.items() if v is not None}
+        def fetch(
+            window_start: Union[datetime, str], window_end: Union[datetime, str]
+        ) -> Any:
+            clean_params = self.build_data_params(
+                window_start,
+                window_end,
+                geo_ids=geo_ids,
+                geo_agg=geo_agg,
+                geo_trunc=geo_trunc,
+                time_agg=time_agg,
+                time_trunc=time_trunc,
+            )
+            return get_json(
+                f"/indicators/{self.id}", params=clean_params, key_path=key_path
+            )
+
+        if chunk_size is None:
+            if max_rows_per_chunk is None:
+                data = fetch(target_dt_start, target_dt_end)
+                if output_format == OutputFormat.RECORDS:
+                    return data
+                return convert_columns(data, output_format)
 
-        response = self._request_helper.get_request(
-            f"/indicators/{self.id}", params=clean_params
+            chunk_size = estimate_window(
+                max_rows_per_chunk, time_trunc, len(geo_ids) if geo_ids else 1
+            )
+
+        windows = split_date_range(
+            parse_datetime(target_dt_start), parse_datetime(target_dt_end), chunk_size
         )
 
-        return (
-            response.json() if all_raw_data else response.json()["indicator"]["values"]
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            chunks = list(executor.map(lambda window: fetch(*window), windows))
+
+        if output_format != OutputFormat.RECORDS:
+            return convert_columns(merge_columns(chunks), output_format)
+        if not all_raw_data:
+            return self.merge_values(chunks)
+
+        # The decoded responses may be shared with coalesced calls, so the
+        # stitched values go into a copy of the first one.
+        first = chunks[0] if chunks else {"indicator": {}}
+        values = self.merge_values([chunk["indicator"]["values"] for chunk in chunks])
+        return {**first, "indicator": {**first["indicator"], "values": values}}
+
+    def iter_values(
+        self,
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        geo_ids: Optional[List[str]] = None,
+        geo_agg: Optional[GeoAgg] = None,
+        geo_trunc: Optional[GeoTrunc] = None,
+        time_agg: Optional[TimeAgg] = None,
+        time_trunc: Optional[TimeTrunc] = None,
+        chunk_size: Optional[Union[timedelta, TimeTrunc]] = None,
+        max_rows_per_chunk: int = DEFAULT_ITER_MAX_ROWS_PER_CHUNK,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields the values of the indicator, window by window.
+
+        The range is split into consecutive windows, like `get_data` does, which
+        are requested one after another as the values are consumed. If `ijson` is
+        installed, every response is also decoded incrementally. Memory usage
+        thus stays flat however long the range is, and the first values are
+        available before the whole range is downloaded.
+
+        Rows duplicated at the window boundaries are skipped, as in
+        `merge_values`.
+
+        :param target_dt_start: The start date and time for data retrieval.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date and time for data retrieval.
+        :type target_dt_end: Union[datetime, str]
+        :param geo_ids: A list of geographical identifiers
+                        to filter data, defaults to None.
+        :type geo_ids: Optional[List[str]], optional
+        :param geo_agg: The geographical aggregation method, defaults to None.
+        :type geo_agg: Optional[GeoAgg], optional
+        :param geo_trunc: The geographical truncation level, defaults to None.
+        :type geo_trunc: Optional[GeoTrunc], optional
+        :param time_agg: The time aggregation method, defaults to None.
+        :type time_agg: Optional[TimeAgg], optional
+        :param time_trunc: The time truncation level, defaults to None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :param chunk_size: The size of every window, either as a fixed duration or
+                           as a TimeTrunc level (e.g. `TimeTrunc.MONTH`), defaults
+                           to None.
+        :type chunk_size: Optional[Union[timedelta, TimeTrunc]], optional
+        :param max_rows_per_chunk: The maximum number of rows wanted per window,
+                                   used to estimate the window size from
+                                   `time_trunc` when `chunk_size` is not given,
+                                   defaults to DEFAULT_ITER_MAX_ROWS_PER_CHUNK.
+        :type max_rows_per_chunk: int, optional
+        :return: An iterator over the indicator values, in chronological order.
+        :rtype: Iterator[Dict[str, Any]]
+        """
+        if chunk_size is None:
+            chunk_size = estimate_window(
+                max_rows_per_chunk, time_trunc, len(geo_ids) if geo_ids else 1
+            )
+
+        windows = split_date_range(
+            parse_datetime(target_dt_start), parse_datetime(target_dt_end), chunk_size
         )
+
+        # Duplicates can only appear across adjacent windows, so only the keys
+        # of the previous window are remembered.
+        previous_keys: Set[Tuple[Any, Any]] = set()
+        for window_start, window_end in windows:
+            params = self.build_data_params(
+                window_start,
+                window_end,
+                geo_ids=geo_ids,
+                geo_agg=geo_agg,
+                geo_trunc=geo_trunc,
+                time_agg=time_agg,
+                time_trunc=time_trunc,
+            )
+            keys: Set[Tuple[Any, Any]] = set()
+            for value in self._request_helper.iter_json(
+                f"/indicators/{self.id}",
+                params=params,
+                key_path=("indicator", "values"),
+            ):
+                key = self._value_key(value)
+                if key in keys or key in previous_keys:
+                    continue
+                keys.add(key)
+                yield value
+            previous_keys = keys
+
+    def export(
+        self,
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        path: Union[str, Path],
+        export_format: ExportFormat = ExportFormat.PARQUET,
+        partition_by: Optional[TimeTrunc] = None,
+        geo_ids: Optional[List[str]] = None,
+        geo_agg: Optional[GeoAgg] = None,
+        geo_trunc: Optional[GeoTrunc] = None,
+        time_agg: Optional[TimeAgg] = None,
+        time_trunc: Optional[TimeTrunc] = None,
+        chunk_size: Optional[Union[timedelta, TimeTrunc]] = None,
+        max_rows_per_chunk: int = DEFAULT_ITER_MAX_ROWS_PER_CHUNK,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> int:
+        """
+        Retrieves the values of the indicator and writes them straight to Parquet
+        or Arrow IPC files.
+
+        The range is split into windows, like `get_data` does, which are
+        requested concurrently and written in chronological order as they
+        arrive, one row group or record batch per window. At most twice
+        `max_workers` windows are held in memory, so multi-year exports never
+        sit fully in memory. Rows duplicated at the window boundaries are
+        skipped, as in `merge_values`.
+
+        With `partition_by`, `path` is a directory holding one file per day,
+        month or year of the range (e.g. `2021-01.parquet`), and windows are cut
+        at the partition boundaries.
+
+        :param target_dt_start: The start date and time for data retrieval.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The end date and time for data retrieval.
+        :type target_dt_end: Union[datetime, str]
+        :param path: The path of the file, or of the directory of partitions.
+                     Files are overwritten.
+        :type path: Union[str, Path]
+        :param export_format: The format of the files, defaults to
+                              ExportFormat.PARQUET.
+        :type export_format: ExportFormat, optional
+        :param partition_by: The level at which files are partitioned:
+                             `TimeTrunc.DAY`, `TimeTrunc.MONTH` or
+                             `TimeTrunc.YEAR`. Defaults to None (a single file).
+        :type partition_by: Optional[TimeTrunc], optional
+        :param geo_ids: A list of geographical identifiers
+                        to filter data, defaults to None.
+        :type geo_ids: Optional[List[str]], optional
+        :param geo_agg: The geographical aggregation method, defaults to None.
+        :type geo_agg: Optional[GeoAgg], optional
+        :param geo_trunc: The geographical truncation level, defaults to None.
+        :type geo_trunc: Optional[GeoTrunc], optional
+        :param time_agg: The time aggregation method, defaults to None.
+        :type time_agg: Optional[TimeAgg], optional
+        :param time_trunc: The time truncation level, defaults to None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :param chunk_size: The size of every window, either as a fixed duration or
+                           as a TimeTrunc level (e.g. `TimeTrunc.MONTH`), defaults
+                           to None.
+        :type chunk_size: Optional[Union[timedelta, TimeTrunc]], optional
+        :param max_rows_per_chunk: The maximum number of rows wanted per window,
+                                   used to estimate the window size from
+                                   `time_trunc` when `chunk_size` is not given,
+                                   defaults to DEFAULT_ITER_MAX_ROWS_PER_CHUNK.
+        :type max_rows_per_chunk: int, optional
+        :param max_workers: The maximum number of windows requested concurrently,
+                            defaults to DEFAULT_MAX_WORKERS.
+        :type max_workers: int, optional
+        :raises ValueError: If `partition_by` is shorter than a day.
+        :raises ImportError: If `pyarrow` is not installed.
+        :return: The number of values written.
+        :rtype: int
+        """
+        start = parse_datetime(target_dt_start)
+        end = parse_datetime(target_dt_end)
+        partitions: List[Tuple[Optional[str], datetime, datetime]] = (
+            [(None, start, end)]
+            if partition_by is None
+            else list(split_by_partition(start, end, partition_by))
+        )
+
+        if chunk_size is None:
+            chunk_size = estimate_window(
+                max_rows_per_chunk, time_trunc, len(geo_ids) if geo_ids else 1
+            )
+        windows = [
+            (key, window_start, window_end)
+            for key, partition_start, partition_end in partitions
+            for window_start, window_end in split_date_range(
+                partition_start, partition_end, chunk_size
+            )
+        ]
+
+        def fetch(window: Tuple[Optional[str], datetime, datetime]) -> Any:
+            params = self.build_data_params(
+                window[1],
+                window[2],
+                geo_ids=geo_ids,
+                geo_agg=geo_agg,
+                geo_trunc=geo_trunc,
+                time_agg=time_agg,
+                time_trunc=time_trunc,
+            )
+            return self._request_helper.get_json(
+                f"/indicators/{self.id}",
+                params=params,
+                key_path=("indicator", "values"),
+            )
+
+        def batches() -> Iterator[Tuple[Optional[str], List[Dict[str, Any]]]]:
+            previous_keys: Set[Tuple[Any, Any]] = set()
+            for (key, _, _), values in bounded_map(
+                fetch,
+                windows,
+                max_workers=max_workers,
+                max_in_flight=2 * max_workers,
+            ):
+                keys: Set[Tuple[Any, Any]] = set()
+                batch = []
+                for value in values:
+                    value_key = self._value_key(value)
+                    if value_key in keys or value_key in previous_keys:
+                        continue
+                    keys.add(value_key)
+                    batch.append(value)
+                previous_keys = keys
+                yield key, batch
+
+        return write_values(batches(), path, export_format)
+
+    @staticmethod
+    def merge_values(chunks: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Concatenates the values of consecutive windows, dropping duplicated rows.
+
+        Rows are identified by their UTC datetime (or local datetime, if the UTC
+        one is missing) and their geographical ID. The first occurrence of a row
+        is kept.
+
+        :param chunks: The values of every window, in chronological order.
+        :type chunks: List[List[Dict[str, Any]]]
+        :return: The stitched values.
+        :rtype: List[Dict[str, Any]]
+        """
+        seen = set()
+        values = []
+        for chunk in chunks:
+            for value in chunk:
+                key = Indicator._value_key(value)
+                if key in seen:
+                    continue
+                seen.add(key)
+                values.append(value)
+        return values
+
+    @staticmethod
+    def _value_key(value: Dict[str, Any]) -> Tuple[Any, Any]:
+        """
+        Returns the key identifying a row: its UTC datetime (or local datetime,
+        if the UTC one is missing) and its geographical ID.
+
+        :param value: The row.
+        :type value: Dict[str, Any]
+        :return: The key of the row.
+        :rtype: Tuple[Any, Any]
+        """
+        return (value.get("datetime_utc", value.get("datetime")), value.get("geo_id"))
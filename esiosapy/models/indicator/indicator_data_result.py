@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class IndicatorDataResult:
+    """
+    Represents the outcome of retrieving the data of one indicator in a batch.
+
+    This dataclass holds either the retrieved data or the error raised while
+    retrieving it, so that one failing indicator does not abort the whole batch.
+    """
+
+    indicator_id: int
+    """The unique identifier of the indicator.
+
+    :type: int
+    """
+
+    data: Any = None
+    """The retrieved data, or None if the retrieval failed.
+
+    :type: Any
+    """
+
+    error: Optional[Exception] = None
+    """The error raised while retrieving the data, or None if it succeeded.
+
+    :type: Optional[Exception]
+    """
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the data was retrieved successfully.
+
+        :return: True if no error was raised, False otherwise.
+        :rtype: bool
+        """
+        return self.error is None
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Union
+
+
+@dataclass
+class IndicatorSyncResult:
+    """
+    Represents the outcome of syncing one indicator into a local store.
+
+    This dataclass holds the range that was requested and the number of stored
+    values, or the error raised while syncing, so that one failing indicator
+    does not abort the whole sync.
+    """
+
+    indicator_id: int
+    """The unique identifier of the indicator.
+
+    :type: int
+    """
+
+    start: Optional[Union[datetime, str]] = None
+    """The start of the requested range: the high-water mark minus the revision
+    window, or the initial start on the first sync.
+
+    :type: Optional[Union[datetime, str]]
+    """
+
+    rows: int = 0
+    """The number of values stored, including revised ones.
+
+    :type: int
+    """
+
+    error: Optional[Exception] = None
+    """The error raised while syncing the indicator, or None if it succeeded.
+
+    :type: Optional[Exception]
+    """
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the indicator was synced successfully.
+
+        :return: True if no error was raised, False otherwise.
+        :rtype: bool
+        """
+        return self.error is None
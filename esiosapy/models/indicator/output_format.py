@@ -0,0 +1,31 @@
+from enum import Enum
+
+
+class OutputFormat(Enum):
+    """
+    Enum representing the formats in which indicator values can be returned.
+
+    Besides the list of dictionaries returned by the API, values can be converted
+    into columnar structures, which are much lighter for long series.
+
+    :cvar RECORDS: Represents the list of dictionaries returned by the API.
+    :vartype RECORDS: str
+    :cvar NUMPY: Represents a dictionary of NumPy arrays, one per column.
+    :vartype NUMPY: str
+    :cvar PANDAS: Represents a pandas DataFrame.
+    :vartype PANDAS: str
+    :cvar ARROW: Represents a PyArrow Table.
+    :vartype ARROW: str
+    """
+
+    RECORDS = "records"
+    """Represents the list of dictionaries returned by the API."""
+
+    NUMPY = "numpy"
+    """Represents a dictionary of NumPy arrays, one per column."""
+
+    PANDAS = "pandas"
+    """Represents a pandas DataFrame."""
+
+    ARROW = "arrow"
+    """Represents a PyArrow Table."""
@@ -1,8 +1,17 @@
-from datetime import datetime
-from typing import Any, Dict, List, Union
+import json
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
+from esiosapy.models.indicator.export_format import ExportFormat
+from esiosapy.models.indicator.indicator import DEFAULT_MAX_WORKERS
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.concurrency import bounded_map
+from esiosapy.utils.date_utils import parse_datetime
+from esiosapy.utils.export import check_partition_by, partition_key, write_values
+from esiosapy.utils.model_utils import construct_trusted
 from esiosapy.utils.request_helper import RequestHelper
 
 
@@ -47,6 +56,32 @@ class OfferIndicator(BaseModel):
         super().__init__(**data)
         self._request_helper = data["_request_helper"]
 
+    @classmethod
+    def from_trusted(
+        cls,
+        data: Dict[str, Any],
+        request_helper: RequestHelper,
+        keep_raw: bool = True,
+    ) -> "OfferIndicator":
+        """
+        Builds an OfferIndicator from trusted API data, skipping pydantic validation.
+
+        This is much cheaper than the regular constructor when building whole
+        catalogs, but the data is not type checked. `data` is kept by reference
+        as `raw` instead of being copied.
+
+        :param data: The API data of the offer indicator.
+        :type data: Dict[str, Any]
+        :param request_helper: The request helper attached to the offer indicator.
+        :type request_helper: RequestHelper
+        :param keep_raw: Whether to keep `data` as the `raw` attribute, or an
+                         empty dictionary instead. Defaults to True.
+        :type keep_raw: bool, optional
+        :return: The OfferIndicator object.
+        :rtype: OfferIndicator
+        """
+        return construct_trusted(cls, data, request_helper, keep_raw=keep_raw)
+
     def prettify_description(self) -> str:
         """
         Convert the HTML description into a prettified plain-text format.
@@ -101,12 +136,10 @@ class OfferIndicator(BaseModel):
             "datetime": target_dt,
         }
 
-        response = self._request_helper.get_request(
-            f"/offer_indicators/{self.id}", params=params
-        )
-
-        return (
-            response.json() if all_raw_data else response.json()["indicator"]["values"]
+        return self._request_helper.get_json(
+            f"/offer_indicators/{self.id}",
+            params=params,
+            key_path=() if all_raw_data else ("indicator", "values"),
         )
 
     def get_data_by_date_range(
@@ -114,6 +147,8 @@ class OfferIndicator(BaseModel):
         target_dt_start: Union[datetime, str],
         target_dt_end: Union[datetime, str],
         all_raw_data: bool = False,
+        partition_by_day: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> Any:
         """
         Retrieve the indicator data for a specific date range.
@@ -121,6 +156,12 @@ class OfferIndicator(BaseModel):
         This method fetches the indicator data for a given date range, either returning
         the raw JSON response or the specific indicator values.
 
+        Offer data is very large, so long ranges can be partitioned by day: every
+        day is fetched with `get_data_by_date` on a thread pool, and the values
+        are concatenated in order. To keep memory bounded, iterate the days with
+        `iter_data_by_day` or write them to a file with `write_data_by_day`
+        instead.
+
         :param target_dt_start: The start date for the range,
                                 either as a datetime object or a string.
         :type target_dt_start: Union[datetime, str]
@@ -130,10 +171,30 @@ class OfferIndicator(BaseModel):
         :param all_raw_data: If True, returns the entire raw JSON response; otherwise,
                              only returns the indicator values.
         :type all_raw_data: bool, optional
+        :param partition_by_day: Whether to fetch the range day by day, in
+                                 parallel, defaults to False.
+        :type partition_by_day: bool, optional
+        :param max_workers: The number of days fetched at the same time when
+                            partitioning by day, defaults to DEFAULT_MAX_WORKERS.
+        :type max_workers: int, optional
+        :raises ValueError: If `all_raw_data` is combined with `partition_by_day`.
         :return: The requested data, either as a raw JSON or
                  as specific indicator values.
         :rtype: Any
         """
+        if partition_by_day:
+            if all_raw_data:
+                raise ValueError(
+                    "Raw data cannot be returned when partitioning by day."
+                )
+            return [
+                value
+                for _, values in self.iter_data_by_day(
+                    target_dt_start, target_dt_end, max_workers=max_workers
+                )
+                for value in values
+            ]
+
         if isinstance(target_dt_start, datetime):
             target_dt_start = target_dt_start.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
         if isinstance(target_dt_end, datetime):
@@ -144,10 +205,172 @@ class OfferIndicator(BaseModel):
             "end_date": target_dt_end,
         }
 
-        response = self._request_helper.get_request(
-            f"/offer_indicators/{self.id}", params=params
+        return self._request_helper.get_json(
+            f"/offer_indicators/{self.id}",
+            params=params,
+            key_path=() if all_raw_data else ("indicator", "values"),
         )
 
-        return (
-            response.json() if all_raw_data else response.json()["indicator"]["values"]
+    def iter_data_by_day(
+        self,
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_days_in_flight: Optional[int] = None,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[date, List[Dict[str, Any]]]]:
+        """
+        Lazily retrieves the indicator values of a date range, day by day.
+
+        Every day of the range, both ends included, is fetched with
+        `get_data_by_date` on a thread pool. Days are only requested as the
+        previous ones are consumed, so at most `max_days_in_flight` days are held
+        in memory, whatever the length of the range.
+
+        :param target_dt_start: The first day of the range, either as a datetime
+                                object or a string.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The last day of the range, either as a datetime
+                              object or a string.
+        :type target_dt_end: Union[datetime, str]
+        :param max_workers: The number of days fetched at the same time, defaults
+                            to DEFAULT_MAX_WORKERS.
+        :type max_workers: int, optional
+        :param max_days_in_flight: The maximum number of days requested or held
+                                   and not yet consumed, defaults to twice
+                                   `max_workers`.
+        :type max_days_in_flight: Optional[int], optional
+        :param ordered: Whether days are yielded in chronological order, or as
+                        soon as they are fetched. Defaults to True.
+        :type ordered: bool, optional
+        :return: An iterator over `(day, values)` pairs.
+        :rtype: Iterator[Tuple[date, List[Dict[str, Any]]]]
+        """
+        start = parse_datetime(target_dt_start)
+        end = parse_datetime(target_dt_end)
+
+        def days() -> Iterator[datetime]:
+            day = start.date()
+            while day <= end.date():
+                yield datetime.combine(day, time(), tzinfo=start.tzinfo)
+                day += timedelta(days=1)
+
+        if max_days_in_flight is None:
+            max_days_in_flight = 2 * max_workers
+
+        for day, values in bounded_map(
+            self.get_data_by_date,
+            days(),
+            max_workers=max_workers,
+            max_in_flight=max_days_in_flight,
+            ordered=ordered,
+        ):
+            yield day.date(), values
+
+    def write_data_by_day(
+        self,
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        path: Union[str, Path],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_days_in_flight: Optional[int] = None,
+    ) -> int:
+        """
+        Retrieves the indicator values of a date range day by day, and writes them
+        to a JSON Lines file as they arrive, one value per line.
+
+        Values are written in chronological order, and memory stays bounded as
+        with `iter_data_by_day`.
+
+        :param target_dt_start: The first day of the range, either as a datetime
+                                object or a string.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The last day of the range, either as a datetime
+                              object or a string.
+        :type target_dt_end: Union[datetime, str]
+        :param path: The path of the file, which is overwritten.
+        :type path: Union[str, Path]
+        :param max_workers: The number of days fetched at the same time, defaults
+                            to DEFAULT_MAX_WORKERS.
+        :type max_workers: int, optional
+        :param max_days_in_flight: The maximum number of days requested or held
+                                   and not yet written, defaults to twice
+                                   `max_workers`.
+        :type max_days_in_flight: Optional[int], optional
+        :return: The number of values written.
+        :rtype: int
+        """
+        written = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for _, values in self.iter_data_by_day(
+                target_dt_start,
+                target_dt_end,
+                max_workers=max_workers,
+                max_days_in_flight=max_days_in_flight,
+            ):
+                for value in values:
+                    f.write(json.dumps(value, ensure_ascii=False))
+                    f.write("\n")
+                written += len(values)
+        return written
+
+    def export(
+        self,
+        target_dt_start: Union[datetime, str],
+        target_dt_end: Union[datetime, str],
+        path: Union[str, Path],
+        export_format: ExportFormat = ExportFormat.PARQUET,
+        partition_by: Optional[TimeTrunc] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_days_in_flight: Optional[int] = None,
+    ) -> int:
+        """
+        Retrieves the indicator values of a date range day by day, and writes them
+        straight to Parquet or Arrow IPC files as they arrive.
+
+        Every day is written as its own row group or record batch, in
+        chronological order, and memory stays bounded as with
+        `iter_data_by_day`. With `partition_by`, `path` is a directory holding
+        one file per day, month or year of the range (e.g. `2021-01.parquet`).
+
+        :param target_dt_start: The first day of the range, either as a datetime
+                                object or a string.
+        :type target_dt_start: Union[datetime, str]
+        :param target_dt_end: The last day of the range, either as a datetime
+                              object or a string.
+        :type target_dt_end: Union[datetime, str]
+        :param path: The path of the file, or of the directory of partitions.
+                     Files are overwritten.
+        :type path: Union[str, Path]
+        :param export_format: The format of the files, defaults to
+                              ExportFormat.PARQUET.
+        :type export_format: ExportFormat, optional
+        :param partition_by: The level at which files are partitioned:
+                             `TimeTrunc.DAY`, `TimeTrunc.MONTH` or
+                             `TimeTrunc.YEAR`. Defaults to None (a single file).
+        :type partition_by: Optional[TimeTrunc], optional
+        :param max_workers: The number of days fetched at the same time, defaults
+                            to DEFAULT_MAX_WORKERS.
+        :type max_workers: int, optional
+        :param max_days_in_flight: The maximum number of days requested or held
+                                   and not yet written, defaults to twice
+                                   `max_workers`.
+        :type max_days_in_flight: Optional[int], optional
+        :raises ValueError: If `partition_by` is shorter than a day.
+        :raises ImportError: If `pyarrow` is not installed.
+        :return: The number of values written.
+        :rtype: int
+        """
+        if partition_by is not None:
+            check_partition_by(partition_by)
+
+        batches = (
+            (None if partition_by is None else partition_key(day, partition_by), values)
+            for day, values in self.iter_data_by_day(
+                target_dt_start,
+                target_dt_end,
+                max_workers=max_workers,
+                max_days_in_flight=max_days_in_flight,
+            )
         )
+        return write_values(batches, path, export_format)
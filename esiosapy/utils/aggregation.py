@@ -0,0 +1,273 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from esiosapy.models.indicator.geo_agg import GeoAgg
+from esiosapy.models.indicator.output_format import OutputFormat
+from esiosapy.models.indicator.time_agg import TimeAgg
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.columnar import convert_values, values_to_numpy
+
+_SUB_DAILY_STEPS = {
+    TimeTrunc.FIVE_MINUTES: 5,
+    TimeTrunc.TEN_MINUTES: 10,
+    TimeTrunc.FIFTHEEN_MINUTES: 15,
+    TimeTrunc.HOUR: 60,
+}
+_CALENDAR_UNITS = {TimeTrunc.DAY: "D", TimeTrunc.MONTH: "M", TimeTrunc.YEAR: "Y"}
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy as np  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        raise ImportError(
+            "The `numpy` package is required to aggregate values locally. "
+            "Install it with 'pip install numpy' "
+            "or with your preferred package manager."
+        ) from None
+    return np
+
+
+def madrid_utc_offsets(utc: Any) -> Any:
+    """
+    Returns the UTC offsets of Europe/Madrid (peninsular time) at UTC instants.
+
+    Spain follows the EU rules: UTC+1 in winter and UTC+2 from the last Sunday
+    of March to the last Sunday of October, both changes happening at 01:00 UTC.
+
+    :param utc: The UTC instants, as a `datetime64` array.
+    :type utc: numpy.ndarray
+    :return: The offsets, as a `timedelta64[ns]` array.
+    :rtype: numpy.ndarray
+    """
+    np = _import_numpy()
+
+    utc = utc.astype("datetime64[ns]")
+    months = utc.astype("datetime64[Y]").astype("datetime64[M]")
+    hour = np.timedelta64(1, "h")
+    dst_start = _last_sunday(months + np.timedelta64(2, "M")) + hour
+    dst_end = _last_sunday(months + np.timedelta64(9, "M")) + hour
+    dst = (utc >= dst_start) & (utc < dst_end)
+    return np.where(dst, 2 * hour, hour).astype("timedelta64[ns]")
+
+
+def _last_sunday(months: Any) -> Any:
+    """
+    Returns the last Sunday of months.
+
+    :param months: The months, as a `datetime64[M]` array.
+    :type months: numpy.ndarray
+    :return: The last Sundays, as a `datetime64[ns]` array.
+    :rtype: numpy.ndarray
+    """
+    np = _import_numpy()
+
+    last_days = (months + np.timedelta64(1, "M")).astype("datetime64[D]") - 1
+    # 1970-01-01 was a Thursday, so Monday is 0 and Sunday is 6.
+    weekdays = (last_days.astype("int64") + 3) % 7
+    return (last_days - (weekdays + 1) % 7).astype("datetime64[ns]")
+
+
+def truncate_utc(utc: Any, time_trunc: TimeTrunc) -> Any:
+    """
+    Returns the UTC start of the Europe/Madrid periods holding UTC instants.
+
+    Periods up to an hour are truncated in UTC, which matches local time since
+    Spanish offsets are whole hours, and keeps the two hours repeated when
+    summer time ends apart. Days, months and years start at local midnight, so
+    DST days last 23 or 25 hours.
+
+    :param utc: The UTC instants, as a `datetime64` array.
+    :type utc: numpy.ndarray
+    :param time_trunc: The time truncation level.
+    :type time_trunc: TimeTrunc
+    :return: The UTC starts of the periods, as a `datetime64[ns]` array.
+    :rtype: numpy.ndarray
+    """
+    np = _import_numpy()
+
+    utc = utc.astype("datetime64[ns]")
+    if time_trunc in _SUB_DAILY_STEPS:
+        step = np.timedelta64(_SUB_DAILY_STEPS[time_trunc], "m").astype(
+            "timedelta64[ns]"
+        )
+        return utc - (utc - np.datetime64(0, "ns")) % step
+
+    local = utc + madrid_utc_offsets(utc)
+    local_start = local.astype(f"datetime64[{_CALENDAR_UNITS[time_trunc]}]").astype(
+        "datetime64[ns]"
+    )
+    # Local midnight is never skipped nor repeated, and the offset one hour
+    # earlier in UTC is always the one in force at midnight.
+    standard = np.timedelta64(1, "h")
+    return local_start - madrid_utc_offsets(local_start - standard)
+
+
+def _group(keys: Any, values: Any, agg: Any) -> Tuple[Any, Any]:
+    """
+    Aggregates values sharing the same keys, ignoring missing values.
+
+    :param keys: The keys, as a 2D `int64` array with one row per value.
+    :type keys: numpy.ndarray
+    :param values: The values, as a `float64` array where missing ones are NaN.
+    :type values: numpy.ndarray
+    :param agg: The aggregation function, a TimeAgg or GeoAgg.
+    :type agg: Union[TimeAgg, GeoAgg]
+    :return: The sorted unique keys and their aggregated values, NaN for groups
+             without any value.
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    np = _import_numpy()
+
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    present = ~np.isnan(values)
+    counts = np.bincount(inverse, weights=present, minlength=len(unique_keys))
+    sums = np.bincount(
+        inverse, weights=np.where(present, values, 0.0), minlength=len(unique_keys)
+    )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        average = agg in (TimeAgg.AVERAGE, GeoAgg.AVERAGE)
+        aggregated = sums / counts if average else sums
+    aggregated[counts == 0] = np.nan
+    return unique_keys, aggregated
+
+
+def aggregate_values(
+    values: Sequence[Dict[str, Any]],
+    time_trunc: Optional[TimeTrunc] = None,
+    time_agg: TimeAgg = TimeAgg.SUM,
+    geo_agg: Optional[GeoAgg] = None,
+    geo_groups: Optional[Mapping[int, int]] = None,
+    output_format: OutputFormat = OutputFormat.RECORDS,
+) -> Any:
+    """
+    Aggregates already fetched indicator values locally, the way the API does
+    with `time_trunc`, `time_agg` and `geo_agg`.
+
+    This allows deriving every rollup (hourly, daily, monthly...) from a single
+    fetch of the raw values. Values are first combined across geographical IDs
+    with `geo_agg`, if given, then across the periods of `time_trunc`, if given,
+    with `time_agg`. Periods follow the Europe/Madrid time of the API, so daily
+    periods of DST days last 23 or 25 hours. Missing values are ignored, and
+    periods without any value are NaN.
+
+    The geographical hierarchy of `GeoTrunc` is not part of the values, so
+    rolling geographical IDs up to a coarser level requires `geo_groups`,
+    mapping each geographical ID to the ID of its group. Without it, `geo_agg`
+    combines every geographical ID into a single series.
+
+    :param values: The values of an indicator, as returned by the API.
+    :type values: Sequence[Dict[str, Any]]
+    :param time_trunc: The time truncation level of the result, defaults to
+                       None (no time aggregation).
+    :type time_trunc: Optional[TimeTrunc], optional
+    :param time_agg: The function combining the values of a period, defaults to
+                     TimeAgg.SUM.
+    :type time_agg: TimeAgg, optional
+    :param geo_agg: The function combining the values of several geographical
+                    IDs, defaults to None (no geographical aggregation).
+    :type geo_agg: Optional[GeoAgg], optional
+    :param geo_groups: The group ID of each geographical ID, for `geo_agg`. IDs
+                       missing from it are kept as their own group. Defaults to
+                       None (a single group).
+    :type geo_groups: Optional[Mapping[int, int]], optional
+    :param output_format: The format of the result, defaults to
+                          OutputFormat.RECORDS.
+    :type output_format: OutputFormat, optional
+    :raises ImportError: If `numpy` is not installed.
+    :return: The aggregated values, with `value`, `datetime`, `datetime_utc`
+             and `tz_time` keys like the API values, and `geo_id` and
+             `geo_name` when they are kept. Aggregated geographical groups
+             only have a `geo_id`, and a single group has none.
+    :rtype: Any
+    """
+    np = _import_numpy()
+
+    if not values:
+        return convert_values([], output_format)
+
+    columns = values_to_numpy(values)
+    utc = columns["datetime_utc"].astype("int64")
+    data = columns["value"]
+    geo_ids = columns["geo_id"]
+    geo_names: Optional[Dict[int, str]] = dict(
+        zip(geo_ids.tolist(), columns["geo_name"].tolist())
+    )
+
+    if geo_agg is not None:
+        unique_geo_ids, inverse = np.unique(geo_ids, return_inverse=True)
+        if geo_groups is None:
+            geo_ids = np.zeros(len(geo_ids), dtype="int64")
+        else:
+            groups = np.array(
+                [geo_groups.get(geo_id, geo_id) for geo_id in unique_geo_ids.tolist()],
+                dtype="int64",
+            )
+            geo_ids = groups[inverse.reshape(-1)]
+        keys, data = _group(np.stack([utc, geo_ids], axis=1), data, geo_agg)
+        utc, geo_ids = keys[:, 0], keys[:, 1]
+        geo_names = None
+
+    if time_trunc is not None:
+        periods = truncate_utc(utc.astype("datetime64[ns]"), time_trunc)
+        keys, data = _group(
+            np.stack([periods.astype("int64"), geo_ids], axis=1), data, time_agg
+        )
+        utc, geo_ids = keys[:, 0], keys[:, 1]
+
+    with_geo = "geo_id" in values[0] and (geo_agg is None or geo_groups is not None)
+    records = _to_records(
+        utc.astype("datetime64[ns]"),
+        data,
+        geo_ids if with_geo else None,
+        geo_names,
+    )
+    return convert_values(records, output_format)
+
+
+def _to_records(
+    utc: Any,
+    data: Any,
+    geo_ids: Optional[Any],
+    geo_names: Optional[Dict[int, str]],
+) -> List[Dict[str, Any]]:
+    """
+    Builds values shaped like the ones of the API from columns.
+
+    :param utc: The UTC instants, as a `datetime64[ns]` array.
+    :type utc: numpy.ndarray
+    :param data: The values, as a `float64` array where missing ones are NaN.
+    :type data: numpy.ndarray
+    :param geo_ids: The geographical IDs, or None to leave them out.
+    :type geo_ids: Optional[numpy.ndarray]
+    :param geo_names: The name of each geographical ID, or None to leave them
+                      out.
+    :type geo_names: Optional[Dict[int, str]]
+    :return: One dictionary per value.
+    :rtype: List[Dict[str, Any]]
+    """
+    np = _import_numpy()
+
+    offsets = madrid_utc_offsets(utc)
+    local = np.datetime_as_string(utc + offsets, unit="ms")
+    suffixes = np.where(offsets == np.timedelta64(2, "h"), "+02:00", "+01:00")
+    datetime_utc = np.datetime_as_string(utc, unit="s")
+    tz_time = np.datetime_as_string(utc, unit="ms")
+    values = [None if np.isnan(value) else value for value in data.tolist()]
+
+    records = [
+        {
+            "value": value,
+            "datetime": local[i] + suffixes[i],
+            "datetime_utc": datetime_utc[i] + "Z",
+            "tz_time": tz_time[i] + "Z",
+        }
+        for i, value in enumerate(values)
+    ]
+    if geo_ids is not None:
+        for record, geo_id in zip(records, geo_ids.tolist()):
+            record["geo_id"] = geo_id
+            if geo_names is not None and geo_id in geo_names:
+                record["geo_name"] = geo_names[geo_id]
+    return records
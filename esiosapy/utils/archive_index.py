@@ -0,0 +1,325 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+from esiosapy.models.archive.archive import Archive
+from esiosapy.models.archive.archive_date_type import ArchiveDateType
+from esiosapy.models.archive.indexed_archive import IndexedArchive
+from esiosapy.utils.date_utils import parse_datetime
+
+# The highest code point, which sorts after every name starting with a prefix.
+_PREFIX_END = "\U0010ffff"
+
+
+def _date_key(target_date: Union[date, datetime, str]) -> str:
+    """
+    Returns the day of a date, as stored in the index.
+
+    :param target_date: The date, or an ISO 8601 string.
+    :type target_date: Union[date, datetime, str]
+    :return: The day as `YYYY-MM-DD`.
+    :rtype: str
+    """
+    if isinstance(target_date, str):
+        target_date = parse_datetime(target_date)
+    if isinstance(target_date, datetime):
+        target_date = target_date.date()
+    return target_date.isoformat()
+
+
+class ArchiveIndex:
+    """
+    A local index of downloaded archives, backed by a SQLite database.
+
+    Every archive is keyed on its ID and name, and recorded with its type,
+    horizon, data and publication dates, taxonomy terms and the paths of its
+    extracted files. Lookups by date, name, type or taxonomy term are served by
+    B-tree indexes, so finding the files of an archive never walks the
+    filesystem.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initializes the ArchiveIndex, creating its database if needed.
+
+        :param path: The path of the SQLite database file. Archive paths are
+                     stored relative to its directory.
+        :type path: Union[str, Path]
+        """
+        self.path = Path(path)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS archives ("
+                "archive_id INTEGER NOT NULL, "
+                "name TEXT NOT NULL, "
+                "archive_type TEXT NOT NULL, "
+                "horizon TEXT NOT NULL, "
+                "path TEXT NOT NULL, "
+                "indexed_at REAL NOT NULL, "
+                "PRIMARY KEY (archive_id, name))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS archives_by_name ON archives (name)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS archives_by_type ON archives (archive_type)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS archive_dates ("
+                "date_type TEXT NOT NULL, "
+                "date TEXT NOT NULL, "
+                "archive_id INTEGER NOT NULL, "
+                "name TEXT NOT NULL, "
+                "PRIMARY KEY (date_type, date, archive_id, name), "
+                "FOREIGN KEY (archive_id, name) REFERENCES archives "
+                "ON DELETE CASCADE)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS archive_terms ("
+                "term TEXT NOT NULL, "
+                "term_id INTEGER NOT NULL, "
+                "archive_id INTEGER NOT NULL, "
+                "name TEXT NOT NULL, "
+                "PRIMARY KEY (term, archive_id, name), "
+                "FOREIGN KEY (archive_id, name) REFERENCES archives "
+                "ON DELETE CASCADE)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS archive_files ("
+                "archive_id INTEGER NOT NULL, "
+                "name TEXT NOT NULL, "
+                "member TEXT NOT NULL, "
+                "PRIMARY KEY (archive_id, name, member), "
+                "FOREIGN KEY (archive_id, name) REFERENCES archives "
+                "ON DELETE CASCADE)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM archives"
+            ).fetchone()
+        return int(count)
+
+    def add(self, archive: Archive, path: Union[str, Path]) -> int:
+        """
+        Records a downloaded archive and the files found under its path,
+        replacing any previous record of the same archive.
+
+        :param archive: The archive.
+        :type archive: Archive
+        :param path: The local path of the archive: the extracted directory or
+                     the zip file.
+        :type path: Union[str, Path]
+        :return: The number of files recorded.
+        :rtype: int
+        """
+        path = Path(path)
+        if path.is_dir():
+            members = sorted(
+                file.relative_to(path).as_posix()
+                for file in path.rglob("*")
+                if file.is_file()
+            )
+        else:
+            members = [""]
+
+        key = (archive.id, archive.name)
+        dates = [
+            (ArchiveDateType.DATA.value, _date_key(value), *key)
+            for value in archive.date_times
+        ] + [
+            (ArchiveDateType.PUBLICATION.value, _date_key(value), *key)
+            for value in archive.publication_date
+        ]
+        terms = [
+            (term.name, term.id_taxonomy_term, *key) for term in archive.taxonomy_terms
+        ]
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM archives WHERE archive_id = ? AND name = ?", key
+            )
+            self._connection.execute(
+                "INSERT INTO archives VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    *key,
+                    archive.archive_type,
+                    archive.horizon,
+                    os.path.relpath(path, self.path.parent),
+                    time.time(),
+                ),
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO archive_dates VALUES (?, ?, ?, ?)", dates
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO archive_terms VALUES (?, ?, ?, ?)", terms
+            )
+            self._connection.executemany(
+                "INSERT INTO archive_files VALUES (?, ?, ?)",
+                [(*key, member) for member in members],
+            )
+
+        return len(members)
+
+    def get(self, archive_id: int, name: str) -> Optional[IndexedArchive]:
+        """
+        Returns a recorded archive, if its files still exist.
+
+        :param archive_id: The ID of the archive.
+        :type archive_id: int
+        :param name: The name of the archive, which includes its date.
+        :type name: str
+        :return: The recorded archive, or None if it was not recorded or its
+                 files were removed since.
+        :rtype: Optional[IndexedArchive]
+        """
+        found = self.find(archive_id=archive_id, name=name)
+        return found[0] if found else None
+
+    def find(
+        self,
+        archive_id: Optional[int] = None,
+        name: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        archive_type: Optional[str] = None,
+        target_date: Optional[Union[date, datetime, str]] = None,
+        date_type: ArchiveDateType = ArchiveDateType.DATA,
+        taxonomy_term: Optional[str] = None,
+    ) -> List[IndexedArchive]:
+        """
+        Returns the recorded archives matching every given criterion.
+
+        Archives whose files were removed since they were recorded are left out.
+
+        :param archive_id: The ID of the archives, defaults to None.
+        :type archive_id: Optional[int], optional
+        :param name: The exact name of the archive, defaults to None.
+        :type name: Optional[str], optional
+        :param name_prefix: The beginning of the name of the archives, e.g.
+                            `I90DIA`, defaults to None.
+        :type name_prefix: Optional[str], optional
+        :param archive_type: The type of the archives, defaults to None.
+        :type archive_type: Optional[str], optional
+        :param target_date: A day the archives hold, as a date, a datetime or an
+                            ISO 8601 string. Defaults to None.
+        :type target_date: Optional[Union[date, datetime, str]], optional
+        :param date_type: Whether `target_date` is a data or a publication date,
+                          defaults to ArchiveDateType.DATA.
+        :type date_type: ArchiveDateType, optional
+        :param taxonomy_term: The name of a taxonomy term of the archives,
+                              defaults to None.
+        :type taxonomy_term: Optional[str], optional
+        :return: The matching archives, sorted by name and ID.
+        :rtype: List[IndexedArchive]
+        """
+        query = (
+            "SELECT a.archive_id, a.name, a.archive_type, a.horizon, a.path "
+            "FROM archives a"
+        )
+        conditions: List[str] = []
+        args: List[Any] = []
+        if target_date is not None:
+            query += (
+                " JOIN archive_dates d "
+                "ON d.archive_id = a.archive_id AND d.name = a.name"
+            )
+            conditions.append("d.date_type = ? AND d.date = ?")
+            args.extend([date_type.value, _date_key(target_date)])
+        if taxonomy_term is not None:
+            query += (
+                " JOIN archive_terms t "
+                "ON t.archive_id = a.archive_id AND t.name = a.name"
+            )
+            conditions.append("t.term = ?")
+            args.append(taxonomy_term)
+        if archive_id is not None:
+            conditions.append("a.archive_id = ?")
+            args.append(archive_id)
+        if name is not None:
+            conditions.append("a.name = ?")
+            args.append(name)
+        if name_prefix is not None:
+            conditions.append("a.name >= ? AND a.name < ?")
+            args.extend([name_prefix, name_prefix + _PREFIX_END])
+        if archive_type is not None:
+            conditions.append("a.archive_type = ?")
+            args.append(archive_type)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY a.name, a.archive_id"
+
+        with self._lock:
+            rows = self._connection.execute(query, args).fetchall()
+            members = [
+                self._connection.execute(
+                    "SELECT member FROM archive_files "
+                    "WHERE archive_id = ? AND name = ? ORDER BY member",
+                    row[:2],
+                ).fetchall()
+                for row in rows
+            ]
+
+        found = []
+        for row, files in zip(rows, members):
+            archive = self._to_indexed_archive(row, [member for (member,) in files])
+            if archive.path.exists():
+                found.append(archive)
+        return found
+
+    def _to_indexed_archive(
+        self, row: Tuple[Any, ...], members: List[str]
+    ) -> IndexedArchive:
+        """
+        Builds an IndexedArchive from a row of the `archives` table.
+
+        :param row: The ID, name, type, horizon and relative path of the archive.
+        :type row: Tuple[Any, ...]
+        :param members: The paths of its files, relative to the archive path.
+        :type members: List[str]
+        :return: The archive, with absolute paths.
+        :rtype: IndexedArchive
+        """
+        archive_id, name, archive_type, horizon, relative_path = row
+        path = self.path.parent / relative_path
+        return IndexedArchive(
+            archive_id=archive_id,
+            name=name,
+            archive_type=archive_type,
+            horizon=horizon,
+            path=path,
+            files=[path / member if member else path for member in members],
+        )
+
+    def remove(self, archive_id: int, name: str) -> None:
+        """
+        Removes the record of an archive. Its files are left untouched.
+
+        :param archive_id: The ID of the archive.
+        :type archive_id: int
+        :param name: The name of the archive.
+        :type name: str
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM archives WHERE archive_id = ? AND name = ?",
+                (archive_id, name),
+            )
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
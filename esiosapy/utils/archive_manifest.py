@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+DEFAULT_MANIFEST_NAME = ".esiosapy-manifest.json"
+
+
+class ArchiveManifest:
+    """
+    A JSON file recording the archives already synchronized to a directory.
+
+    Every entry is keyed on the archive ID and name, and stores the local path
+    where the archive was saved. The file is rewritten atomically after every
+    change, so an interrupted synchronization keeps track of what it fetched.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initializes the ArchiveManifest, loading its file if it exists.
+
+        :param path: The path of the manifest file.
+        :type path: Union[str, Path]
+        """
+        self.path = Path(path)
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self._entries = json.load(f)["archives"]
+
+    @staticmethod
+    def make_key(archive_id: int, name: str) -> str:
+        """
+        Builds the manifest key of an archive.
+
+        :param archive_id: The ID of the archive.
+        :type archive_id: int
+        :param name: The name of the archive, which includes its date.
+        :type name: str
+        :return: The manifest key.
+        :rtype: str
+        """
+        return f"{archive_id}/{name}"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        Returns the local path of a synchronized archive, if it still exists.
+
+        :param key: The manifest key of the archive.
+        :type key: str
+        :return: The local path of the archive, or None if it was not
+                 synchronized or its files were removed since.
+        :rtype: Optional[Path]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        path = self.path.parent / entry["path"]
+        return path if path.exists() else None
+
+    def add(self, key: str, path: Path) -> None:
+        """
+        Records a synchronized archive and saves the manifest.
+
+        :param key: The manifest key of the archive.
+        :type key: str
+        :param path: The local path of the archive.
+        :type path: Path
+        """
+        with self._lock:
+            self._entries[key] = {
+                "path": os.path.relpath(path, self.path.parent),
+                "synced_at": datetime.now(timezone.utc).isoformat(),
+            }
+            self._save()
+
+    def _save(self) -> None:
+        """
+        Atomically writes the manifest file. Must be called with the lock held.
+        """
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"archives": self._entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
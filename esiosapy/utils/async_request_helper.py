@@ -0,0 +1,363 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+from urllib.parse import urljoin, urlparse
+
+from esiosapy.utils.instrumentation import RequestEvent, RequestHook
+from esiosapy.utils.json_backend import JsonBackend
+from esiosapy.utils.rate_limiter import RateLimiter
+from esiosapy.utils.request_helper import (
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TIMEOUT,
+    RequestHelper,
+    Timeout,
+)
+from esiosapy.utils.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncRequestHelper(RequestHelper):
+    """
+    An asyncio counterpart of RequestHelper, backed by a pooled `httpx.AsyncClient`.
+
+    It keeps the synchronous behaviour of RequestHelper, so models created through
+    the async managers can still be used synchronously, and adds awaitable request
+    methods. Every awaitable request shares one async connection pool and an
+    optional concurrency limit.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        max_concurrency: Optional[int] = None,
+        json_backend: Optional[Union[str, JsonBackend]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        hooks: Optional[Sequence[RequestHook]] = None,
+    ):
+        """
+        Initializes the AsyncRequestHelper with a base URL and an API token.
+
+        :param base_url: The base URL for the API endpoints.
+        :type base_url: str
+        :param token: The API token used for authentication in requests.
+        :type token: str
+        :param pool_maxsize: The maximum number of connections kept open to the
+                             API, defaults to DEFAULT_POOL_MAXSIZE.
+        :type pool_maxsize: int, optional
+        :param keep_alive: Whether to keep connections alive between requests,
+                           defaults to True.
+        :type keep_alive: bool, optional
+        :param max_concurrency: The maximum number of requests in flight at the
+                                same time. If not provided, only the pool size
+                                limits concurrency. Defaults to None.
+        :type max_concurrency: Optional[int], optional
+        :param json_backend: The JSON backend used to decode responses, by name
+                             or as an instance. If not provided, the fastest
+                             installed backend is used. Defaults to None.
+        :type json_backend: Optional[Union[str, JsonBackend]], optional
+        :param rate_limiter: An optional rate limiter every request waits for,
+                             which can be shared with synchronous clients.
+                             Defaults to None.
+        :type rate_limiter: Optional[RateLimiter], optional
+        :param retry_policy: How requests failing with transient errors are
+                             retried, or None to never retry them. Defaults to
+                             DEFAULT_RETRY_POLICY.
+        :type retry_policy: Optional[RetryPolicy], optional
+        :param timeout: The timeout of every request, in seconds, either for both
+                        phases or as `(connect, read)`, or None to wait forever.
+                        Defaults to DEFAULT_TIMEOUT.
+        :type timeout: Timeout, optional
+        :param hooks: Hooks called around every request, e.g. a MetricsCollector.
+                      Defaults to None.
+        :type hooks: Optional[Sequence[RequestHook]], optional
+        """
+        super().__init__(
+            base_url,
+            token,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            json_backend=json_backend,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            hooks=hooks,
+        )
+        self.max_concurrency = max_concurrency
+
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def async_client(self) -> "httpx.AsyncClient":
+        """
+        The pooled `httpx.AsyncClient` shared by every awaitable request.
+
+        The client is created lazily on first access.
+
+        :raises ImportError: If `httpx` is not installed.
+        :return: The pooled async client.
+        :rtype: httpx.AsyncClient
+        """
+        if self._async_client is None:
+            self._async_client = self._create_async_client()
+        return self._async_client
+
+    def _create_async_client(self) -> "httpx.AsyncClient":
+        """
+        Creates an `httpx.AsyncClient` with the configured connection limits.
+
+        :raises ImportError: If `httpx` is not installed.
+        :return: A new async client ready to be shared between requests.
+        :rtype: httpx.AsyncClient
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "The `httpx` package is required to use the async client. "
+                "Install it with 'pip install httpx' "
+                "or with your preferred package manager."
+            ) from None
+
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize,
+            max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+        )
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        else:
+            timeout = httpx.Timeout(self.timeout)
+        return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """
+        Returns the semaphore enforcing `max_concurrency`, if any.
+
+        It is created lazily so that it is bound to the running event loop.
+
+        :return: The concurrency semaphore, or None if concurrency is unbounded.
+        :rtype: Optional[asyncio.Semaphore]
+        """
+        if self.max_concurrency is not None and self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def aclose(self) -> None:
+        """
+        Closes both the async client and the synchronous pooled session.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self._semaphore = None
+        self.close()
+
+    async def __aenter__(self) -> "AsyncRequestHelper":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    async def aget_request(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Union[str, int, List[str]]]] = None,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        """
+        Makes an awaitable GET request to the specified path, with optional headers
+        and parameters.
+
+        The request waits for the rate limiter, if any, and for a free concurrency
+        slot if `max_concurrency` is set. Unless streamed, its body is fully read
+        before the slot is released. Transient failures are retried according to
+        the retry policy, and every hook is called before the request and once it
+        is over.
+
+        :param path: The endpoint path to be appended to the base URL.
+        :type path: str
+        :param headers: Optional headers to include in the request. If not provided,
+                        default headers will be added. Defaults to None.
+        :type headers: Optional[Dict[str, str]], optional
+        :param params: Optional query parameters to include in the request. This can
+                       include strings, integers, or lists of strings. Defaults to None.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]], optional
+        :param stream: Whether to defer downloading the response body, so it can be
+                       consumed in chunks with `aiter_bytes`. The response must
+                       then be closed by the caller with `aclose`. Defaults to False.
+        :type stream: bool, optional
+        :raises httpx.HTTPStatusError: If the response has an error status code.
+        :return: The response object resulting from the GET request.
+        :rtype: httpx.Response
+        """
+        if headers is None:
+            headers = {}
+        if params is None:
+            params = {}
+
+        headers = self.add_default_headers(headers)
+        url = urljoin(self.base_url, path)
+
+        request = self.async_client.build_request(
+            "GET", url, headers=headers, params=params
+        )
+
+        event = RequestEvent(url=url, path=urlparse(url).path, params=params)
+        for hook in self.hooks:
+            hook.before_request(event)
+
+        start = time.perf_counter()
+        try:
+            response = await self._asend(request, event, stream)
+            if response.is_error:
+                await response.aclose()
+            response.raise_for_status()
+        except Exception as error:
+            event.error = error
+            raise
+        finally:
+            event.elapsed = time.perf_counter() - start
+            for hook in self.hooks:
+                hook.after_request(event)
+
+        return response
+
+    async def _asend(
+        self, request: "httpx.Request", event: RequestEvent, stream: bool
+    ) -> "httpx.Response":
+        """
+        Sends a request, retrying transient failures according to the retry
+        policy.
+
+        :param request: The request to send.
+        :type request: httpx.Request
+        :param event: The event of the request, updated after every attempt.
+        :type event: RequestEvent
+        :param stream: Whether to defer downloading the response body.
+        :type stream: bool
+        :raises httpx.TransportError: If the last attempt failed without a
+                                      response.
+        :return: The response of the last attempt, whatever its status code.
+        :rtype: httpx.Response
+        """
+        import httpx
+
+        attempt = 0
+        while True:
+            attempt += 1
+            event.attempts = attempt
+            try:
+                response = await self._asend_once(request, stream)
+            except httpx.TransportError as error:
+                event.status_code = None
+                event.error = error
+                if self.retry_policy is None:
+                    raise
+                delay = self.retry_policy.error_delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                event.status_code = response.status_code
+                if self.hooks:
+                    event.bytes_received = self._received_bytes(response, stream)
+                event.error = None
+                if self.retry_policy is None:
+                    return response
+                delay = self.retry_policy.response_delay(
+                    attempt, response.status_code, response.headers
+                )
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            for hook in self.hooks:
+                hook.on_retry(event, delay)
+            await asyncio.sleep(delay)
+
+    async def _asend_once(
+        self, request: "httpx.Request", stream: bool
+    ) -> "httpx.Response":
+        """
+        Makes a single attempt of a request, after waiting for the rate limiter
+        and for a concurrency slot, if configured.
+
+        :param request: The request to send.
+        :type request: httpx.Request
+        :param stream: Whether to defer downloading the response body.
+        :type stream: bool
+        :return: The response, whatever its status code.
+        :rtype: httpx.Response
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+
+        semaphore = self._get_semaphore()
+        if semaphore is None:
+            return await self.async_client.send(request, stream=stream)
+        async with semaphore:
+            return await self.async_client.send(request, stream=stream)
+
+    async def aget_json(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Union[str, int, List[str]]]] = None,
+        key_path: Sequence[str] = (),
+    ) -> Any:
+        """
+        Makes an awaitable GET request and decodes its JSON body with the
+        configured backend.
+
+        :param path: The endpoint path to be appended to the base URL.
+        :type path: str
+        :param headers: Optional headers to include in the request, defaults to None.
+        :type headers: Optional[Dict[str, str]], optional
+        :param params: Optional query parameters to include in the request,
+                       defaults to None.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]], optional
+        :param key_path: The keys leading to the part of the body that is wanted,
+                         defaults to the whole body.
+        :type key_path: Sequence[str], optional
+        :raises KeyError: If a key of `key_path` is missing from the body.
+        :return: The decoded body, or the part of it found under `key_path`.
+        :rtype: Any
+        """
+        response = await self.aget_request(path, headers=headers, params=params)
+        return self.json_backend.loads_path(response.content, key_path)
+
+    async def aget_json_columns(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Union[str, int, List[str]]]] = None,
+        key_path: Sequence[str] = (),
+    ) -> Dict[str, List[Any]]:
+        """
+        Makes an awaitable GET request and decodes the indicator values of its
+        JSON body straight into columns, with the configured backend.
+
+        :param path: The endpoint path to be appended to the base URL.
+        :type path: str
+        :param headers: Optional headers to include in the request, defaults to None.
+        :type headers: Optional[Dict[str, str]], optional
+        :param params: Optional query parameters to include in the request,
+                       defaults to None.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]], optional
+        :param key_path: The keys leading to the array of values, defaults to
+                         the whole body.
+        :type key_path: Sequence[str], optional
+        :raises KeyError: If a key of `key_path` is missing from the body.
+        :return: The columns, as returned by `values_to_columns`.
+        :rtype: Dict[str, List[Any]]
+        """
+        response = await self.aget_request(path, headers=headers, params=params)
+        return self.json_backend.loads_columns(response.content, key_path)
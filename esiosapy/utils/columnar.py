@@ -0,0 +1,285 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from esiosapy.models.indicator.output_format import OutputFormat
+
+VALUE_COLUMNS = ("datetime_utc", "value", "geo_id", "geo_name")
+"""The columns of indicator values in columnar output formats."""
+
+KEY_COLUMNS = ("datetime",)
+"""The columns only kept to identify rows, left out of the output formats."""
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy as np  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        raise ImportError(
+            "The `numpy` package is required for columnar output formats. "
+            "Install it with 'pip install numpy' "
+            "or with your preferred package manager."
+        ) from None
+    return np
+
+
+def _strip_utc_suffix(dt: Optional[str]) -> Optional[str]:
+    """
+    Returns a UTC timestamp as a naive ISO 8601 string.
+
+    :param dt: The `datetime_utc` of a value, or None if missing.
+    :type dt: Optional[str]
+    :return: The UTC timestamp without its `Z` suffix, or None if missing.
+    :rtype: Optional[str]
+    """
+    if dt is not None and dt.endswith("Z"):
+        return dt[:-1]
+    return dt
+
+
+def values_to_columns(values: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Splits indicator values into one list per column, in a single pass.
+
+    :param values: The values of an indicator, as returned by the API.
+    :type values: Iterable[Dict[str, Any]]
+    :return: The `datetime_utc` (naive UTC ISO 8601 strings), `value`, `geo_id`
+             (-1 when missing) and `geo_name` columns, along with the local
+             `datetime` of the values, which `merge_columns` falls back to.
+    :rtype: Dict[str, List[Any]]
+    """
+    datetime_utc: List[Optional[str]] = []
+    local_datetime: List[Optional[str]] = []
+    data: List[Any] = []
+    geo_ids: List[int] = []
+    geo_names: List[str] = []
+    for value in values:
+        datetime_utc.append(_strip_utc_suffix(value.get("datetime_utc")))
+        local_datetime.append(value.get("datetime"))
+        data.append(value.get("value"))
+        geo_ids.append(value.get("geo_id", -1))
+        geo_names.append(value.get("geo_name", ""))
+    return {
+        "datetime_utc": datetime_utc,
+        "value": data,
+        "geo_id": geo_ids,
+        "geo_name": geo_names,
+        "datetime": local_datetime,
+    }
+
+
+def merge_columns(chunks: List[Dict[str, List[Any]]]) -> Dict[str, List[Any]]:
+    """
+    Concatenates the columns of consecutive windows, dropping duplicated rows.
+
+    Rows are identified like `Indicator.merge_values` does: by their UTC
+    datetime (or local datetime, if the UTC one is missing) and geographical
+    ID. The first occurrence of a row is kept.
+
+    :param chunks: The columns of every window, as returned by
+                   `values_to_columns`, in chronological order.
+    :type chunks: List[Dict[str, List[Any]]]
+    :return: The stitched columns.
+    :rtype: Dict[str, List[Any]]
+    """
+    names = VALUE_COLUMNS + KEY_COLUMNS
+    merged: Dict[str, List[Any]] = {name: [] for name in names}
+    seen = set()
+    for chunk in chunks:
+        keys = zip(chunk["datetime_utc"], chunk["datetime"], chunk["geo_id"])
+        for i, (dt_utc, dt, geo_id) in enumerate(keys):
+            key = (dt if dt_utc is None else dt_utc, geo_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            for name in names:
+                merged[name].append(chunk[name][i])
+    return merged
+
+
+def columns_to_numpy(columns: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """
+    Converts the columns of indicator values into NumPy arrays.
+
+    The timestamps are parsed into a `datetime64[ns]` array holding UTC times,
+    and the values into a `float64` array where missing values are NaN.
+
+    :param columns: The columns, as returned by `values_to_columns`.
+    :type columns: Dict[str, List[Any]]
+    :raises ImportError: If `numpy` is not installed.
+    :return: The `datetime_utc`, `value`, `geo_id` and `geo_name` columns.
+    :rtype: Dict[str, Any]
+    """
+    np = _import_numpy()
+
+    return {
+        "datetime_utc": np.array(columns["datetime_utc"], dtype="datetime64[ns]"),
+        "value": np.array(columns["value"], dtype="float64"),
+        "geo_id": np.array(columns["geo_id"], dtype="int64"),
+        "geo_name": np.array(columns["geo_name"], dtype="str"),
+    }
+
+
+def values_to_numpy(values: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Converts indicator values into one NumPy array per column.
+
+    The values are split into columns in a single pass with
+    `values_to_columns`, then converted with `columns_to_numpy`.
+
+    :param values: The values of an indicator, as returned by the API.
+    :type values: Sequence[Dict[str, Any]]
+    :raises ImportError: If `numpy` is not installed.
+    :return: The `datetime_utc`, `value`, `geo_id` and `geo_name` columns.
+    :rtype: Dict[str, Any]
+    """
+    return columns_to_numpy(values_to_columns(values))
+
+
+def columns_to_pandas(columns: Dict[str, List[Any]]) -> Any:
+    """
+    Converts the columns of indicator values into a pandas DataFrame.
+
+    The `datetime_utc` column is timezone-aware (UTC), `value` is `float64`, and
+    `geo_id` and `geo_name` are categorical, since they repeat on every period.
+
+    :param columns: The columns, as returned by `values_to_columns`.
+    :type columns: Dict[str, List[Any]]
+    :raises ImportError: If `pandas` is not installed.
+    :return: A DataFrame with one row per value.
+    :rtype: Any
+    """
+    try:
+        import pandas as pd  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "The `pandas` package is required for the pandas output format. "
+            "Install it with 'pip install pandas' "
+            "or with your preferred package manager."
+        ) from None
+
+    columns = columns_to_numpy(columns)
+    return pd.DataFrame(
+        {
+            "datetime_utc": pd.DatetimeIndex(columns["datetime_utc"]).tz_localize(
+                "UTC"
+            ),
+            "value": columns["value"],
+            "geo_id": pd.Categorical(columns["geo_id"]),
+            "geo_name": pd.Categorical(columns["geo_name"]),
+        }
+    )
+
+
+def values_to_pandas(values: Sequence[Dict[str, Any]]) -> Any:
+    """
+    Converts indicator values into a pandas DataFrame, as `columns_to_pandas`
+    does.
+
+    :param values: The values of an indicator, as returned by the API.
+    :type values: Sequence[Dict[str, Any]]
+    :raises ImportError: If `pandas` is not installed.
+    :return: A DataFrame with one row per value.
+    :rtype: Any
+    """
+    return columns_to_pandas(values_to_columns(values))
+
+
+def columns_to_arrow(columns: Dict[str, List[Any]]) -> Any:
+    """
+    Converts the columns of indicator values into a PyArrow Table.
+
+    The `datetime_utc` column is a UTC timestamp, `value` is `float64` with
+    missing values as nulls, and `geo_id` and `geo_name` are dictionary encoded.
+
+    :param columns: The columns, as returned by `values_to_columns`.
+    :type columns: Dict[str, List[Any]]
+    :raises ImportError: If `pyarrow` is not installed.
+    :return: A Table with one row per value.
+    :rtype: Any
+    """
+    try:
+        import pyarrow as pa  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "The `pyarrow` package is required for the arrow output format. "
+            "Install it with 'pip install pyarrow' "
+            "or with your preferred package manager."
+        ) from None
+
+    columns = columns_to_numpy(columns)
+    return pa.table(
+        {
+            "datetime_utc": pa.array(
+                columns["datetime_utc"], type=pa.timestamp("ns", tz="UTC")
+            ),
+            "value": pa.array(columns["value"], type=pa.float64(), from_pandas=True),
+            "geo_id": pa.array(columns["geo_id"]).dictionary_encode(),
+            "geo_name": pa.array(columns["geo_name"]).dictionary_encode(),
+        }
+    )
+
+
+def values_to_arrow(values: Sequence[Dict[str, Any]]) -> Any:
+    """
+    Converts indicator values into a PyArrow Table, as `columns_to_arrow` does.
+
+    :param values: The values of an indicator, as returned by the API.
+    :type values: Sequence[Dict[str, Any]]
+    :raises ImportError: If `pyarrow` is not installed.
+    :return: A Table with one row per value.
+    :rtype: Any
+    """
+    return columns_to_arrow(values_to_columns(values))
+
+
+def check_output_format(all_raw_data: bool, output_format: OutputFormat) -> None:
+    """
+    Checks that an output format can be used for the requested data.
+
+    :param all_raw_data: Whether all raw data is requested.
+    :type all_raw_data: bool
+    :param output_format: The requested output format.
+    :type output_format: OutputFormat
+    :raises ValueError: If `all_raw_data` is combined with a columnar format.
+    """
+    if all_raw_data and output_format != OutputFormat.RECORDS:
+        raise ValueError(
+            "Raw data can only be returned with the records output format."
+        )
+
+
+def convert_values(values: List[Dict[str, Any]], output_format: OutputFormat) -> Any:
+    """
+    Converts indicator values into the requested output format.
+
+    :param values: The values of an indicator, as returned by the API.
+    :type values: List[Dict[str, Any]]
+    :param output_format: The format to convert the values into.
+    :type output_format: OutputFormat
+    :return: The converted values; the values themselves for
+             `OutputFormat.RECORDS`.
+    :rtype: Any
+    """
+    if output_format == OutputFormat.RECORDS:
+        return values
+    return convert_columns(values_to_columns(values), output_format)
+
+
+def convert_columns(columns: Dict[str, List[Any]], output_format: OutputFormat) -> Any:
+    """
+    Converts the columns of indicator values into a columnar output format.
+
+    :param columns: The columns, as returned by `values_to_columns`.
+    :type columns: Dict[str, List[Any]]
+    :param output_format: The format to convert the columns into.
+    :type output_format: OutputFormat
+    :raises ValueError: If `output_format` is `OutputFormat.RECORDS`.
+    :return: The converted columns.
+    :rtype: Any
+    """
+    if output_format == OutputFormat.NUMPY:
+        return columns_to_numpy(columns)
+    if output_format == OutputFormat.PANDAS:
+        return columns_to_pandas(columns)
+    if output_format == OutputFormat.ARROW:
+        return columns_to_arrow(columns)
+    raise ValueError("Columns can only be converted into a columnar output format.")
@@ -0,0 +1,72 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def bounded_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    max_in_flight: int,
+    ordered: bool = True,
+) -> Iterator[Tuple[T, R]]:
+    """
+    Lazily maps a function over items on a thread pool, keeping at most
+    `max_in_flight` items submitted or completed but not yet consumed.
+
+    Unlike `Executor.map`, items are pulled from `items` as results are
+    consumed, so memory stays bounded whatever the number of items. The next
+    item is submitted before a result is yielded, so workers keep running while
+    the caller processes it. Items still pending when the iterator is closed are
+    cancelled.
+
+    :param fn: The function to apply to every item.
+    :type fn: Callable[[T], R]
+    :param items: The items, possibly a lazy iterable.
+    :type items: Iterable[T]
+    :param max_workers: The number of threads.
+    :type max_workers: int
+    :param max_in_flight: The maximum number of items submitted and not yet
+                          yielded.
+    :type max_in_flight: int
+    :param ordered: Whether results are yielded in the order of the items, or as
+                    soon as they complete. Defaults to True.
+    :type ordered: bool, optional
+    :raises Exception: Whatever `fn` raised for an item, when its result is
+                       reached.
+    :return: An iterator over `(item, result)` pairs.
+    :rtype: Iterator[Tuple[T, R]]
+    """
+    iterator = iter(items)
+    pending: Deque[Tuple[T, Future[R]]] = deque()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+
+        def submit() -> None:
+            for item in iterator:
+                pending.append((item, executor.submit(fn, item)))
+                return
+
+        try:
+            for _ in range(max(1, max_in_flight)):
+                submit()
+
+            while pending:
+                if ordered:
+                    item, future = pending.popleft()
+                else:
+                    done, _ = wait(
+                        [future for _, future in pending], return_when=FIRST_COMPLETED
+                    )
+                    item, future = next(entry for entry in pending if entry[1] in done)
+                    pending.remove((item, future))
+
+                result = future.result()
+                submit()
+                yield item, result
+        finally:
+            for _, future in pending:
+                future.cancel()
@@ -0,0 +1,163 @@
+import calendar
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple, Union
+
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+TIME_TRUNC_STEPS = {
+    TimeTrunc.FIVE_MINUTES: timedelta(minutes=5),
+    TimeTrunc.TEN_MINUTES: timedelta(minutes=10),
+    TimeTrunc.FIFTHEEN_MINUTES: timedelta(minutes=15),
+    TimeTrunc.HOUR: timedelta(hours=1),
+    TimeTrunc.DAY: timedelta(days=1),
+}
+
+
+def format_datetime(dt: Union[datetime, str]) -> str:
+    """
+    Formats a datetime the way the ESIOS API expects it.
+
+    Strings are returned untouched, so already formatted dates can be passed
+    through.
+
+    :param dt: The datetime to format, or an already formatted string.
+    :type dt: Union[datetime, str]
+    :return: The formatted datetime.
+    :rtype: str
+    """
+    if isinstance(dt, datetime):
+        return dt.strftime(DATETIME_FORMAT)
+    return dt
+
+
+def parse_datetime(dt: Union[datetime, str]) -> datetime:
+    """
+    Parses an ISO 8601 string, as accepted or returned by the ESIOS API.
+
+    Both plain dates (e.g. `2021-01-01`) and full datetimes with a UTC offset or
+    a trailing `Z` are supported. Datetime objects are returned untouched.
+
+    :param dt: The value to parse.
+    :type dt: Union[datetime, str]
+    :return: The parsed datetime.
+    :rtype: datetime
+    """
+    if isinstance(dt, datetime):
+        return dt
+    if dt.endswith("Z"):
+        dt = dt[:-1] + "+00:00"
+    return datetime.fromisoformat(dt)
+
+
+def add_months(dt: datetime, months: int) -> datetime:
+    """
+    Shifts a datetime by a number of calendar months.
+
+    The day is clamped to the last day of the target month when needed.
+
+    :param dt: The datetime to shift.
+    :type dt: datetime
+    :param months: The number of months to shift, which may be negative.
+    :type months: int
+    :return: The shifted datetime.
+    :rtype: datetime
+    """
+    month_index = dt.month - 1 + months
+    year = dt.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(dt.day, calendar.monthrange(year, month)[1])
+    return dt.replace(year=year, month=month, day=day)
+
+
+def shift_datetime(dt: datetime, step: Union[timedelta, TimeTrunc]) -> datetime:
+    """
+    Shifts a datetime forward by a fixed duration or by one TimeTrunc period.
+
+    :param dt: The datetime to shift.
+    :type dt: datetime
+    :param step: A fixed duration, or a TimeTrunc level whose period is used.
+    :type step: Union[timedelta, TimeTrunc]
+    :return: The shifted datetime.
+    :rtype: datetime
+    """
+    if isinstance(step, timedelta):
+        return dt + step
+    if step == TimeTrunc.MONTH:
+        return add_months(dt, 1)
+    if step == TimeTrunc.YEAR:
+        return add_months(dt, 12)
+    return dt + TIME_TRUNC_STEPS[step]
+
+
+def split_date_range(
+    start: datetime, end: datetime, step: Union[timedelta, TimeTrunc]
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Splits an inclusive date range into consecutive, non-overlapping windows.
+
+    Every window starts where the previous one ended and ends one second
+    before the next one starts, since the ESIOS API treats both ends of a
+    range as inclusive. The last window is cut at `end`.
+
+    :param start: The start of the range.
+    :type start: datetime
+    :param end: The end of the range, included in the last window.
+    :type end: datetime
+    :param step: The size of every window, either as a fixed duration or as
+                 a TimeTrunc level (e.g. `TimeTrunc.MONTH` for calendar months).
+    :type step: Union[timedelta, TimeTrunc]
+    :raises ValueError: If `step` is shorter than one minute.
+    :return: The list of `(window_start, window_end)` pairs.
+    :rtype: List[Tuple[datetime, datetime]]
+    """
+    if isinstance(step, timedelta) and step < timedelta(minutes=1):
+        raise ValueError("The window size must be at least one minute.")
+
+    windows = []
+    window_start = start
+    while window_start <= end:
+        next_start = shift_datetime(window_start, step)
+        windows.append((window_start, min(next_start - timedelta(seconds=1), end)))
+        window_start = next_start
+
+    return windows
+
+
+def estimate_window(
+    max_rows: int,
+    time_trunc: Optional[TimeTrunc] = None,
+    n_series: int = 1,
+) -> Union[timedelta, TimeTrunc]:
+    """
+    Estimates a window size that keeps every response under a number of rows.
+
+    The estimate assumes one row per `time_trunc` period and series. When no
+    `time_trunc` is given, the finest level (five minutes) is assumed. Windows
+    of one day or more are rounded down to whole days, so that they stay
+    aligned with daily periods.
+
+    :param max_rows: The maximum number of rows wanted per response.
+    :type max_rows: int
+    :param time_trunc: The time truncation level of the data, defaults to None.
+    :type time_trunc: Optional[TimeTrunc], optional
+    :param n_series: The number of series (e.g. geographical IDs) returned for
+                     every period, defaults to 1.
+    :type n_series: int, optional
+    :raises ValueError: If `max_rows` is not positive.
+    :return: The estimated window size.
+    :rtype: Union[timedelta, TimeTrunc]
+    """
+    if max_rows < 1:
+        raise ValueError("The maximum number of rows must be positive.")
+
+    if time_trunc in (TimeTrunc.MONTH, TimeTrunc.YEAR):
+        return TimeTrunc.YEAR
+
+    step = TIME_TRUNC_STEPS[time_trunc or TimeTrunc.FIVE_MINUTES]
+    window = step * max(1, max_rows // max(1, n_series))
+    if window >= timedelta(days=1):
+        window = timedelta(days=window.days)
+
+    return window
@@ -0,0 +1,202 @@
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+from zipfile import BadZipFile, ZipFile
+
+from esiosapy.utils.zip_utils import recursive_unzip
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (?:(\d+)-\d+|\*)/(\d+|\*)")
+
+
+class IncompleteDownloadError(IOError):
+    """
+    Raised when a download ends before the whole file has been received.
+
+    The partial file is kept, so the download can be resumed later.
+    """
+
+
+def part_path_for(path: Path) -> Path:
+    """
+    Returns the path of the temporary file a download is written to.
+
+    :param path: The final path of the downloaded file.
+    :type path: Path
+    :return: The path of the `.part` file next to it.
+    :rtype: Path
+    """
+    return path.with_name(f"{path.name}.part")
+
+
+def range_headers(part_path: Path) -> Tuple[int, Dict[str, str]]:
+    """
+    Builds the headers needed to resume a partial download.
+
+    :param part_path: The path of the partial file.
+    :type part_path: Path
+    :return: The number of bytes already downloaded, and the `Range` header
+             requesting the rest of the file (empty if nothing was downloaded).
+    :rtype: Tuple[int, Dict[str, str]]
+    """
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    if offset == 0:
+        return 0, {}
+    return offset, {"Range": f"bytes={offset}-"}
+
+
+def parse_content_range(
+    headers: Mapping[str, str],
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Parses the `Content-Range` header of a partial response.
+
+    :param headers: The headers of the response.
+    :type headers: Mapping[str, str]
+    :return: The offset of the first byte sent and the total size of the file,
+             each of them None if unknown.
+    :rtype: Tuple[Optional[int], Optional[int]]
+    """
+    match = _CONTENT_RANGE_RE.match(headers.get("Content-Range", ""))
+    if match is None:
+        return None, None
+
+    start, total = match.groups()
+    return (
+        int(start) if start is not None else None,
+        int(total) if total != "*" else None,
+    )
+
+
+def expected_size(
+    status_code: int, headers: Mapping[str, str], offset: int
+) -> Tuple[bool, Optional[int]]:
+    """
+    Decides how to write a download response and how big the file should be.
+
+    A `206 Partial Content` response starting at `offset` is appended to the
+    partial file. Any other successful response carries the whole file, so the
+    partial file must be overwritten.
+
+    :param status_code: The HTTP status code of the response.
+    :type status_code: int
+    :param headers: The headers of the response.
+    :type headers: Mapping[str, str]
+    :param offset: The number of bytes already downloaded.
+    :type offset: int
+    :return: Whether to append to the partial file, and the expected final size
+             of the file, if known.
+    :rtype: Tuple[bool, Optional[int]]
+    """
+    if status_code == 206:
+        start, total = parse_content_range(headers)
+        if start == offset:
+            return True, total
+
+    content_length = headers.get("Content-Length")
+    return False, int(content_length) if content_length is not None else None
+
+
+def verify_download(part_path: Path, total: Optional[int]) -> None:
+    """
+    Checks that a partial file holds the whole download.
+
+    :param part_path: The path of the partial file.
+    :type part_path: Path
+    :param total: The expected size of the file, or None if unknown.
+    :type total: Optional[int]
+    :raises IncompleteDownloadError: If the file is smaller or bigger than
+                                     expected.
+    """
+    size = part_path.stat().st_size
+    if total is not None and size != total:
+        raise IncompleteDownloadError(
+            f"Downloaded {size} bytes of {part_path.name}, expected {total}."
+        )
+
+
+def is_valid_zip(zip_path: Path) -> bool:
+    """
+    Checks that a ZIP file can be read and that the CRC of every member matches.
+
+    :param zip_path: The path of the ZIP file.
+    :type zip_path: Path
+    :return: True if the file is a valid ZIP file.
+    :rtype: bool
+    """
+    try:
+        with ZipFile(zip_path) as zip_file:
+            return zip_file.testzip() is None
+    except (BadZipFile, OSError):
+        return False
+
+
+def has_zip_directory(zip_path: Path) -> bool:
+    """
+    Checks that a ZIP file exists and that its central directory can be read.
+
+    Unlike `is_valid_zip`, member contents are not read, so the check is cheap
+    whatever the size of the file. It is meant for files that were already
+    verified by `finish_download` when they were downloaded.
+
+    :param zip_path: The path of the ZIP file.
+    :type zip_path: Path
+    :return: True if the file is present and its central directory opens.
+    :rtype: bool
+    """
+    try:
+        with ZipFile(zip_path):
+            return True
+    except (BadZipFile, OSError):
+        return False
+
+
+def finish_download(part_path: Path, path: Path, total: Optional[int]) -> None:
+    """
+    Verifies a complete partial file and atomically moves it to its final path.
+
+    ZIP files are also checked for corruption; a corrupted file is deleted, so
+    the next attempt downloads it from scratch.
+
+    :param part_path: The path of the partial file.
+    :type part_path: Path
+    :param path: The final path of the downloaded file.
+    :type path: Path
+    :param total: The expected size of the file, or None if unknown.
+    :type total: Optional[int]
+    :raises IncompleteDownloadError: If the file is not complete.
+    :raises BadZipFile: If a ZIP file is corrupted.
+    """
+    verify_download(part_path, total)
+
+    if path.suffix == ".zip" and not is_valid_zip(part_path):
+        part_path.unlink()
+        raise BadZipFile(f"The downloaded file {path.name} is corrupted.")
+
+    os.replace(part_path, path)
+
+
+def extract_archive(zip_path: Path, extract_path: Path, remove_zip: bool) -> None:
+    """
+    Recursively unzips a downloaded archive, atomically.
+
+    The archive is extracted to a temporary directory that is only renamed to
+    `extract_path` once complete, so an existing `extract_path` always holds a
+    complete extraction. A previous extraction is replaced.
+
+    :param zip_path: The path of the ZIP file.
+    :type zip_path: Path
+    :param extract_path: The directory where the archive is extracted.
+    :type extract_path: Path
+    :param remove_zip: Whether to remove the ZIP file after unzipping.
+    :type remove_zip: bool
+    """
+    tmp_path = part_path_for(extract_path)
+    if tmp_path.exists():
+        shutil.rmtree(tmp_path)
+
+    recursive_unzip(zip_path, tmp_path, remove=remove_zip)
+    if extract_path.exists():
+        shutil.rmtree(extract_path)
+    os.replace(tmp_path, extract_path)
@@ -0,0 +1,184 @@
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from esiosapy.models.indicator.export_format import ExportFormat
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.columnar import values_to_arrow
+from esiosapy.utils.date_utils import shift_datetime
+
+_PARTITION_FORMATS = {
+    TimeTrunc.DAY: "%Y-%m-%d",
+    TimeTrunc.MONTH: "%Y-%m",
+    TimeTrunc.YEAR: "%Y",
+}
+_SUFFIXES = {ExportFormat.PARQUET: ".parquet", ExportFormat.ARROW: ".arrows"}
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow as pa  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "The `pyarrow` package is required to export values. "
+            "Install it with 'pip install pyarrow' "
+            "or with your preferred package manager."
+        ) from None
+    return pa
+
+
+def check_partition_by(partition_by: TimeTrunc) -> None:
+    """
+    Checks that a TimeTrunc level can be used to partition exported files.
+
+    :param partition_by: The requested partitioning level.
+    :type partition_by: TimeTrunc
+    :raises ValueError: If the level is shorter than a day.
+    """
+    if partition_by not in _PARTITION_FORMATS:
+        raise ValueError("Exports can only be partitioned by day, month or year.")
+
+
+def partition_key(dt: Union[date, datetime], partition_by: TimeTrunc) -> str:
+    """
+    Returns the name of the partition holding a date, e.g. `2021-01` for
+    monthly partitions.
+
+    :param dt: The date.
+    :type dt: Union[date, datetime]
+    :param partition_by: The partitioning level: day, month or year.
+    :type partition_by: TimeTrunc
+    :raises ValueError: If the level is shorter than a day.
+    :return: The name of the partition.
+    :rtype: str
+    """
+    check_partition_by(partition_by)
+    return dt.strftime(_PARTITION_FORMATS[partition_by])
+
+
+def split_by_partition(
+    start: datetime, end: datetime, partition_by: TimeTrunc
+) -> List[Tuple[str, datetime, datetime]]:
+    """
+    Splits an inclusive date range at the calendar boundaries of partitions.
+
+    Unlike `split_date_range`, windows are aligned on calendar days, months or
+    years, so the first and last ones may be shorter.
+
+    :param start: The start of the range.
+    :type start: datetime
+    :param end: The end of the range, included in the last partition.
+    :type end: datetime
+    :param partition_by: The partitioning level: day, month or year.
+    :type partition_by: TimeTrunc
+    :raises ValueError: If the level is shorter than a day.
+    :return: The list of `(partition_key, partition_start, partition_end)`
+             triples.
+    :rtype: List[Tuple[str, datetime, datetime]]
+    """
+    check_partition_by(partition_by)
+
+    partitions = []
+    partition_start = start
+    while partition_start <= end:
+        period_start = datetime.combine(
+            partition_start.date(), time(), tzinfo=partition_start.tzinfo
+        )
+        if partition_by in (TimeTrunc.MONTH, TimeTrunc.YEAR):
+            period_start = period_start.replace(day=1)
+        if partition_by == TimeTrunc.YEAR:
+            period_start = period_start.replace(month=1)
+        next_start = shift_datetime(period_start, partition_by)
+        partitions.append(
+            (
+                partition_key(partition_start, partition_by),
+                partition_start,
+                min(next_start - timedelta(seconds=1), end),
+            )
+        )
+        partition_start = next_start
+
+    return partitions
+
+
+class _Writer:
+    """
+    Appends tables to a Parquet or Arrow IPC stream file.
+    """
+
+    def __init__(self, path: Path, schema: Any, export_format: ExportFormat):
+        pa = _import_pyarrow()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if export_format == ExportFormat.PARQUET:
+            import pyarrow.parquet as pq  # type: ignore
+
+            self._writer = pq.ParquetWriter(str(path), schema)
+        else:
+            # The IPC file format requires a single dictionary per column for
+            # the whole file, whereas every batch has its own.
+            self._writer = pa.ipc.new_stream(str(path), schema)
+
+    def write(self, table: Any) -> None:
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def write_values(
+    batches: Iterable[Tuple[Optional[str], List[Dict[str, Any]]]],
+    path: Union[str, Path],
+    export_format: ExportFormat = ExportFormat.PARQUET,
+) -> int:
+    """
+    Writes batches of indicator values to Parquet or Arrow IPC files, as they
+    arrive.
+
+    Every batch is converted with `values_to_arrow`, so `datetime_utc` is a UTC
+    timestamp and `geo_id` and `geo_name` are dictionary encoded, and is
+    appended to its file as a Parquet row group or an Arrow record batch. Only
+    one batch is held in memory at a time.
+
+    Batches without a partition key are written to `path` itself. Otherwise
+    `path` is a directory, and every partition is written to its own file named
+    after the key (e.g. `2021-01.parquet`). The batches of a partition must be
+    consecutive, as its file is closed when the next partition starts.
+
+    :param batches: The `(partition_key, values)` pairs to write, in order.
+    :type batches: Iterable[Tuple[Optional[str], List[Dict[str, Any]]]]
+    :param path: The path of the file, or of the directory of partitions. Files
+                 are overwritten.
+    :type path: Union[str, Path]
+    :param export_format: The format of the files, defaults to
+                          ExportFormat.PARQUET.
+    :type export_format: ExportFormat, optional
+    :raises ImportError: If `pyarrow` is not installed.
+    :return: The number of values written.
+    :rtype: int
+    """
+    _import_pyarrow()
+    path = Path(path)
+    schema = values_to_arrow([]).schema
+
+    writer: Optional[_Writer] = None
+    current_key: Optional[str] = None
+    written = 0
+    try:
+        for key, values in batches:
+            if writer is None or key != current_key:
+                if writer is not None:
+                    writer.close()
+                file_path = (
+                    path if key is None else path / f"{key}{_SUFFIXES[export_format]}"
+                )
+                writer = _Writer(file_path, schema, export_format)
+                current_key = key
+            if values:
+                writer.write(values_to_arrow(values))
+                written += len(values)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return written
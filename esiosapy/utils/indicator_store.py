@@ -0,0 +1,262 @@
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.date_utils import parse_datetime
+
+MISSING_GEO_ID = -1
+"""The geographical ID under which values without one are stored."""
+
+_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _utc_key(value: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns the UTC timestamp of a value, normalized so that keys sort in time.
+
+    :param value: A value of an indicator, as returned by the API.
+    :type value: Dict[str, Any]
+    :return: The UTC timestamp as `YYYY-MM-DDTHH:MM:SSZ`, or None if the value
+             has no datetime.
+    :rtype: Optional[str]
+    """
+    dt = value.get("datetime_utc") or value.get("datetime")
+    if dt is None:
+        return None
+    parsed = parse_datetime(dt)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime(_UTC_FORMAT)
+
+
+class IndicatorStore:
+    """
+    A local time-series store for indicator values, backed by a SQLite database.
+
+    Values are stored per indicator, geographical ID and time truncation level,
+    keyed on their UTC datetime, so storing a value again replaces it. For every
+    such series the store also keeps a high-water mark: the latest UTC datetime
+    stored so far, from which incremental syncs resume.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initializes the IndicatorStore, creating its database if needed.
+
+        :param path: The path of the SQLite database file.
+        :type path: Union[str, Path]
+        """
+        self.path = Path(path)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS indicator_values ("
+                "indicator_id INTEGER NOT NULL, "
+                "geo_id INTEGER NOT NULL, "
+                "time_trunc TEXT NOT NULL, "
+                "datetime_utc TEXT NOT NULL, "
+                "value REAL, "
+                "data TEXT NOT NULL, "
+                "PRIMARY KEY (indicator_id, geo_id, time_trunc, datetime_utc))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS high_water_marks ("
+                "indicator_id INTEGER NOT NULL, "
+                "geo_id INTEGER NOT NULL, "
+                "time_trunc TEXT NOT NULL, "
+                "datetime_utc TEXT NOT NULL, "
+                "synced_at REAL NOT NULL, "
+                "PRIMARY KEY (indicator_id, geo_id, time_trunc))"
+            )
+
+    @staticmethod
+    def _trunc_key(time_trunc: Optional[TimeTrunc]) -> str:
+        """
+        Returns the key of a time truncation level, an empty string for none.
+
+        :param time_trunc: The time truncation level.
+        :type time_trunc: Optional[TimeTrunc]
+        :return: The key stored in the database.
+        :rtype: str
+        """
+        return time_trunc.value if time_trunc else ""
+
+    def high_water_mark(
+        self,
+        indicator_id: int,
+        time_trunc: Optional[TimeTrunc] = None,
+        geo_ids: Optional[Iterable[int]] = None,
+    ) -> Optional[datetime]:
+        """
+        Returns the high-water mark of an indicator.
+
+        When the indicator has many geographical series, the earliest of their
+        high-water marks is returned, so that resuming from it misses no series.
+        If one of the requested series has nothing stored yet, there is no
+        high-water mark.
+
+        :param indicator_id: The ID of the indicator.
+        :type indicator_id: int
+        :param time_trunc: The time truncation level of the series, defaults to
+                           None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :param geo_ids: The geographical IDs to consider, defaults to all the
+                        stored ones.
+        :type geo_ids: Optional[Iterable[int]], optional
+        :return: The latest stored UTC datetime, as an aware datetime, or None if
+                 nothing is stored yet.
+        :rtype: Optional[datetime]
+        """
+        query = (
+            "SELECT COUNT(*), MIN(datetime_utc) FROM high_water_marks "
+            "WHERE indicator_id = ? AND time_trunc = ?"
+        )
+        args: List[Any] = [indicator_id, self._trunc_key(time_trunc)]
+        expected = None
+        if geo_ids is not None:
+            geo_ids = set(geo_ids)
+            expected = len(geo_ids)
+            query += f" AND geo_id IN ({', '.join('?' * len(geo_ids))})"
+            args.extend(geo_ids)
+
+        with self._lock:
+            count, mark = self._connection.execute(query, args).fetchone()
+
+        if mark is None or (expected is not None and count < expected):
+            return None
+        return datetime.strptime(mark, _UTC_FORMAT).replace(tzinfo=timezone.utc)
+
+    def upsert_values(
+        self,
+        indicator_id: int,
+        values: Iterable[Dict[str, Any]],
+        time_trunc: Optional[TimeTrunc] = None,
+    ) -> int:
+        """
+        Stores indicator values, replacing the ones already stored for the same
+        datetimes, and moves the high-water marks forward.
+
+        Values without any datetime are ignored.
+
+        :param indicator_id: The ID of the indicator.
+        :type indicator_id: int
+        :param values: The values, as returned by the API.
+        :type values: Iterable[Dict[str, Any]]
+        :param time_trunc: The time truncation level the values were requested
+                           with, defaults to None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :return: The number of stored values.
+        :rtype: int
+        """
+        trunc_key = self._trunc_key(time_trunc)
+        rows = []
+        marks: Dict[int, str] = {}
+        for value in values:
+            dt = _utc_key(value)
+            if dt is None:
+                continue
+            geo_id = value.get("geo_id", MISSING_GEO_ID)
+            rows.append(
+                (
+                    indicator_id,
+                    geo_id,
+                    trunc_key,
+                    dt,
+                    value.get("value"),
+                    json.dumps(value),
+                )
+            )
+            marks[geo_id] = max(dt, marks.get(geo_id, dt))
+
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO indicator_values VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.executemany(
+                "INSERT INTO high_water_marks VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (indicator_id, geo_id, time_trunc) DO UPDATE SET "
+                "datetime_utc = MAX(datetime_utc, excluded.datetime_utc), "
+                "synced_at = excluded.synced_at",
+                [
+                    (indicator_id, geo_id, trunc_key, mark, now)
+                    for geo_id, mark in marks.items()
+                ],
+            )
+
+        return len(rows)
+
+    def get_values(
+        self,
+        indicator_id: int,
+        time_trunc: Optional[TimeTrunc] = None,
+        target_dt_start: Optional[Union[datetime, str]] = None,
+        target_dt_end: Optional[Union[datetime, str]] = None,
+        geo_ids: Optional[Iterable[int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the stored values of an indicator, in chronological order.
+
+        :param indicator_id: The ID of the indicator.
+        :type indicator_id: int
+        :param time_trunc: The time truncation level of the series, defaults to
+                           None.
+        :type time_trunc: Optional[TimeTrunc], optional
+        :param target_dt_start: The earliest UTC datetime returned, included.
+                                Naive datetimes are taken as UTC. Defaults to
+                                None.
+        :type target_dt_start: Optional[Union[datetime, str]], optional
+        :param target_dt_end: The latest UTC datetime returned, included. Naive
+                              datetimes are taken as UTC. Defaults to None.
+        :type target_dt_end: Optional[Union[datetime, str]], optional
+        :param geo_ids: The geographical IDs to return, defaults to all of them.
+        :type geo_ids: Optional[Iterable[int]], optional
+        :return: The values, as they were returned by the API.
+        :rtype: List[Dict[str, Any]]
+        """
+        query = (
+            "SELECT data FROM indicator_values "
+            "WHERE indicator_id = ? AND time_trunc = ?"
+        )
+        args: List[Any] = [indicator_id, self._trunc_key(time_trunc)]
+        if target_dt_start is not None:
+            query += " AND datetime_utc >= ?"
+            args.append(_utc_key({"datetime_utc": target_dt_start}))
+        if target_dt_end is not None:
+            query += " AND datetime_utc <= ?"
+            args.append(_utc_key({"datetime_utc": target_dt_end}))
+        if geo_ids is not None:
+            geo_ids = list(geo_ids)
+            query += f" AND geo_id IN ({', '.join('?' * len(geo_ids))})"
+            args.extend(geo_ids)
+        query += " ORDER BY datetime_utc, geo_id"
+
+        with self._lock:
+            rows = self._connection.execute(query, args).fetchall()
+
+        return [json.loads(data) for (data,) in rows]
+
+    def clear(self) -> None:
+        """
+        Removes every stored value and high-water mark.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM indicator_values")
+            self._connection.execute("DELETE FROM high_water_marks")
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,363 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+CACHE_HIT = "hit"
+"""The response was served from the cache, without any request."""
+
+CACHE_REVALIDATED = "revalidated"
+"""The cached response was revalidated with a conditional request."""
+
+CACHE_MISS = "miss"
+"""The response was not cached, or had changed, and was downloaded."""
+
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_of(path: str) -> str:
+    """
+    Returns the endpoint of a request path, with its numeric IDs replaced by
+    `{id}`, so that requests to different objects are aggregated together.
+
+    :param path: The path of the request, e.g. `/indicators/600`.
+    :type path: str
+    :return: The endpoint, e.g. `/indicators/{id}`.
+    :rtype: str
+    """
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+@dataclass
+class RequestEvent:
+    """
+    Describes a request made through a RequestHelper, as seen by the hooks.
+
+    The same event is passed to every hook of a request, and is completed as the
+    request progresses: the outcome fields are only set once it is over.
+    """
+
+    url: str
+    """The full URL of the request, without its query parameters.
+
+    :type: str
+    """
+
+    path: str
+    """The path of the request URL.
+
+    :type: str
+    """
+
+    params: Mapping[str, Any] = field(default_factory=dict)
+    """The query parameters of the request.
+
+    :type: Mapping[str, Any]
+    """
+
+    attempts: int = 0
+    """The number of attempts made so far. Zero for responses served from the
+    cache.
+
+    :type: int
+    """
+
+    status_code: Optional[int] = None
+    """The status code of the last response, or None if none was received.
+
+    :type: Optional[int]
+    """
+
+    bytes_received: Optional[int] = None
+    """The size of the body downloaded from the API, or None if unknown (streamed
+    responses without a `Content-Length` header).
+
+    :type: Optional[int]
+    """
+
+    elapsed: float = 0.0
+    """The time spent on the request, retries and cache lookups included, in
+    seconds.
+
+    :type: float
+    """
+
+    cache: Optional[str] = None
+    """CACHE_HIT, CACHE_REVALIDATED or CACHE_MISS if the request went through a
+    response cache, None otherwise.
+
+    :type: Optional[str]
+    """
+
+    error: Optional[BaseException] = None
+    """The error the request failed with, if any.
+
+    :type: Optional[BaseException]
+    """
+
+    @property
+    def endpoint(self) -> str:
+        """
+        The endpoint of the request, with its numeric IDs replaced by `{id}`.
+
+        :return: The endpoint of the request.
+        :rtype: str
+        """
+        return endpoint_of(self.path)
+
+    @property
+    def retries(self) -> int:
+        """
+        The number of attempts made after the first one.
+
+        :return: The number of retries.
+        :rtype: int
+        """
+        return max(0, self.attempts - 1)
+
+
+class RequestHook:
+    """
+    The base class of request hooks.
+
+    Hooks are called by RequestHelper around every request made through
+    `get_request`, so requests can be logged, traced or measured without
+    patching the HTTP library. Subclasses override the methods they need; the
+    default ones do nothing. Hooks are called from the threads making the
+    requests, so they must be thread-safe.
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        """
+        Called before a request is made, or looked up in the cache.
+
+        :param event: The request, with no outcome yet.
+        :type event: RequestEvent
+        """
+
+    def on_retry(self, event: RequestEvent, delay: float) -> None:
+        """
+        Called when an attempt failed and is about to be retried.
+
+        :param event: The request, with the status code or the error of the
+                      failed attempt.
+        :type event: RequestEvent
+        :param delay: The number of seconds waited before the next attempt.
+        :type delay: float
+        """
+
+    def after_request(self, event: RequestEvent) -> None:
+        """
+        Called once a request is over, whether it succeeded or failed.
+
+        :param event: The complete request.
+        :type event: RequestEvent
+        """
+
+
+class _EndpointMetrics:
+    """
+    The metrics aggregated for one endpoint by a MetricsCollector.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (len(buckets) + 1)
+        self.statuses: Dict[str, int] = {}
+        self.cache: Dict[str, int] = {}
+
+
+class MetricsCollector(RequestHook):
+    """
+    A request hook aggregating latency histograms and throughput per endpoint.
+
+    The metrics can be read as a dictionary with `snapshot`, or exported in the
+    Prometheus text exposition format with `to_prometheus`, to profile ingestion
+    jobs or to be served by a metrics endpoint.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initializes the MetricsCollector.
+
+        :param buckets: The upper bounds of the latency histogram buckets, in
+                        seconds, defaults to DEFAULT_LATENCY_BUCKETS.
+        :type buckets: Sequence[float], optional
+        """
+        self.buckets = tuple(sorted(buckets))
+
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointMetrics] = {}
+        self._started_at = time.monotonic()
+
+    def after_request(self, event: RequestEvent) -> None:
+        """
+        Records a finished request.
+
+        :param event: The complete request.
+        :type event: RequestEvent
+        """
+        status = str(event.status_code) if event.status_code is not None else "error"
+        bucket = bisect_left(self.buckets, event.elapsed)
+
+        with self._lock:
+            metrics = self._endpoints.get(event.endpoint)
+            if metrics is None:
+                metrics = self._endpoints[event.endpoint] = _EndpointMetrics(
+                    self.buckets
+                )
+            metrics.requests += 1
+            metrics.errors += event.error is not None
+            metrics.retries += event.retries
+            metrics.bytes_received += event.bytes_received or 0
+            metrics.latency_sum += event.elapsed
+            metrics.latency_buckets[bucket] += 1
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            if event.cache is not None:
+                metrics.cache[event.cache] = metrics.cache.get(event.cache, 0) + 1
+
+    def reset(self) -> None:
+        """
+        Discards every recorded request and restarts the throughput clock.
+        """
+        with self._lock:
+            self._endpoints.clear()
+            self._started_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the metrics recorded so far.
+
+        Throughputs are averaged since the collector was created or reset.
+        Histogram buckets are cumulative, as in Prometheus, and keyed by their
+        upper bound.
+
+        :return: A dictionary with the `elapsed` time in seconds and the
+                 metrics of every `endpoints`.
+        :rtype: Dict[str, Any]
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._started_at
+            endpoints = {}
+            for endpoint, metrics in sorted(self._endpoints.items()):
+                endpoints[endpoint] = {
+                    "requests": metrics.requests,
+                    "errors": metrics.errors,
+                    "retries": metrics.retries,
+                    "bytes_received": metrics.bytes_received,
+                    "statuses": dict(metrics.statuses),
+                    "cache": dict(metrics.cache),
+                    "latency": {
+                        "sum": metrics.latency_sum,
+                        "mean": metrics.latency_sum / metrics.requests,
+                        "buckets": dict(
+                            zip(
+                                (*self.buckets, float("inf")),
+                                accumulate(metrics.latency_buckets),
+                            )
+                        ),
+                    },
+                    "requests_per_second": metrics.requests / elapsed,
+                    "bytes_per_second": metrics.bytes_received / elapsed,
+                }
+
+        return {"elapsed": elapsed, "endpoints": endpoints}
+
+    def to_prometheus(self, prefix: str = "esiosapy") -> str:
+        """
+        Exports the metrics in the Prometheus text exposition format.
+
+        :param prefix: The prefix of the metric names, defaults to "esiosapy".
+        :type prefix: str, optional
+        :return: The metrics, one sample per line.
+        :rtype: str
+        """
+        snapshot = self.snapshot()["endpoints"]
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        name = metric(
+            "request_duration_seconds", "histogram", "Latency of the API requests."
+        )
+        for endpoint, metrics in snapshot.items():
+            latency = metrics["latency"]
+            for bound, count in latency["buckets"].items():
+                labels = _labels(endpoint=endpoint, le=_format_bound(bound))
+                lines.append(f"{name}_bucket{labels} {count}")
+            labels = _labels(endpoint=endpoint)
+            lines.append(f"{name}_sum{labels} {latency['sum']}")
+            lines.append(f"{name}_count{labels} {metrics['requests']}")
+
+        name = metric("requests_total", "counter", "Number of API requests.")
+        for endpoint, metrics in snapshot.items():
+            for status, count in sorted(metrics["statuses"].items()):
+                lines.append(
+                    f"{name}{_labels(endpoint=endpoint, status=status)} {count}"
+                )
+
+        counters: Sequence[Tuple[str, str, str]] = (
+            ("request_errors_total", "errors", "Number of failed API requests."),
+            ("request_retries_total", "retries", "Number of retried attempts."),
+            (
+                "response_bytes_total",
+                "bytes_received",
+                "Bytes of response bodies downloaded from the API.",
+            ),
+        )
+        for metric_name, key, help_text in counters:
+            name = metric(metric_name, "counter", help_text)
+            for endpoint, metrics in snapshot.items():
+                lines.append(f"{name}{_labels(endpoint=endpoint)} {metrics[key]}")
+
+        name = metric(
+            "cache_requests_total", "counter", "Number of requests by cache outcome."
+        )
+        for endpoint, metrics in snapshot.items():
+            for result, count in sorted(metrics["cache"].items()):
+                lines.append(
+                    f"{name}{_labels(endpoint=endpoint, result=result)} {count}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    """
+    Formats a histogram bucket bound as Prometheus expects it.
+
+    :param bound: The upper bound of the bucket.
+    :type bound: float
+    :return: The bound, `+Inf` for the last bucket.
+    :rtype: str
+    """
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _labels(**labels: str) -> str:
+    """
+    Formats Prometheus labels, escaping their values.
+
+    :return: The labels, between braces.
+    :rtype: str
+    """
+    formatted = ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + formatted + "}"
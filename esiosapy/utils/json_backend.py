@@ -0,0 +1,361 @@
+import importlib.util
+import json
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from esiosapy.utils.columnar import values_to_columns
+
+JSON_BACKENDS = ("orjson", "msgspec", "ujson", "json")
+"""The supported JSON backends, in order of preference."""
+
+
+class JsonBackend:
+    """
+    Decodes JSON response bodies with the standard library `json` module.
+
+    Subclasses plug faster third-party decoders in. Every backend can also
+    return only a sub-tree of the document, given the keys leading to it.
+    """
+
+    name = "json"
+
+    def loads(self, content: bytes) -> Any:
+        """
+        Decodes a JSON document.
+
+        :param content: The UTF-8 encoded document.
+        :type content: bytes
+        :return: The decoded document.
+        :rtype: Any
+        """
+        return json.loads(content)
+
+    def loads_path(self, content: bytes, key_path: Sequence[str] = ()) -> Any:
+        """
+        Decodes a JSON document and returns the sub-tree found under `key_path`.
+
+        :param content: The UTF-8 encoded document.
+        :type content: bytes
+        :param key_path: The keys leading from the root object to the wanted
+                         sub-tree (e.g. `("indicator", "values")`). Defaults to
+                         the whole document.
+        :type key_path: Sequence[str], optional
+        :raises KeyError: If a key of `key_path` is missing.
+        :return: The decoded sub-tree.
+        :rtype: Any
+        """
+        data = self.loads(content)
+        for key in key_path:
+            data = data[key]
+        return data
+
+    def loads_columns(
+        self, content: bytes, key_path: Sequence[str] = ()
+    ) -> Dict[str, List[Any]]:
+        """
+        Decodes the indicator values found under `key_path` into columns.
+
+        :param content: The UTF-8 encoded document.
+        :type content: bytes
+        :param key_path: The keys leading from the root object to the array of
+                         values (e.g. `("indicator", "values")`). Defaults to
+                         the whole document.
+        :type key_path: Sequence[str], optional
+        :raises KeyError: If a key of `key_path` is missing.
+        :return: The columns, as returned by `values_to_columns`.
+        :rtype: Dict[str, List[Any]]
+        """
+        return values_to_columns(self.loads_path(content, key_path))
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    Decodes JSON response bodies with `orjson`.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson  # type: ignore[import-not-found, unused-ignore]
+
+        self._loads = orjson.loads
+
+    def loads(self, content: bytes) -> Any:
+        return self._loads(content)
+
+
+class UjsonBackend(JsonBackend):
+    """
+    Decodes JSON response bodies with `ujson`.
+    """
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson  # type: ignore[import-not-found, import-untyped, unused-ignore]
+
+        self._loads = ujson.loads
+
+    def loads(self, content: bytes) -> Any:
+        return self._loads(content)
+
+
+class MsgspecBackend(JsonBackend):
+    """
+    Decodes JSON response bodies with `msgspec`.
+
+    When only a sub-tree is wanted, the document is decoded against a schema
+    holding nothing but the keys of `key_path`, so every other field is skipped
+    by the parser instead of being turned into Python objects. Indicator values
+    wanted as columns are decoded into typed structs rather than dicts, and
+    their columns are filled straight from the struct fields.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore[import-not-found, unused-ignore]
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._path_decoders: Dict[Tuple[str, ...], Any] = {}
+        self._column_decoders: Dict[Tuple[str, ...], Any] = {}
+        fields: List[Any] = [
+            ("value", Optional[float], None),
+            ("datetime_utc", Optional[str], None),
+            ("datetime", Optional[str], None),
+            ("geo_id", int, -1),
+            ("geo_name", str, ""),
+        ]
+        value_row = msgspec.defstruct("_ValueRow", fields, gc=False)
+        self._value_rows: Any = List[value_row]  # type: ignore[valid-type]
+
+    def loads(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+    def loads_path(self, content: bytes, key_path: Sequence[str] = ()) -> Any:
+        if not key_path:
+            return self.loads(content)
+
+        try:
+            data = self._path_decoder(tuple(key_path)).decode(content)
+        except self._msgspec.ValidationError:
+            # The document does not have the expected shape; decode it whole so
+            # that the error raised is the same as with the other backends.
+            return super().loads_path(content, key_path)
+
+        for key in key_path:
+            data = getattr(data, key)
+        return data
+
+    def loads_columns(
+        self, content: bytes, key_path: Sequence[str] = ()
+    ) -> Dict[str, List[Any]]:
+        key_path = tuple(key_path)
+        decoder = self._column_decoders.get(key_path)
+        if decoder is None:
+            decoder = self._build_decoder(key_path, self._value_rows)
+            self._column_decoders[key_path] = decoder
+
+        try:
+            rows = decoder.decode(content)
+        except self._msgspec.ValidationError:
+            # Values with unexpected types (e.g. a `geo_id` of null) are
+            # converted from dicts, as with the other backends.
+            return super().loads_columns(content, key_path)
+
+        for key in key_path:
+            rows = getattr(rows, key)
+
+        datetime_utc: List[Optional[str]] = []
+        local_datetime: List[Optional[str]] = []
+        data: List[Optional[float]] = []
+        geo_ids: List[int] = []
+        geo_names: List[str] = []
+        for row in rows:
+            dt = row.datetime_utc
+            datetime_utc.append(dt[:-1] if dt is not None and dt.endswith("Z") else dt)
+            local_datetime.append(row.datetime)
+            data.append(row.value)
+            geo_ids.append(row.geo_id)
+            geo_names.append(row.geo_name)
+        return {
+            "datetime_utc": datetime_utc,
+            "value": data,
+            "geo_id": geo_ids,
+            "geo_name": geo_names,
+            "datetime": local_datetime,
+        }
+
+    def _path_decoder(self, key_path: Tuple[str, ...]) -> Any:
+        """
+        Returns a decoder that only keeps the sub-tree found under `key_path`,
+        building it on first use.
+
+        :param key_path: The keys leading to the wanted sub-tree.
+        :type key_path: Tuple[str, ...]
+        :return: A `msgspec.json.Decoder` for the nested schema.
+        :rtype: Any
+        """
+        decoder = self._path_decoders.get(key_path)
+        if decoder is None:
+            decoder = self._build_decoder(key_path, Any)
+            self._path_decoders[key_path] = decoder
+        return decoder
+
+    def _build_decoder(self, key_path: Tuple[str, ...], leaf: Any) -> Any:
+        """
+        Builds a decoder for a schema holding nothing but the keys of
+        `key_path`, with `leaf` as the type of the wanted sub-tree.
+
+        :param key_path: The keys leading to the wanted sub-tree.
+        :type key_path: Tuple[str, ...]
+        :param leaf: The type the sub-tree is decoded into.
+        :type leaf: Any
+        :return: A `msgspec.json.Decoder` for the nested schema.
+        :rtype: Any
+        """
+        schema = leaf
+        for depth, key in reversed(list(enumerate(key_path))):
+            schema = self._msgspec.defstruct(f"_Level{depth}", [(key, schema)])
+        return self._msgspec.json.Decoder(schema)
+
+
+_BACKEND_CLASSES = {
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+    "ujson": UjsonBackend,
+    "json": JsonBackend,
+}
+
+
+def get_json_backend(backend: Optional[Union[str, JsonBackend]] = None) -> JsonBackend:
+    """
+    Returns a JSON backend, by name or the fastest one installed.
+
+    :param backend: The name of the backend (one of JSON_BACKENDS), or a backend
+                    instance, which is returned untouched. If not provided, the
+                    first installed backend of JSON_BACKENDS is used, falling back
+                    to the standard library. Defaults to None.
+    :type backend: Optional[Union[str, JsonBackend]], optional
+    :raises ValueError: If the backend name is unknown.
+    :raises ImportError: If the requested backend is not installed.
+    :return: The JSON backend.
+    :rtype: JsonBackend
+    """
+    if isinstance(backend, JsonBackend):
+        return backend
+
+    if backend is not None:
+        if backend not in _BACKEND_CLASSES:
+            raise ValueError(
+                f"Unknown JSON backend {backend!r}, "
+                f"expected one of {', '.join(JSON_BACKENDS)}."
+            )
+        try:
+            return _BACKEND_CLASSES[backend]()
+        except ImportError:
+            raise ImportError(
+                f"The `{backend}` package is required to use it as JSON backend. "
+                f"Install it with 'pip install {backend}' "
+                "or with your preferred package manager."
+            ) from None
+
+    for name in JSON_BACKENDS:
+        try:
+            return _BACKEND_CLASSES[name]()
+        except ImportError:
+            continue
+    return JsonBackend()
+
+
+def incremental_decoding_available() -> bool:
+    """
+    Tells whether `ijson`, used to decode JSON documents incrementally, is installed.
+
+    :return: True if `iter_json_items` can be used.
+    :rtype: bool
+    """
+    return importlib.util.find_spec("ijson") is not None
+
+
+class _RecordingReader:
+    """
+    Wraps a binary file-like object, keeping a copy of what is read until told
+    to stop.
+    """
+
+    def __init__(self, source: Any):
+        self._source = source
+        self.chunks: Optional[List[bytes]] = []
+
+    def read(self, size: int = -1) -> bytes:
+        data: bytes = self._source.read(size)
+        if self.chunks is not None:
+            self.chunks.append(data)
+        return data
+
+    def stop(self) -> None:
+        self.chunks = None
+
+
+def iter_json_items(source: Any, key_path: Sequence[str] = ()) -> Iterator[Any]:
+    """
+    Lazily decodes the items of the JSON array found under `key_path`.
+
+    The document is read from `source` in small buffers, so only the item being
+    decoded is held in memory. Floating point numbers are returned as floats,
+    like the other backends do.
+
+    The bytes read are only kept until the first item is decoded. If there is
+    none, the document (typically an empty listing or an error body) is decoded
+    whole to tell an empty array from a missing one, so a wrong `key_path`
+    raises a KeyError, like `JsonBackend.loads_path` does.
+
+    :param source: A binary file-like object holding the UTF-8 encoded document.
+    :type source: Any
+    :param key_path: The keys leading from the root object to the array
+                     (e.g. `("indicator", "values")`). Defaults to the root.
+    :type key_path: Sequence[str], optional
+    :raises ImportError: If the `ijson` package is not installed.
+    :raises KeyError: While iterating, if a key of `key_path` is missing.
+    :return: An iterator over the decoded items.
+    :rtype: Iterator[Any]
+    """
+    try:
+        import ijson  # type: ignore[import-not-found, import-untyped, unused-ignore]
+    except ImportError:
+        raise ImportError(
+            "The `ijson` package is required to decode JSON documents incrementally. "
+            "Install it with 'pip install ijson' "
+            "or with your preferred package manager."
+        ) from None
+
+    reader = _RecordingReader(source)
+    prefix = ".".join([*key_path, "item"])
+    items: Iterator[Any] = ijson.items(reader, prefix, use_float=True)
+    return _check_items(items, reader, key_path)
+
+
+def _check_items(
+    items: Iterator[Any], reader: _RecordingReader, key_path: Sequence[str]
+) -> Iterator[Any]:
+    """
+    Yields the decoded items, checking that `key_path` exists if there is none.
+
+    :param items: The items decoded by `ijson`.
+    :type items: Iterator[Any]
+    :param reader: The reader the items are decoded from.
+    :type reader: _RecordingReader
+    :param key_path: The keys leading from the root object to the array.
+    :type key_path: Sequence[str]
+    :raises KeyError: If there is no item and a key of `key_path` is missing.
+    :return: An iterator over the decoded items.
+    :rtype: Iterator[Any]
+    """
+    for item in items:
+        if reader.chunks is not None:
+            reader.stop()
+        yield item
+
+    if reader.chunks is not None:
+        JsonBackend().loads_path(b"".join(reader.chunks), key_path)
@@ -0,0 +1,90 @@
+import dataclasses
+from datetime import date, datetime
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+DataclassT = TypeVar("DataclassT")
+
+
+def construct_trusted(
+    model_cls: Type[ModelT],
+    data: Dict[str, Any],
+    request_helper: Any,
+    keep_raw: bool = True,
+    **overrides: Any,
+) -> ModelT:
+    """
+    Builds a model from trusted API data, skipping pydantic validation.
+
+    The instance state is set directly, which is several times faster than both
+    validation and `model_construct`. Only the declared fields found in `data`
+    are set and their values are not coerced, so they must already have the
+    declared types; missing fields get their defaults. The source dictionary is
+    kept by reference as `raw` instead of being copied.
+
+    :param model_cls: The pydantic model to build.
+    :type model_cls: Type[ModelT]
+    :param data: The API data of the object.
+    :type data: Dict[str, Any]
+    :param request_helper: The request helper attached to the object.
+    :type request_helper: Any
+    :param keep_raw: Whether to keep `data` as the `raw` attribute, or an empty
+                     dictionary instead. Defaults to True.
+    :type keep_raw: bool, optional
+    :param overrides: Field values replacing the ones of `data`, e.g. already
+                      converted nested objects.
+    :type overrides: Any
+    :return: The model instance.
+    :rtype: ModelT
+    """
+    values: Dict[str, Any] = {}
+    for name, field in model_cls.model_fields.items():
+        if name in overrides:
+            values[name] = overrides[name]
+        elif name in data and name != "raw":
+            values[name] = data[name]
+        elif name != "raw" and not field.is_required():
+            values[name] = field.get_default(call_default_factory=True)
+    values["raw"] = data if keep_raw else {}
+
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(
+        instance, "__pydantic_private__", {"_request_helper": request_helper}
+    )
+    return instance
+
+
+def dataclass_from_dict(cls: Type[DataclassT], data: Dict[str, Any]) -> DataclassT:
+    """
+    Builds a dataclass from a dictionary, ignoring the keys it does not declare.
+
+    :param cls: The dataclass to build.
+    :type cls: Type[DataclassT]
+    :param data: The dictionary holding the field values.
+    :type data: Dict[str, Any]
+    :return: The dataclass instance.
+    :rtype: DataclassT
+    """
+    names = {field.name for field in dataclasses.fields(cls)}  # type: ignore[arg-type]
+    return cls(**{key: value for key, value in data.items() if key in names})
+
+
+def parse_date(value: Any) -> date:
+    """
+    Parses a date from an ISO 8601 date or datetime string.
+
+    :param value: The date, or its string representation.
+    :type value: Any
+    :return: The parsed date.
+    :rtype: date
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
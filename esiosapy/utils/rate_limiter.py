@@ -0,0 +1,256 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+DEFAULT_RATE_LIMIT_KEY = "default"
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_DECREASE_COOLDOWN = 1.0
+
+
+def is_overload_status(status_code: Optional[int]) -> bool:
+    """
+    Tells whether a response status means that the server is overloaded.
+
+    :param status_code: The status code of the response, or None if no response
+                        was received.
+    :type status_code: Optional[int]
+    :return: True for `429 Too Many Requests`, server errors and failed requests.
+    :rtype: bool
+    """
+    return status_code is None or status_code == 429 or status_code >= 500
+
+
+class RateLimiter:
+    """
+    A token bucket limiting the rate of requests.
+
+    The bucket refills at `rate` tokens per second and holds up to `burst`
+    tokens, so short bursts are allowed while the long-term rate is capped. It
+    is thread-safe, so it can be shared by every manager of a client, or by
+    several clients. If a path is given, the bucket state is kept in a SQLite
+    database instead, so it is also shared between processes using the same
+    file (e.g. several workers sharing one API token).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        path: Optional[Union[str, Path]] = None,
+        key: str = DEFAULT_RATE_LIMIT_KEY,
+    ):
+        """
+        Initializes the RateLimiter.
+
+        :param rate: The sustained number of requests allowed per second.
+        :type rate: float
+        :param burst: The number of requests that can be made at once after an
+                      idle period, defaults to 1.
+        :type burst: int, optional
+        :param path: The path of a SQLite database holding the bucket, to share
+                     it between processes. Defaults to None.
+        :type path: Optional[Union[str, Path]], optional
+        :param key: The name of the bucket in the database, so that one file can
+                    hold the buckets of many tokens. Defaults to
+                    DEFAULT_RATE_LIMIT_KEY.
+        :type key: str, optional
+        :raises ValueError: If `rate` or `burst` is not positive.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("The rate and the burst must be positive.")
+
+        self.rate = rate
+        self.burst = burst
+        self.path = Path(path) if path is not None else None
+        self.key = key
+
+        self._lock = threading.Lock()
+        self._tat = 0.0
+        self._connection: Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            self._connection = sqlite3.connect(
+                str(self.path),
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits "
+                "(key TEXT PRIMARY KEY, tat REAL NOT NULL)"
+            )
+
+    def reserve(self) -> float:
+        """
+        Takes a token from the bucket, borrowing it from the future if empty.
+
+        The bucket is tracked as the theoretical arrival time of the next
+        request: every request pushes it `1 / rate` seconds further, and a
+        request may go as soon as it is less than `burst` intervals ahead.
+
+        :return: The number of seconds to wait before making the request.
+        :rtype: float
+        """
+        interval = 1.0 / self.rate
+        tolerance = (self.burst - 1) * interval
+
+        with self._lock:
+            now = time.time()
+            if self._connection is None:
+                tat = max(self._tat, now)
+                self._tat = tat + interval
+                return max(0.0, tat - tolerance - now)
+
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT tat FROM rate_limits WHERE key = ?", (self.key,)
+                ).fetchone()
+                tat = max(row[0] if row else 0.0, now)
+                connection.execute(
+                    "INSERT OR REPLACE INTO rate_limits VALUES (?, ?)",
+                    (self.key, tat + interval),
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return max(0.0, tat - tolerance - now)
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request can be made.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """
+        Waits, without blocking the event loop, until a request can be made.
+
+        The slot is reserved on the default executor, since the shared SQLite
+        database may be locked by other processes, so only the wait itself
+        runs on the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        delay = await loop.run_in_executor(None, self.reserve)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database, if any.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class AdaptiveConcurrency:
+    """
+    Limits the number of requests in flight, adapting the limit to the server.
+
+    The limit follows an additive increase, multiplicative decrease (AIMD)
+    scheme: every successful request raises it by `1 / limit`, so it grows by
+    about one per round of requests, while a `429 Too Many Requests`, a server
+    error or a failed request multiplies it by `decrease_factor`. Decreases are
+    spaced by `decrease_cooldown`, so a burst of errors caused by the same
+    overload only backs off once. Bulk jobs thus converge to the highest
+    concurrency the server sustains.
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_MIN_CONCURRENCY,
+        minimum: int = DEFAULT_MIN_CONCURRENCY,
+        maximum: int = DEFAULT_MAX_CONCURRENCY,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        decrease_cooldown: float = DEFAULT_DECREASE_COOLDOWN,
+    ):
+        """
+        Initializes the AdaptiveConcurrency controller.
+
+        :param initial: The initial limit, defaults to DEFAULT_MIN_CONCURRENCY.
+        :type initial: int, optional
+        :param minimum: The lowest limit, defaults to DEFAULT_MIN_CONCURRENCY.
+        :type minimum: int, optional
+        :param maximum: The highest limit, defaults to DEFAULT_MAX_CONCURRENCY.
+        :type maximum: int, optional
+        :param decrease_factor: The factor applied to the limit when the server is
+                                overloaded, defaults to DEFAULT_DECREASE_FACTOR.
+        :type decrease_factor: float, optional
+        :param decrease_cooldown: The minimum number of seconds between two
+                                  decreases, defaults to DEFAULT_DECREASE_COOLDOWN.
+        :type decrease_cooldown: float, optional
+        :raises ValueError: If the limits are not consistent.
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Expected 1 <= minimum <= initial <= maximum.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("The decrease factor must be between 0 and 1.")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """
+        The current maximum number of requests in flight.
+
+        :return: The current limit.
+        :rtype: int
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests currently in flight.
+
+        :return: The number of acquired slots.
+        :rtype: int
+        """
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request slot is free, and takes it.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    def release(self, status_code: Optional[int]) -> None:
+        """
+        Frees a request slot and adapts the limit to the outcome of the request.
+
+        :param status_code: The status code of the response, or None if the
+                            request failed without a response.
+        :type status_code: Optional[int]
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if is_overload_status(status_code):
+                now = time.monotonic()
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    self._last_decrease = now
+                    self._limit = max(
+                        float(self.minimum), self._limit * self.decrease_factor
+                    )
+            else:
+                self._limit = min(float(self.maximum), self._limit + 1 / self._limit)
+            self._condition.notify_all()
@@ -1,7 +1,36 @@
-from typing import Dict, List, Optional, Union
-from urllib.parse import urljoin
+import threading
+import time
+from types import TracebackType
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+from urllib.parse import urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from esiosapy.utils.instrumentation import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHE_REVALIDATED,
+    RequestEvent,
+    RequestHook,
+)
+from esiosapy.utils.json_backend import (
+    JsonBackend,
+    get_json_backend,
+    incremental_decoding_available,
+    iter_json_items,
+)
+from esiosapy.utils.rate_limiter import AdaptiveConcurrency, RateLimiter
+from esiosapy.utils.response_cache import ResponseCache
+from esiosapy.utils.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+from esiosapy.utils.single_flight import SingleFlight
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TIMEOUT = (10.0, 60.0)
+
+Timeout = Optional[Union[float, Tuple[float, float]]]
+"""A timeout in seconds, either for both phases or as `(connect, read)`."""
 
 
 class RequestHelper:
@@ -11,9 +40,27 @@ class RequestHelper:
 
     This class simplifies the process of making HTTP GET requests by handling
     common tasks such as setting default headers and constructing the full URL.
+    All requests go through a single pooled `requests.Session`, so TCP and TLS
+    connections to the API are kept alive and reused between calls.
     """
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        cache: Optional[ResponseCache] = None,
+        json_backend: Optional[Union[str, JsonBackend]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        coalesce_requests: bool = False,
+    ):
         """
         Initializes the RequestHelper with a base URL and an API token.
 
@@ -21,9 +68,129 @@ class RequestHelper:
         :type base_url: str
         :param token: The API token used for authentication in requests.
         :type token: str
+        :param pool_connections: The number of per-host connection pools to keep
+                                 cached, defaults to DEFAULT_POOL_CONNECTIONS.
+        :type pool_connections: int, optional
+        :param pool_maxsize: The maximum number of connections kept open to a
+                             single host, defaults to DEFAULT_POOL_MAXSIZE.
+        :type pool_maxsize: int, optional
+        :param pool_block: Whether to block when a host pool has no free
+                           connection instead of opening a throwaway one,
+                           defaults to False.
+        :type pool_block: bool, optional
+        :param keep_alive: Whether to keep connections alive between requests,
+                           defaults to True.
+        :type keep_alive: bool, optional
+        :param cache: An optional cache for GET responses, defaults to None.
+        :type cache: Optional[ResponseCache], optional
+        :param json_backend: The JSON backend used to decode responses, by name
+                             (e.g. `"orjson"`) or as an instance. If not provided,
+                             the fastest installed backend is used. Defaults to
+                             None.
+        :type json_backend: Optional[Union[str, JsonBackend]], optional
+        :param rate_limiter: An optional rate limiter every request waits for,
+                             which can be shared between clients. Defaults to
+                             None.
+        :type rate_limiter: Optional[RateLimiter], optional
+        :param concurrency: An optional controller adapting the number of
+                            requests in flight to the server load. Defaults to
+                            None.
+        :type concurrency: Optional[AdaptiveConcurrency], optional
+        :param retry_policy: How requests failing with transient errors are
+                             retried, or None to never retry them. Defaults to
+                             DEFAULT_RETRY_POLICY.
+        :type retry_policy: Optional[RetryPolicy], optional
+        :param timeout: The timeout of every request, in seconds, either for both
+                        phases or as `(connect, read)`, or None to wait forever.
+                        The read timeout applies between two received bytes, not
+                        to the whole response. Defaults to DEFAULT_TIMEOUT.
+        :type timeout: Timeout, optional
+        :param hooks: Hooks called around every request, e.g. a MetricsCollector.
+                      Defaults to None.
+        :type hooks: Optional[Sequence[RequestHook]], optional
+        :param coalesce_requests: Whether concurrent identical `get_json` calls
+                                  share one request and its decoded result.
+                                  Defaults to False.
+        :type coalesce_requests: bool, optional
         """
         self.base_url = base_url
         self.token = token
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.cache = cache
+        self.json_backend = get_json_backend(json_backend)
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.hooks: List[RequestHook] = list(hooks or ())
+        self.single_flight = SingleFlight() if coalesce_requests else None
+
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The pooled session shared by every request made through this helper.
+
+        The session is created lazily on first access, so helpers that are never
+        used do not open any connection.
+
+        :return: The pooled `requests.Session`.
+        :rtype: requests.Session
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        """
+        Creates a `requests.Session` mounted with the configured connection pool.
+
+        :return: A new session ready to be shared between requests.
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    def close(self) -> None:
+        """
+        Closes the pooled session and every connection it holds.
+
+        The helper can still be used afterwards; a new session will be created
+        on the next request.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self) -> "RequestHelper":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
 
     def add_default_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
         """
@@ -53,13 +220,21 @@ class RequestHelper:
         path: str,
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Union[str, int, List[str]]]] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """
         Makes a GET request to the specified path, with optional headers and parameters.
 
         This method constructs the full URL by combining the base URL and the
-        provided path. It then sends a GET request to this URL, including any
-        provided headers and query parameters.
+        provided path. It then sends a GET request to this URL through the pooled
+        session, including any provided headers and query parameters.
+
+        If a cache is configured, fresh cached responses are returned without any
+        request, and expired ones are revalidated with a conditional request.
+        Streamed requests always bypass the cache.
+
+        Every hook is called before the request and once it is over, whether it
+        succeeded or not.
 
         :param path: The endpoint path to be appended to the base URL.
         :type path: str
@@ -69,6 +244,10 @@ class RequestHelper:
         :param params: Optional query parameters to include in the request. This can
                        include strings, integers, or lists of strings. Defaults to None.
         :type params: Optional[Dict[str, Union[str, int, List[str]]]], optional
+        :param stream: Whether to defer downloading the response body, so it can be
+                       consumed in chunks with `iter_content`. The response should
+                       then be closed by the caller. Defaults to False.
+        :type stream: bool, optional
         :return: The response object resulting from the GET request.
         :rtype: requests.Response
         """
@@ -80,7 +259,403 @@ class RequestHelper:
         headers = self.add_default_headers(headers)
         url = urljoin(self.base_url, path)
 
-        response = requests.get(url, headers=headers, params=params)
+        event = RequestEvent(url=url, path=urlparse(url).path, params=params)
+        for hook in self.hooks:
+            hook.before_request(event)
+
+        start = time.perf_counter()
+        try:
+            if self.cache is None or stream:
+                response = self._send(url, headers, params, event, stream=stream)
+                try:
+                    response.raise_for_status()
+                except requests.HTTPError:
+                    response.close()
+                    raise
+            else:
+                response = self._cached_get_request(
+                    self.cache, url, headers, params, event
+                )
+        except Exception as error:
+            event.error = error
+            raise
+        finally:
+            event.elapsed = time.perf_counter() - start
+            for hook in self.hooks:
+                hook.after_request(event)
+
+        return response
+
+    def get_json(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Union[str, int, List[str]]]] = None,
+        key_path: Sequence[str] = (),
+    ) -> Any:
+        """
+        Makes a GET request and decodes its JSON body with the configured backend.
+
+        If request coalescing is enabled, concurrent calls with the same path,
+        headers, normalized parameters and key path share a single request, and
+        all get the same decoded object, which must therefore not be mutated.
+
+        :param path: The endpoint path to be appended to the base URL.
+        :type path: str
+        :param headers: Optional headers to include in the request, defaults to None.
+        :type headers: Optional[Dict[str, str]], optional
+        :param params: Optional query parameters to include in the request,
+                       defaults to None.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]], optional
+        :param key_path: The keys leading to the part of the body that is wanted
+                         (e.g. `("indicator", "values")`). Backends that support
+                         it skip the rest of the document while decoding.
+                         Defaults to the whole body.
+        :type key_path: Sequence[str], optional
+        :raises KeyError: If a key of `key_path` is missing from the body.
+        :return: The decoded body, or the part of it found under `key_path`.
+        :rtype: Any
+        """
+        if self.single_flight is None:
+            return self._get_json(path, headers, params, key_path)
+
+        key = self._coalescing_key(path, headers, params, key_path, "json")
+        return self.single_flight.do(
+            key, lambda: self._get_json(path, headers, params, key_path)
+        )
+
+    def get_json_columns(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Union[str, int, List[str]]]] = None,
+        key_path: Sequence[str] = (),
+    ) -> Dict[str, List[Any]]:
+        """
+        Makes a GET request and decodes the indicator values of its JSON body
+        straight into columns, with the configured backend.
+
+        If request coalescing is enabled, concurrent calls for the same request
+        share it, as with `get_json`, and get the same columns, which must
+        therefore not be mutated.
+
+        :param path: The endpoint path to be appended to the base URL.
+        :type path: str
+        :param headers: Optional headers to include in the request, defaults to None.
+        :type headers: Optional[Dict[str, str]], optional
+        :param params: Optional query parameters to include in the request,
+                       defaults to None.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]], optional
+        :param key_path: The keys leading to the array of values
+                         (e.g. `("indicator", "values")`). Defaults to the body.
+        :type key_path: Sequence[str], optional
+        :raises KeyError: If a key of `key_path` is missing from the body.
+        :return: The columns, as returned by `values_to_columns`.
+        :rtype: Dict[str, List[Any]]
+        """
+        if self.single_flight is None:
+            return self._get_json_columns(path, headers, params, key_path)
+
+        key = self._coalescing_key(path, headers, params, key_path, "columns")
+        columns: Dict[str, List[Any]] = self.single_flight.do(
+            key, lambda: self._get_json_columns(path, headers, params, key_path)
+        )
+        return columns
+
+    def _coalescing_key(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Union[str, int, List[str]]]],
+        key_path: Sequence[str],
+        decoding: str,
+    ) -> Tuple[Any, ...]:
+        """
+        Returns the key under which identical requests are coalesced.
+
+        :param path: The endpoint path to be appended to the base URL.
+        :type path: str
+        :param headers: Optional headers to include in the request.
+        :type headers: Optional[Dict[str, str]]
+        :param params: Optional query parameters to include in the request.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]]
+        :param key_path: The keys leading to the part of the body that is wanted.
+        :type key_path: Sequence[str]
+        :param decoding: How the body is decoded, since calls decoding it
+                         differently cannot share their result.
+        :type decoding: str
+        :return: The coalescing key.
+        :rtype: Tuple[Any, ...]
+        """
+        return (
+            ResponseCache.make_key(urljoin(self.base_url, path), params),
+            tuple(sorted((headers or {}).items())),
+            tuple(key_path),
+            decoding,
+        )
+
+    def _get_json(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Union[str, int, List[str]]]],
+        key_path: Sequence[str],
+    ) -> Any:
+        """
+        Makes a GET request and decodes its JSON body, without coalescing.
+
+        :param path: The endpoint path to be appended to the base URL.
+        :type path: str
+        :param headers: Optional headers to include in the request.
+        :type headers: Optional[Dict[str, str]]
+        :param params: Optional query parameters to include in the request.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]]
+        :param key_path: The keys leading to the part of the body that is wanted.
+        :type key_path: Sequence[str]
+        :return: The decoded body, or the part of it found under `key_path`.
+        :rtype: Any
+        """
+        response = self.get_request(path, headers=headers, params=params)
+        return self.json_backend.loads_path(response.content, key_path)
+
+    def _get_json_columns(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Union[str, int, List[str]]]],
+        key_path: Sequence[str],
+    ) -> Dict[str, List[Any]]:
+        """
+        Makes a GET request and decodes the values of its JSON body into
+        columns, without coalescing.
+
+        :param path: The endpoint path to be appended to the base URL.
+        :type path: str
+        :param headers: Optional headers to include in the request.
+        :type headers: Optional[Dict[str, str]]
+        :param params: Optional query parameters to include in the request.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]]
+        :param key_path: The keys leading to the array of values.
+        :type key_path: Sequence[str]
+        :return: The columns, as returned by `values_to_columns`.
+        :rtype: Dict[str, List[Any]]
+        """
+        response = self.get_request(path, headers=headers, params=params)
+        return self.json_backend.loads_columns(response.content, key_path)
+
+    def iter_json(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Union[str, int, List[str]]]] = None,
+        key_path: Sequence[str] = (),
+    ) -> Iterator[Any]:
+        """
+        Makes a GET request and lazily yields the items of a JSON array of its body.
+
+        If `ijson` is installed and no response cache is configured, the body is
+        streamed and decoded incrementally, so items are yielded while the
+        response is still downloading and it is never held whole in memory.
+        Otherwise, the body is decoded at once with the configured backend.
+
+        :param path: The endpoint path to be appended to the base URL.
+        :type path: str
+        :param headers: Optional headers to include in the request, defaults to None.
+        :type headers: Optional[Dict[str, str]], optional
+        :param params: Optional query parameters to include in the request,
+                       defaults to None.
+        :type params: Optional[Dict[str, Union[str, int, List[str]]]], optional
+        :param key_path: The keys leading to the array whose items are yielded
+                         (e.g. `("indicator", "values")`). Defaults to the body.
+        :type key_path: Sequence[str], optional
+        :raises KeyError: If a key of `key_path` is missing from the body, whether
+                          it is streamed or not.
+        :return: An iterator over the decoded items of the array.
+        :rtype: Iterator[Any]
+        """
+        if self.cache is not None or not incremental_decoding_available():
+            yield from self.get_json(
+                path, headers=headers, params=params, key_path=key_path
+            )
+            return
+
+        with self.get_request(
+            path, headers=headers, params=params, stream=True
+        ) as response:
+            response.raw.decode_content = True
+            yield from iter_json_items(response.raw, key_path)
+
+    def _send(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        params: Dict[str, Union[str, int, List[str]]],
+        event: RequestEvent,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Sends a GET request through the pooled session, retrying transient failures
+        according to the retry policy.
+
+        Every attempt waits for the rate limiter and for a concurrency slot, if
+        configured. The concurrency slot is released once the response headers
+        are received, and its status is reported to the controller.
+
+        :param url: The full URL of the request.
+        :type url: str
+        :param headers: The headers of the request.
+        :type headers: Dict[str, str]
+        :param params: The query parameters of the request.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :param event: The event of the request, updated after every attempt.
+        :type event: RequestEvent
+        :param stream: Whether to defer downloading the response body, defaults
+                       to False.
+        :type stream: bool, optional
+        :raises requests.ConnectionError: If the last attempt could not connect.
+        :raises requests.Timeout: If the last attempt timed out.
+        :return: The response of the last attempt, whatever its status code.
+        :rtype: requests.Response
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            event.attempts = attempt
+            try:
+                response = self._send_once(url, headers, params, stream)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                event.status_code = None
+                event.error = error
+                if self.retry_policy is None:
+                    raise
+                delay = self.retry_policy.error_delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                event.status_code = response.status_code
+                if self.hooks:
+                    event.bytes_received = self._received_bytes(response, stream)
+                event.error = None
+                if self.retry_policy is None:
+                    return response
+                delay = self.retry_policy.response_delay(
+                    attempt, response.status_code, response.headers
+                )
+                if delay is None:
+                    return response
+                response.close()
+
+            for hook in self.hooks:
+                hook.on_retry(event, delay)
+            time.sleep(delay)
+
+    @staticmethod
+    def _received_bytes(response: Any, stream: bool) -> Optional[int]:
+        """
+        Returns the size of the body of a response, without reading a streamed
+        body.
+
+        :param response: A `requests` or `httpx` response.
+        :type response: Any
+        :param stream: Whether the body of the response is streamed.
+        :type stream: bool
+        :return: The size of the body, or None if it is streamed and the server
+                 did not send its length.
+        :rtype: Optional[int]
+        """
+        if not stream:
+            return len(response.content)
+        try:
+            return int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return None
+
+    def _send_once(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        params: Dict[str, Union[str, int, List[str]]],
+        stream: bool,
+    ) -> requests.Response:
+        """
+        Makes a single attempt of a GET request, after waiting for the rate
+        limiter and for a concurrency slot, if configured.
+
+        :param url: The full URL of the request.
+        :type url: str
+        :param headers: The headers of the request.
+        :type headers: Dict[str, str]
+        :param params: The query parameters of the request.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :param stream: Whether to defer downloading the response body.
+        :type stream: bool
+        :return: The response, whatever its status code.
+        :rtype: requests.Response
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        if self.concurrency is None:
+            return self.session.get(
+                url, headers=headers, params=params, stream=stream, timeout=self.timeout
+            )
+
+        status_code = None
+        self.concurrency.acquire()
+        try:
+            response = self.session.get(
+                url, headers=headers, params=params, stream=stream, timeout=self.timeout
+            )
+            status_code = response.status_code
+            return response
+        finally:
+            self.concurrency.release(status_code)
+
+    def _cached_get_request(
+        self,
+        cache: ResponseCache,
+        url: str,
+        headers: Dict[str, str],
+        params: Dict[str, Union[str, int, List[str]]],
+        event: RequestEvent,
+    ) -> requests.Response:
+        """
+        Makes a GET request through the response cache.
+
+        :param cache: The cache to read from and store into.
+        :type cache: ResponseCache
+        :param url: The full URL of the request.
+        :type url: str
+        :param headers: The headers of the request.
+        :type headers: Dict[str, str]
+        :param params: The query parameters of the request.
+        :type params: Dict[str, Union[str, int, List[str]]]
+        :param event: The event of the request, updated with the cache outcome.
+        :type event: RequestEvent
+        :return: The cached or freshly fetched response.
+        :rtype: requests.Response
+        """
+        key = cache.make_key(url, params, headers)
+        ttl = cache.ttl_for(urlparse(url).path)
+
+        cached = cache.get(key)
+        if cached is not None:
+            if cached.is_fresh:
+                event.cache = CACHE_HIT
+                event.status_code = cached.status_code
+                event.bytes_received = 0
+                return cached.to_response()
+            headers = {**cached.validators, **headers}
+
+        response = self._send(url, headers, params, event)
+
+        if cached is not None and response.status_code == 304:
+            event.cache = CACHE_REVALIDATED
+            cache.refresh(key, ttl)
+            return cached.to_response()
+
+        event.cache = CACHE_MISS
         response.raise_for_status()
+        cache.set(key, response, ttl)
 
         return response
@@ -0,0 +1,339 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_TTL = 3600.0
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+VARY_HEADERS = ("x-api-key", "authorization", "accept", "accept-language")
+"""The request headers that can change a response, and so are part of its key."""
+
+
+@dataclass
+class CachedResponse:
+    """
+    Represents a response stored in the ResponseCache.
+
+    This dataclass holds everything needed to rebuild the original response,
+    along with the validators used to revalidate it once it expires.
+    """
+
+    url: str
+    """The URL the response was fetched from.
+
+    :type: str
+    """
+
+    status_code: int
+    """The HTTP status code of the response.
+
+    :type: int
+    """
+
+    headers: Dict[str, str]
+    """The HTTP headers of the response.
+
+    :type: Dict[str, str]
+    """
+
+    content: bytes
+    """The body of the response.
+
+    :type: bytes
+    """
+
+    expires_at: Optional[float]
+    """The UNIX time at which the response expires, or None if it never does.
+
+    :type: Optional[float]
+    """
+
+    @property
+    def is_fresh(self) -> bool:
+        """
+        Whether the response can still be used without revalidating it.
+
+        :return: True if the response has not expired yet.
+        :rtype: bool
+        """
+        return self.expires_at is None or self.expires_at > time.time()
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """
+        The conditional request headers used to revalidate the response.
+
+        :return: The `If-None-Match` and `If-Modified-Since` headers, when the
+                 response has an `ETag` or a `Last-Modified` header.
+        :rtype: Dict[str, str]
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def to_response(self) -> requests.Response:
+        """
+        Rebuilds a `requests.Response` from the stored response.
+
+        :return: A response equivalent to the original one.
+        :rtype: requests.Response
+        """
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+
+class ResponseCache:
+    """
+    A persistent HTTP response cache backed by a local SQLite database.
+
+    Responses are keyed on their URL, normalized query parameters and the
+    headers that change them, such as the API token. Each entry expires after a
+    TTL that can be configured per endpoint, and expired entries are revalidated
+    with their `ETag`/`Last-Modified` headers instead of being downloaded again
+    when the server answers `304 Not Modified`. The cache is bounded in size and
+    evicts the least recently used entries first.
+
+    Only successful JSON responses are stored, so archive files are never
+    cached.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        default_ttl: Optional[float] = DEFAULT_CACHE_TTL,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        """
+        Initializes the ResponseCache, creating its database if needed.
+
+        :param path: The path of the SQLite database file.
+        :type path: Union[str, Path]
+        :param default_ttl: The number of seconds a response stays fresh, or None
+                            for responses that never expire. Defaults to
+                            DEFAULT_CACHE_TTL.
+        :type default_ttl: Optional[float], optional
+        :param ttls: TTLs overriding `default_ttl` for the endpoints whose path
+                     starts with the given prefix (e.g. `{"/indicators": 60}`).
+                     The longest matching prefix wins. Defaults to None.
+        :type ttls: Optional[Mapping[str, Optional[float]]], optional
+        :param max_bytes: The maximum total size of the stored bodies, in bytes.
+                          Defaults to DEFAULT_CACHE_MAX_BYTES.
+        :type max_bytes: int, optional
+        """
+        self.path = Path(path)
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls) if ttls else {}
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "url TEXT NOT NULL, "
+                "status_code INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, "
+                "content BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "expires_at REAL, "
+                "last_access REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_access "
+                "ON responses (last_access)"
+            )
+
+    @staticmethod
+    def make_key(
+        url: str,
+        params: Optional[Mapping[str, Union[str, int, List[str]]]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """
+        Builds the cache key of a request.
+
+        Parameters are normalized so that their order and their types (e.g. `1`
+        and `"1"`) do not change the key. The headers of `VARY_HEADERS`, such as
+        the API token, are part of the key too, so that clients with different
+        credentials sharing a cache never get each other's responses. Only the
+        hash of the key is stored, never the headers themselves.
+
+        :param url: The full URL of the request.
+        :type url: str
+        :param params: The query parameters of the request, defaults to None.
+        :type params: Optional[Mapping[str, Union[str, int, List[str]]]], optional
+        :param headers: The headers of the request, defaults to None.
+        :type headers: Optional[Mapping[str, str]], optional
+        :return: The cache key.
+        :rtype: str
+        """
+        normalized = sorted(
+            (
+                key,
+                [str(v) for v in value] if isinstance(value, list) else str(value),
+            )
+            for key, value in (params or {}).items()
+        )
+        vary = sorted(
+            (name.lower(), value)
+            for name, value in (headers or {}).items()
+            if name.lower() in VARY_HEADERS
+        )
+        return hashlib.sha256(json.dumps([url, normalized, vary]).encode()).hexdigest()
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """
+        Returns the TTL of an endpoint.
+
+        :param path: The path of the endpoint.
+        :type path: str
+        :return: The number of seconds responses from this endpoint stay fresh,
+                 or None if they never expire.
+        :rtype: Optional[float]
+        """
+        matches = [prefix for prefix in self.ttls if path.startswith(prefix)]
+        if not matches:
+            return self.default_ttl
+        return self.ttls[max(matches, key=len)]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Returns a stored response, fresh or not, and marks it as recently used.
+
+        :param key: The cache key of the request.
+        :type key: str
+        :return: The stored response, or None if there is none.
+        :rtype: Optional[CachedResponse]
+        """
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT url, status_code, headers, content, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        url, status_code, headers, content, expires_at = row
+        return CachedResponse(
+            url, status_code, json.loads(headers), content, expires_at
+        )
+
+    def set(self, key: str, response: requests.Response, ttl: Optional[float]) -> None:
+        """
+        Stores a response, evicting the least recently used ones if needed.
+
+        Responses that are not successful JSON responses, or that are larger than
+        the whole cache, are not stored.
+
+        :param key: The cache key of the request.
+        :type key: str
+        :param response: The response to store.
+        :type response: requests.Response
+        :param ttl: The number of seconds the response stays fresh, or None if it
+                    never expires.
+        :type ttl: Optional[float]
+        """
+        if response.status_code != 200:
+            return
+        if "json" not in response.headers.get("Content-Type", ""):
+            return
+
+        content = response.content
+        if len(content) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    content,
+                    len(content),
+                    None if ttl is None else now + ttl,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def refresh(self, key: str, ttl: Optional[float]) -> None:
+        """
+        Extends the freshness of a stored response after a successful revalidation.
+
+        :param key: The cache key of the request.
+        :type key: str
+        :param ttl: The number of seconds the response stays fresh, or None if it
+                    never expires.
+        :type ttl: Optional[float]
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?",
+                (None if ttl is None else now + ttl, now, key),
+            )
+
+    def clear(self) -> None:
+        """
+        Removes every stored response.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        """
+        Deletes the least recently used responses until the cache fits in
+        `max_bytes`. Must be called with the lock held, inside a transaction.
+        """
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY last_access"
+        ).fetchall()
+        to_delete = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", to_delete)
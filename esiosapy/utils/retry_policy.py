@@ -0,0 +1,149 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Mapping, Optional
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Describes how failed requests are retried.
+
+    Requests failing with a connection error, a timeout or one of
+    `retry_statuses` are retried up to `max_attempts` times in total. Waits grow
+    exponentially with the attempt number and are fully jittered, so that many
+    clients failing at the same time do not retry in lockstep. A `Retry-After`
+    header sent by the server takes precedence over the computed wait.
+
+    Only GET requests are made by this package, so every request is idempotent
+    and safe to retry.
+    """
+
+    max_attempts: int = 4
+    """The maximum number of attempts, the first one included.
+
+    :type: int
+    """
+
+    backoff_factor: float = 0.5
+    """The base wait, in seconds, doubled on every retry.
+
+    :type: float
+    """
+
+    max_backoff: float = 30.0
+    """The maximum wait between two attempts, in seconds.
+
+    :type: float
+    """
+
+    jitter: bool = True
+    """Whether to wait a random time between zero and the computed backoff.
+
+    :type: bool
+    """
+
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    """The response status codes that are retried.
+
+    :type: FrozenSet[int]
+    """
+
+    respect_retry_after: bool = True
+    """Whether to wait as long as the `Retry-After` header of a response asks.
+
+    :type: bool
+    """
+
+    max_retry_after: float = 120.0
+    """The longest `Retry-After` wait honored, in seconds. Responses asking for a
+    longer wait are not retried.
+
+    :type: float
+    """
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Computes the wait before the next attempt.
+
+        :param attempt: The number of attempts made so far, starting at 1.
+        :type attempt: int
+        :return: The number of seconds to wait.
+        :rtype: float
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def retry_after(self, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Parses the `Retry-After` header of a response.
+
+        :param headers: The headers of the response. Lookups must be case
+                        insensitive.
+        :type headers: Mapping[str, str]
+        :return: The number of seconds the server asks to wait, or None if the
+                 header is missing, invalid or ignored.
+        :rtype: Optional[float]
+        """
+        value = headers.get("Retry-After")
+        if not self.respect_retry_after or value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def response_delay(
+        self, attempt: int, status_code: int, headers: Mapping[str, str]
+    ) -> Optional[float]:
+        """
+        Decides whether a response is retried, and after how long.
+
+        :param attempt: The number of attempts made so far, starting at 1.
+        :type attempt: int
+        :param status_code: The status code of the response.
+        :type status_code: int
+        :param headers: The headers of the response.
+        :type headers: Mapping[str, str]
+        :return: The number of seconds to wait before retrying, or None if the
+                 response must be returned as is.
+        :rtype: Optional[float]
+        """
+        if attempt >= self.max_attempts or status_code not in self.retry_statuses:
+            return None
+
+        retry_after = self.retry_after(headers)
+        if retry_after is None:
+            return self.backoff(attempt)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+    def error_delay(self, attempt: int) -> Optional[float]:
+        """
+        Decides whether a request that failed without a response is retried, and
+        after how long.
+
+        :param attempt: The number of attempts made so far, starting at 1.
+        :type attempt: int
+        :return: The number of seconds to wait before retrying, or None if the
+                 error must be raised.
+        :rtype: Optional[float]
+        """
+        if attempt >= self.max_attempts:
+            return None
+        return self.backoff(attempt)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+"""The retry policy used by default by the clients."""
@@ -0,0 +1,83 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """
+    A call in flight, awaited by the threads making the same call.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    While a call is in flight, threads making a call with the same key wait for
+    it and get its result, or its error, instead of making their own. Once it is
+    over, the next call with that key is made again: results are not cached.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the SingleFlight with no call in flight.
+        """
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """
+        The number of calls that were answered by another call in flight.
+
+        :return: The number of coalesced calls.
+        :rtype: int
+        """
+        return self._coalesced
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Calls `fn`, unless a call with the same key is in flight, in which case
+        its outcome is awaited and shared.
+
+        :param key: The key identifying identical calls.
+        :type key: Hashable
+        :param fn: The function making the call.
+        :type fn: Callable[[], T]
+        :raises BaseException: Whatever `fn` raised, in every thread sharing the
+                               call.
+        :return: The result of the call, shared by every thread that made it.
+        :rtype: T
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            result = fn()
+            call.result = result
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
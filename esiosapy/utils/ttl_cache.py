@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+
+DEFAULT_CATALOG_TTL = 3600.0
+DEFAULT_CATALOG_MAX_ENTRIES = 128
+
+
+def freeze_params(params: Mapping[str, Union[str, int, List[str]]]) -> Hashable:
+    """
+    Turns query parameters into a hashable value usable in a cache key.
+
+    :param params: The query parameters to freeze.
+    :type params: Mapping[str, Union[str, int, List[str]]]
+    :return: The parameters as a sorted tuple of pairs, with lists as tuples.
+    :rtype: Hashable
+    """
+    return tuple(
+        sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in params.items()
+        )
+    )
+
+
+class TTLCache:
+    """
+    A thread-safe in-memory cache with a time-to-live and LRU eviction.
+
+    It is meant to be shared across the whole process (e.g. between several
+    clients) to memoize data that rarely changes, such as the indicator catalog.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = DEFAULT_CATALOG_TTL,
+        max_entries: int = DEFAULT_CATALOG_MAX_ENTRIES,
+    ):
+        """
+        Initializes the TTLCache.
+
+        :param ttl: The number of seconds an entry stays valid, or None for
+                    entries that never expire. Defaults to DEFAULT_CATALOG_TTL.
+        :type ttl: Optional[float], optional
+        :param max_entries: The maximum number of entries kept; the least recently
+                            used ones are evicted first. Defaults to
+                            DEFAULT_CATALOG_MAX_ENTRIES.
+        :type max_entries: int, optional
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[Hashable, Tuple[Optional[float], Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Returns the value stored under a key, computing and storing it if missing
+        or expired.
+
+        The factory is called without holding the lock, so a slow computation does
+        not block readers of other keys.
+
+        :param key: The key of the entry.
+        :type key: Hashable
+        :param factory: A function computing the value when it is not cached.
+        :type factory: Callable[[], T]
+        :return: The cached or freshly computed value.
+        :rtype: T
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, cached = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    return cached  # type: ignore[no-any-return]
+                del self._entries[key]
+
+        value = factory()
+        self.set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entries if needed.
+
+        :param key: The key of the entry.
+        :type key: Hashable
+        :param value: The value to store.
+        :type value: Any
+        """
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes an entry, if present.
+
+        :param key: The key of the entry.
+        :type key: Hashable
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._entries.clear()
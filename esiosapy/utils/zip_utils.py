@@ -1,20 +1,147 @@
-from pathlib import Path
-from typing import Union
-from zipfile import ZipFile
+import io
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import IO, Iterator, List, Tuple, Union
+from zipfile import ZIP_STORED, ZipFile, ZipInfo
+
+DEFAULT_SPOOL_SIZE = 64 * 1024 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _safe_parts(name: str) -> List[str]:
+    """
+    Splits the name of a ZIP member into path components that are safe to join
+    to a directory, dropping absolute prefixes and `..` components like
+    `ZipFile.extract` does.
+
+    :param name: The name of the member.
+    :type name: str
+    :return: The path components of the member.
+    :rtype: List[str]
+    """
+    return [
+        part
+        for part in name.replace("\\", "/").split("/")
+        if part not in ("", ".", "..") and not part.endswith(":")
+    ]
+
+
+@contextmanager
+def _open_nested(zip_ref: ZipFile, info: ZipInfo, spool_size: int) -> Iterator[ZipFile]:
+    """
+    Opens a ZIP member that is itself a ZIP file, without extracting it to disk.
+
+    Stored members are read in place, since seeking in them is cheap. Compressed
+    ones are first decompressed, in memory up to `spool_size` bytes or to a
+    temporary file otherwise, so that reading their central directory does not
+    decompress them over and over.
+
+    :param zip_ref: The ZIP file holding the member.
+    :type zip_ref: ZipFile
+    :param info: The member to open.
+    :type info: ZipInfo
+    :param spool_size: The maximum size of a member kept in memory, in bytes.
+    :type spool_size: int
+    :return: The nested ZIP file.
+    :rtype: Iterator[ZipFile]
+    """
+    with zip_ref.open(info) as member:
+        if info.compress_type == ZIP_STORED:
+            with ZipFile(member) as nested:
+                yield nested
+            return
+
+        if info.file_size <= spool_size:
+            with ZipFile(io.BytesIO(member.read())) as nested:
+                yield nested
+            return
+
+        with tempfile.TemporaryFile() as spooled:
+            shutil.copyfileobj(member, spooled, COPY_BUFFER_SIZE)
+            spooled.seek(0)
+            with ZipFile(spooled) as nested:
+                yield nested
+
+
+def iter_zip_members(
+    zip_path: Union[str, Path, IO[bytes]], spool_size: int = DEFAULT_SPOOL_SIZE
+) -> Iterator[Tuple[PurePosixPath, IO[bytes]]]:
+    """
+    Iterates over the files of a ZIP file and of all the ZIP files nested in it,
+    without writing anything to disk.
+
+    Nested ZIP files are walked in place of being yielded: the members of a
+    nested `a/b.zip` are yielded under `a/b/`, which is where `recursive_unzip`
+    extracts them. Every member is only read once.
+
+    :param zip_path: The path to the ZIP file, or a seekable binary file object.
+    :type zip_path: Union[str, Path, IO[bytes]]
+    :param spool_size: The maximum size in bytes of a compressed nested ZIP file
+                       kept in memory while it is walked; bigger ones are spooled
+                       to a temporary file. Defaults to DEFAULT_SPOOL_SIZE.
+    :type spool_size: int, optional
+    :return: An iterator of `(path, file)` pairs, where `path` is the relative
+             path of the member and `file` is a readable binary file object that
+             is only valid until the next iteration.
+    :rtype: Iterator[Tuple[PurePosixPath, IO[bytes]]]
+    """
+    with ZipFile(zip_path, "r") as zip_ref:
+        yield from _iter_members(zip_ref, PurePosixPath(), spool_size)
+
+
+def _iter_members(
+    zip_ref: ZipFile, prefix: PurePosixPath, spool_size: int
+) -> Iterator[Tuple[PurePosixPath, IO[bytes]]]:
+    """
+    Iterates over the members of an open ZIP file, recursing into nested ZIP files.
+
+    :param zip_ref: The ZIP file to walk.
+    :type zip_ref: ZipFile
+    :param prefix: The path under which the members are yielded.
+    :type prefix: PurePosixPath
+    :param spool_size: The maximum size of a nested ZIP file kept in memory.
+    :type spool_size: int
+    :return: An iterator of `(path, file)` pairs.
+    :rtype: Iterator[Tuple[PurePosixPath, IO[bytes]]]
+    """
+    for info in zip_ref.infolist():
+        parts = _safe_parts(info.filename)
+        if info.is_dir() or not parts:
+            continue
+
+        member_path = prefix.joinpath(*parts)
+        if member_path.suffix == ".zip":
+            with _open_nested(zip_ref, info, spool_size) as nested:
+                yield from _iter_members(
+                    nested, member_path.with_suffix(""), spool_size
+                )
+        else:
+            with zip_ref.open(info) as member:
+                yield member_path, member
 
 
 def recursive_unzip(
-    zip_path: Union[str, Path], unzip_path: Union[str, Path], remove: bool = False
-) -> None:
+    zip_path: Union[str, Path],
+    unzip_path: Union[str, Path],
+    remove: bool = False,
+    spool_size: int = DEFAULT_SPOOL_SIZE,
+) -> List[Path]:
     """
     Recursively unzips a ZIP file and all nested ZIP files
     within it to a specified directory.
 
     This function extracts the contents of the provided ZIP file to the specified
-    directory. If any ZIP files are found within the extracted contents, it will
-    recursively extract them into their respective directories. Optionally, it can
+    directory. Any ZIP file found within it is extracted into a directory named
+    after it, next to where it would have been extracted. Optionally, it can
     also delete the original ZIP files after extraction.
 
+    The archive is walked in a single pass: nested ZIP files are read straight
+    from their parent (or from a temporary spool for compressed ones), and no
+    member is extracted more than once. When `remove` is True, nested ZIP files
+    are never written to disk at all.
+
     :param zip_path: The path to the ZIP file to be unzipped.
                      This can be a string or a Path object.
     :type zip_path: Union[str, Path]
@@ -24,23 +151,71 @@ def recursive_unzip(
     :param remove: If set to True, the original ZIP files will be deleted
                    after extraction, including nested ZIP files. Defaults to False.
     :type remove: bool, optional
+    :param spool_size: The maximum size in bytes of a compressed nested ZIP file
+                       kept in memory while it is extracted; bigger ones are
+                       spooled to a temporary file. Defaults to DEFAULT_SPOOL_SIZE.
+    :type spool_size: int, optional
 
-    :return: None
+    :return: The paths of the files written to disk.
+    :rtype: List[Path]
     """
     zip_path, unzip_path = Path(zip_path), Path(unzip_path)
 
     with ZipFile(zip_path, "r") as zip_ref:
-        zip_ref.extractall(unzip_path)
+        extracted = _extract_members(zip_ref, unzip_path, remove, spool_size)
 
-    for zip_subfile in unzip_path.rglob("*.zip"):
-        nested_unzip_path = zip_subfile.parent / zip_subfile.stem
-        with ZipFile(zip_subfile, "r") as zip_ref:
-            zip_ref.extractall(nested_unzip_path)
+    if remove and zip_path.exists():
+        zip_path.unlink()
 
-        recursive_unzip(zip_subfile, nested_unzip_path, remove)
+    return extracted
 
-        if remove and zip_subfile.exists():
-            zip_subfile.unlink()
 
-    if remove and zip_path.exists():
-        zip_path.unlink()
+def _extract_members(
+    zip_ref: ZipFile, unzip_path: Path, remove: bool, spool_size: int
+) -> List[Path]:
+    """
+    Extracts the members of an open ZIP file, recursing into nested ZIP files.
+
+    :param zip_ref: The ZIP file to extract.
+    :type zip_ref: ZipFile
+    :param unzip_path: The directory where the members are extracted.
+    :type unzip_path: Path
+    :param remove: Whether nested ZIP files are left out of the extraction.
+    :type remove: bool
+    :param spool_size: The maximum size of a nested ZIP file kept in memory.
+    :type spool_size: int
+    :return: The paths of the files written to disk.
+    :rtype: List[Path]
+    """
+    unzip_path.mkdir(parents=True, exist_ok=True)
+
+    extracted = []
+    for info in zip_ref.infolist():
+        parts = _safe_parts(info.filename)
+        if not parts:
+            continue
+
+        target = unzip_path.joinpath(*parts)
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            continue
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.suffix == ".zip" and remove:
+            with _open_nested(zip_ref, info, spool_size) as nested:
+                extracted += _extract_members(
+                    nested, target.with_suffix(""), remove, spool_size
+                )
+            continue
+
+        with zip_ref.open(info) as member, open(target, "wb") as f:
+            shutil.copyfileobj(member, f, COPY_BUFFER_SIZE)
+        extracted.append(target)
+
+        if target.suffix == ".zip":
+            with ZipFile(target, "r") as nested:
+                extracted += _extract_members(
+                    nested, target.with_suffix(""), remove, spool_size
+                )
+
+    return extracted
@@ -0,0 +1,239 @@
+import io
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from zipfile import ZipFile
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+from esiosapy.managers.archive_manager import ArchiveManager
+from esiosapy.models.archive.archive_date_type import ArchiveDateType
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.archive_index import ArchiveIndex
+from esiosapy.utils.archive_manifest import DEFAULT_MANIFEST_NAME
+from esiosapy.utils.request_helper import RequestHelper
+
+
+def _zip_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("data.csv", "a;b\n1;2\n")
+    return buffer.getvalue()
+
+
+def _archive(archive_id: int, name: str) -> Dict[str, Any]:
+    return {
+        "id": archive_id,
+        "name": name,
+        "horizon": "D",
+        "archive_type": "zip",
+        "download": {"name": name, "url": f"/archives/{archive_id}/download/{name}"},
+    }
+
+
+class TestArchiveManager:
+    @pytest.fixture
+    def archives(self) -> List[Dict[str, Any]]:
+        return [
+            _archive(34, "I90DIA_20210101"),
+            _archive(34, "I90DIA_20210102"),
+            _archive(34, "I90DIA_20210101"),
+            _archive(404, "BROKEN_20210101"),
+        ]
+
+    @pytest.fixture
+    def request_helper(
+        self, mocker: MockerFixture, archives: List[Dict[str, Any]]
+    ) -> Any:
+        content = _zip_bytes()
+
+        def get_request(
+            path: str,
+            headers: Optional[Dict[str, str]] = None,
+            params: Optional[Dict[str, Any]] = None,
+            stream: bool = False,
+        ) -> Any:
+            response = mocker.MagicMock()
+            response.__enter__.return_value = response
+            if path.startswith("/archives/404"):
+                raise requests.HTTPError("404 Client Error")
+            else:
+                response.status_code = 200
+                response.headers = {"Content-Length": str(len(content))}
+                response.iter_content.return_value = [content]
+            return response
+
+        def get_json(
+            path: str, params: Dict[str, Any], key_path: Tuple[str, ...]
+        ) -> Any:
+            assert (path, key_path) == ("/archives", ("archives",))
+            return archives
+
+        request_helper = mocker.Mock(spec=RequestHelper)
+        request_helper.get_request.side_effect = get_request
+        request_helper.get_json.side_effect = get_json
+        return request_helper
+
+    @pytest.fixture
+    def archive_manager(self, request_helper: Any) -> ArchiveManager:
+        return ArchiveManager(request_helper)
+
+    def _download_calls(self, request_helper: Any) -> List[str]:
+        return sorted(
+            call.args[0] for call in request_helper.get_request.call_args_list
+        )
+
+    def test_sync_downloads_every_archive_once(
+        self, archive_manager: ArchiveManager, request_helper: Any, tmp_path: Path
+    ) -> None:
+        results = archive_manager.sync(
+            "2021-01-01", "2021-01-02", tmp_path / "archives", workers=2
+        )
+
+        assert [result.archive.name for result in results] == [
+            "I90DIA_20210101",
+            "I90DIA_20210102",
+            "BROKEN_20210101",
+        ]
+        assert [result.ok for result in results] == [True, True, False]
+        assert results[0].path == tmp_path / "archives" / "I90DIA_20210101"
+        assert (results[1].path or tmp_path).joinpath("data.csv").exists()
+        assert isinstance(results[2].error, requests.HTTPError)
+        assert self._download_calls(request_helper) == [
+            "/archives/34/download/I90DIA_20210101",
+            "/archives/34/download/I90DIA_20210102",
+            "/archives/404/download/BROKEN_20210101",
+        ]
+
+        manifest = json.loads(
+            (tmp_path / "archives" / DEFAULT_MANIFEST_NAME).read_text()
+        )
+        assert sorted(manifest["archives"]) == [
+            "34/I90DIA_20210101",
+            "34/I90DIA_20210102",
+        ]
+
+    def test_sync_only_fetches_new_archives(
+        self,
+        archive_manager: ArchiveManager,
+        request_helper: Any,
+        archives: List[Dict[str, Any]],
+        tmp_path: Path,
+    ) -> None:
+        del archives[2:]
+        archive_manager.sync("2021-01-01", "2021-01-02", tmp_path)
+        request_helper.get_request.reset_mock()
+
+        archives.append(_archive(35, "I90DIA_20210103"))
+        results = archive_manager.sync("2021-01-01", "2021-01-03", tmp_path)
+
+        assert [result.skipped for result in results] == [True, True, False]
+        assert self._download_calls(request_helper) == [
+            "/archives/35/download/I90DIA_20210103"
+        ]
+
+    def test_sync_records_archives_in_index(
+        self,
+        archive_manager: ArchiveManager,
+        request_helper: Any,
+        archives: List[Dict[str, Any]],
+        tmp_path: Path,
+    ) -> None:
+        del archives[2:]
+        archive_manager.sync("2021-01-01", "2021-01-02", tmp_path)
+        request_helper.get_request.reset_mock()
+        index = ArchiveIndex(tmp_path / "index.sqlite")
+
+        archives.append(_archive(35, "I90DIA_20210103"))
+        results = archive_manager.sync(
+            "2021-01-01", "2021-01-03", tmp_path, index=index
+        )
+
+        assert [result.skipped for result in results] == [True, True, False]
+        assert len(index) == 3
+        indexed = index.get(35, "I90DIA_20210103")
+        assert indexed is not None
+        assert indexed.files == [tmp_path / "I90DIA_20210103" / "data.csv"]
+
+        (tmp_path / DEFAULT_MANIFEST_NAME).unlink()
+        results = archive_manager.sync(
+            "2021-01-01", "2021-01-03", tmp_path, index=index
+        )
+        assert all(result.skipped for result in results)
+        assert len(self._download_calls(request_helper)) == 1
+        index.close()
+
+    def test_query_pushes_filters_down_and_streams(
+        self, archive_manager: ArchiveManager, request_helper: Any
+    ) -> None:
+        pages = {
+            "2021-01-01T00:00:00.000000": [
+                _archive(34, "I90DIA_20210101"),
+                {**_archive(35, "I3DIA_20210101"), "horizon": "M"},
+            ],
+            "2021-01-02T00:00:00.000000": [
+                _archive(34, "I90DIA_20210101"),
+                _archive(34, "I90DIA_20210102"),
+            ],
+        }
+        requested: List[Dict[str, Any]] = []
+
+        def iter_json(
+            path: str, params: Dict[str, Any], key_path: Tuple[str, ...]
+        ) -> Any:
+            requested.append(dict(params))
+            yield from pages[params["start_date"]]
+
+        request_helper.iter_json.side_effect = iter_json
+
+        archives = archive_manager.query(
+            datetime(2021, 1, 1),
+            datetime(2021, 1, 2, 23, 59, 59),
+            date_type=ArchiveDateType.DATA,
+            taxonomy_terms=["Mercados"],
+            horizon="D",
+            window=TimeTrunc.DAY,
+        )
+
+        assert next(archives).name == "I90DIA_20210101"
+        assert len(requested) == 1
+        assert [archive.name for archive in archives] == ["I90DIA_20210102"]
+        assert requested == [
+            {
+                "start_date": "2021-01-01T00:00:00.000000",
+                "end_date": "2021-01-01T23:59:59.000000",
+                "date_type": "datos",
+                "taxonomy_terms[]": ["Mercados"],
+            },
+            {
+                "start_date": "2021-01-02T00:00:00.000000",
+                "end_date": "2021-01-02T23:59:59.000000",
+                "date_type": "datos",
+                "taxonomy_terms[]": ["Mercados"],
+            },
+        ]
+        request_helper.get_json.assert_not_called()
+
+    def test_query_client_side_filters(
+        self,
+        archive_manager: ArchiveManager,
+        request_helper: Any,
+        archives: List[Dict[str, Any]],
+    ) -> None:
+        request_helper.iter_json.side_effect = lambda *args, **kwargs: iter(archives)
+
+        found = archive_manager.query(
+            "2021-01-01",
+            name_prefix="I90",
+            predicate=lambda archive: archive.name.endswith("02"),
+        )
+
+        assert [archive.name for archive in found] == ["I90DIA_20210102"]
+        request_helper.iter_json.assert_called_once_with(
+            "/archives", params={"date": "2021-01-01"}, key_path=("archives",)
+        )
+        with pytest.raises(ValueError):
+            next(archive_manager.query(target_dt_end="2021-01-02"))
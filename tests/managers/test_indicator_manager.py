@@ -0,0 +1,222 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+from esiosapy.managers.indicator_manager import IndicatorManager
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.indicator_store import IndicatorStore
+from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.ttl_cache import TTLCache
+
+CATALOG = [
+    {"id": 1, "name": "Precio mercado spot diario", "short_name": "Spot"},
+    {"id": 2, "name": "Generación T.Real eólica", "short_name": "Eólica"},
+    {"id": 3, "name": "Demanda real", "short_name": "Demanda"},
+]
+
+
+class TestIndicatorManager:
+    @pytest.fixture
+    def request_helper(self, mocker: MockerFixture) -> Any:
+        return mocker.Mock(spec=RequestHelper)
+
+    @pytest.fixture
+    def indicator_manager(self, request_helper: Any) -> IndicatorManager:
+        return IndicatorManager(request_helper)
+
+    @pytest.fixture
+    def cached_indicator_manager(
+        self, mocker: MockerFixture, request_helper: Any
+    ) -> IndicatorManager:
+        request_helper.get_json.return_value = [
+            {**entry, "description": ""} for entry in CATALOG
+        ]
+        request_helper.base_url = "https://api.example.com"
+        request_helper.token = "test-token"
+        return IndicatorManager(request_helper, catalog_cache=TTLCache())
+
+    def test_list_all_is_memoized(
+        self, request_helper: Any, cached_indicator_manager: IndicatorManager
+    ) -> None:
+        first = cached_indicator_manager.list_all()
+        second = cached_indicator_manager.list_all()
+
+        assert [indicator.id for indicator in first] == [1, 2, 3]
+        assert first == second
+        assert first is not second
+        request_helper.get_json.assert_called_once()
+
+    def test_local_search(
+        self, request_helper: Any, cached_indicator_manager: IndicatorManager
+    ) -> None:
+        wind = cached_indicator_manager.search("EOLICA real", local=True)
+        spot = cached_indicator_manager.search("spot", local=True)
+
+        assert [indicator.id for indicator in wind] == [2]
+        assert [indicator.id for indicator in spot] == [1]
+        request_helper.get_json.assert_called_once_with(
+            "/indicators", params={}, key_path=("indicators",)
+        )
+
+    def test_local_search_covers_description_and_taxonomy(
+        self, request_helper: Any, cached_indicator_manager: IndicatorManager
+    ) -> None:
+        request_helper.get_json.return_value = [
+            {**CATALOG[0], "description": "<p>Precio según la demanda</p>"},
+            {
+                **CATALOG[1],
+                "description": "<p>Producci&oacute;n en tiempo real</p>",
+                "taxonomy_terms": [{"name": "Renovables"}],
+            },
+            {**CATALOG[2], "description": "<p>Demanda peninsular en tiempo real</p>"},
+        ]
+
+        renewables = cached_indicator_manager.search("renovables", local=True)
+        production = cached_indicator_manager.search("produccion", local=True)
+        demand = cached_indicator_manager.search("demanda", local=True)
+        markup = cached_indicator_manager.search("oacute", local=True)
+
+        assert [indicator.id for indicator in renewables] == [2]
+        assert [indicator.id for indicator in production] == [2]
+        # Matches on names come before matches on descriptions.
+        assert [indicator.id for indicator in demand] == [3, 1]
+        assert markup == []
+
+    def test_get_data_many(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        indicator_manager: IndicatorManager,
+    ) -> None:
+        def get_json(
+            path: str,
+            params: Dict[str, Union[str, int, List[str]]],
+            key_path: Tuple[str, ...],
+        ) -> Any:
+            if path == "/indicators/2":
+                raise requests.HTTPError("Not found")
+            assert key_path == ("indicator", "values")
+            return [{"path": path}]
+
+        request_helper.get_json.side_effect = get_json
+
+        results = indicator_manager.get_data_many(
+            [1, 2, 3, 1], "2021-01-01", "2021-01-02", time_trunc=TimeTrunc.DAY
+        )
+
+        assert list(results) == [1, 2, 3]
+        assert results[1].ok
+        assert results[1].data == [{"path": "/indicators/1"}]
+        assert not results[2].ok
+        assert isinstance(results[2].error, requests.HTTPError)
+        assert results[3].data == [{"path": "/indicators/3"}]
+        assert request_helper.get_json.call_count == 3
+        for call in request_helper.get_json.call_args_list:
+            assert call.kwargs["params"] == {
+                "start_date": "2021-01-01",
+                "end_date": "2021-01-02",
+                "time_trunc": "day",
+            }
+
+    def test_list_all_with_trusted_models(self, request_helper: Any) -> None:
+        catalog = [{**entry, "description": ""} for entry in CATALOG]
+        request_helper.get_json.return_value = catalog
+        indicator_manager = IndicatorManager(
+            request_helper, trusted_models=True, keep_raw=False
+        )
+
+        indicators = indicator_manager.list_all()
+
+        assert [indicator.name for indicator in indicators] == [
+            entry["name"] for entry in CATALOG
+        ]
+        assert all(indicator.raw == {} for indicator in indicators)
+
+    def test_sync_only_requests_the_delta(
+        self,
+        tmp_path: Path,
+        request_helper: Any,
+        indicator_manager: IndicatorManager,
+    ) -> None:
+        store = IndicatorStore(tmp_path / "store.sqlite")
+        request_helper.get_json.side_effect = [
+            [{"value": 1.0, "datetime_utc": "2021-01-01T10:00:00Z", "geo_id": 3}],
+            requests.HTTPError("Server error"),
+            [{"value": 2.0, "datetime_utc": "2021-01-01T11:00:00Z", "geo_id": 3}],
+        ]
+        end = datetime(2021, 1, 2, tzinfo=timezone.utc)
+
+        first = indicator_manager.sync(
+            [1], store, "2021-01-01", end, time_trunc=TimeTrunc.HOUR, max_workers=1
+        )
+        failed = indicator_manager.sync(
+            [1], store, "2021-01-01", end, time_trunc=TimeTrunc.HOUR, max_workers=1
+        )
+        second = indicator_manager.sync(
+            [1],
+            store,
+            "2021-01-01",
+            end,
+            time_trunc=TimeTrunc.HOUR,
+            revision_window=timedelta(hours=2),
+            max_workers=1,
+        )
+
+        assert first[1].start == "2021-01-01"
+        assert first[1].rows == 1
+        assert not failed[1].ok
+        assert second[1].ok
+        assert second[1].start == datetime(2021, 1, 1, 8, tzinfo=timezone.utc)
+        starts = [
+            call.kwargs["params"]["start_date"]
+            for call in request_helper.get_json.call_args_list
+        ]
+        assert starts == [
+            "2021-01-01T00:00:00.000000+0000",
+            "2020-12-31T10:00:00.000000+0000",
+            "2021-01-01T08:00:00.000000+0000",
+        ]
+        assert len(store.get_values(1, TimeTrunc.HOUR)) == 2
+
+    def test_sync_stores_every_window_as_it_arrives(
+        self,
+        tmp_path: Path,
+        request_helper: Any,
+        indicator_manager: IndicatorManager,
+    ) -> None:
+        store = IndicatorStore(tmp_path / "store.sqlite")
+        request_helper.get_json.side_effect = [
+            [{"value": 1.0, "datetime_utc": "2021-01-01T10:00:00Z", "geo_id": 3}],
+            [{"value": 2.0, "datetime_utc": "2021-01-02T10:00:00Z", "geo_id": 3}],
+            requests.HTTPError("Server error"),
+        ]
+        end = datetime(2021, 1, 3, 23, 59, 59, tzinfo=timezone.utc)
+
+        failed = indicator_manager.sync(
+            [1],
+            store,
+            "2021-01-01",
+            end,
+            time_trunc=TimeTrunc.HOUR,
+            max_rows_per_chunk=24,
+            max_workers=1,
+        )
+
+        assert not failed[1].ok
+        ranges = [
+            (call.kwargs["params"]["start_date"], call.kwargs["params"]["end_date"])
+            for call in request_helper.get_json.call_args_list
+        ]
+        assert ranges == [
+            ("2021-01-01T00:00:00.000000+0000", "2021-01-01T23:59:59.000000+0000"),
+            ("2021-01-02T00:00:00.000000+0000", "2021-01-02T23:59:59.000000+0000"),
+            ("2021-01-03T00:00:00.000000+0000", "2021-01-03T23:59:59.000000+0000"),
+        ]
+        assert len(store.get_values(1, TimeTrunc.HOUR)) == 2
+        assert store.high_water_mark(1, TimeTrunc.HOUR) == datetime(
+            2021, 1, 2, 10, tzinfo=timezone.utc
+        )
@@ -0,0 +1,298 @@
+import io
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple
+from zipfile import BadZipFile, ZipFile
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+from esiosapy.models.archive.archive import Archive
+from esiosapy.models.archive.taxonomy_term import TaxonomyTerm
+from esiosapy.utils.download_utils import IncompleteDownloadError
+from esiosapy.utils.request_helper import RequestHelper
+
+
+def _zip_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("data.csv", "a;b\n1;2\n")
+    return buffer.getvalue()
+
+
+class TestArchive:
+    @pytest.fixture
+    def request_helper(self, mocker: MockerFixture) -> Any:
+        return mocker.Mock(spec=RequestHelper)
+
+    @pytest.fixture
+    def archive(self, request_helper: Any) -> Archive:
+        data = {
+            "id": 34,
+            "name": "I90DIA_20210101",
+            "horizon": "D",
+            "archive_type": "zip",
+            "download": {"name": "I90DIA", "url": "/archives/34/download"},
+        }
+        return Archive(**data, raw=data, _request_helper=request_helper)
+
+    def _stream(
+        self, mocker: MockerFixture, content: bytes, fail_after: Optional[int] = None
+    ) -> Any:
+        response = mocker.MagicMock()
+        response.status_code = 200
+        response.headers = {"Content-Length": str(len(content))}
+        response.__enter__.return_value = response
+
+        def iter_content(chunk_size: int) -> Iterator[bytes]:
+            for i in range(0, len(content), chunk_size):
+                if fail_after is not None and i >= fail_after:
+                    raise requests.ConnectionError("Connection reset")
+                yield content[i : i + chunk_size]
+
+        response.iter_content.side_effect = iter_content
+        return response
+
+    def test_download_file_streams_to_disk(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        archive: Archive,
+        tmp_path: Path,
+    ) -> None:
+        content = _zip_bytes()
+        request_helper.get_request.return_value = self._stream(mocker, content)
+        progress: List[Tuple[int, Optional[int]]] = []
+
+        archive.download_file(
+            tmp_path,
+            unzip=False,
+            chunk_size=64,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert (tmp_path / "I90DIA_20210101.zip").read_bytes() == content
+        assert not (tmp_path / "I90DIA_20210101.zip.part").exists()
+        assert progress[-1] == (len(content), len(content))
+        assert len(progress) == -(-len(content) // 64)
+        request_helper.get_request.assert_called_once_with(
+            "/archives/34/download", headers={}, stream=True
+        )
+
+    def test_download_file_unzips_next_to_the_file(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        archive: Archive,
+        tmp_path: Path,
+    ) -> None:
+        request_helper.get_request.return_value = self._stream(mocker, _zip_bytes())
+
+        archive.download_file(tmp_path)
+
+        assert (tmp_path / "I90DIA_20210101" / "data.csv").exists()
+        assert not (tmp_path / "I90DIA_20210101.zip").exists()
+
+    def test_interrupted_download_is_resumed(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        archive: Archive,
+        tmp_path: Path,
+    ) -> None:
+        content = _zip_bytes()
+        rest = self._stream(mocker, content[64:])
+        rest.status_code = 206
+        rest.headers = {"Content-Range": f"bytes 64-{len(content) - 1}/{len(content)}"}
+        request_helper.get_request.side_effect = [
+            self._stream(mocker, content, fail_after=64),
+            rest,
+        ]
+
+        with pytest.raises(requests.ConnectionError):
+            archive.download_file(tmp_path, chunk_size=64)
+
+        assert (tmp_path / "I90DIA_20210101.zip.part").read_bytes() == content[:64]
+
+        archive.download_file(tmp_path, chunk_size=64)
+
+        assert (tmp_path / "I90DIA_20210101" / "data.csv").exists()
+        assert list(tmp_path.iterdir()) == [tmp_path / "I90DIA_20210101"]
+        request_helper.get_request.assert_called_with(
+            "/archives/34/download", headers={"Range": "bytes=64-"}, stream=True
+        )
+
+    def test_resume_restarts_when_range_is_ignored(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        archive: Archive,
+        tmp_path: Path,
+    ) -> None:
+        content = _zip_bytes()
+        (tmp_path / "I90DIA_20210101.zip.part").write_bytes(b"stale")
+        response = self._stream(mocker, content)
+        response.status_code = 200
+        request_helper.get_request.return_value = response
+
+        archive.download_file(tmp_path, unzip=False)
+
+        assert (tmp_path / "I90DIA_20210101.zip").read_bytes() == content
+
+    def test_truncated_download_is_not_renamed(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        archive: Archive,
+        tmp_path: Path,
+    ) -> None:
+        content = _zip_bytes()
+        response = self._stream(mocker, content[:64])
+        response.headers = {"Content-Length": str(len(content))}
+        request_helper.get_request.return_value = response
+
+        with pytest.raises(IncompleteDownloadError):
+            archive.download_file(tmp_path)
+
+        assert not (tmp_path / "I90DIA_20210101.zip").exists()
+        assert (tmp_path / "I90DIA_20210101.zip.part").exists()
+
+    def test_corrupted_download_is_discarded(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        archive: Archive,
+        tmp_path: Path,
+    ) -> None:
+        request_helper.get_request.return_value = self._stream(mocker, b"not a zip")
+
+        with pytest.raises(BadZipFile):
+            archive.download_file(tmp_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_file_skips_files_already_present(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        archive: Archive,
+        tmp_path: Path,
+    ) -> None:
+        (tmp_path / "I90DIA_20210101.zip").write_bytes(_zip_bytes())
+        testzip = mocker.spy(ZipFile, "testzip")
+
+        assert archive.download_file(tmp_path, unzip=False, overwrite=False) == (
+            tmp_path / "I90DIA_20210101.zip"
+        )
+        assert archive.download_file(tmp_path, overwrite=False) == (
+            tmp_path / "I90DIA_20210101"
+        )
+        assert archive.download_file(tmp_path, overwrite=False) == (
+            tmp_path / "I90DIA_20210101"
+        )
+        request_helper.get_request.assert_not_called()
+        testzip.assert_not_called()
+
+    def test_download_file_replaces_files_already_present_by_default(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        archive: Archive,
+        tmp_path: Path,
+    ) -> None:
+        (tmp_path / "I90DIA_20210101").mkdir()
+        (tmp_path / "I90DIA_20210101" / "old.csv").write_text("old")
+        request_helper.get_request.return_value = self._stream(mocker, _zip_bytes())
+
+        extract_path = archive.download_file(tmp_path)
+
+        assert sorted(path.name for path in extract_path.iterdir()) == ["data.csv"]
+        request_helper.get_request.assert_called_once()
+
+    def test_download_file_resumes_against_a_range_server(
+        self, archive: Archive, tmp_path: Path
+    ) -> None:
+        content = _zip_bytes()
+        requests_seen: List[Optional[str]] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                requests_seen.append(self.headers.get("Range"))
+                if len(requests_seen) == 1:
+                    # Announce the whole file but drop the connection midway.
+                    self.send_response(200)
+                    self.send_header("Content-Length", str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content[:50])
+                    return
+
+                start = int(self.headers["Range"][len("bytes=") : -1])
+                self.send_response(206)
+                self.send_header(
+                    "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+                )
+                self.send_header("Content-Length", str(len(content) - start))
+                self.end_headers()
+                self.wfile.write(content[start:])
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            host, port = server.server_address[:2]
+            archive._request_helper = RequestHelper(f"http://{host!s}:{port}", "token")
+
+            with pytest.raises(requests.RequestException):
+                archive.download_file(tmp_path, chunk_size=10)
+            archive.download_file(tmp_path, chunk_size=10)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert requests_seen == [None, "bytes=50-"]
+        assert (tmp_path / "I90DIA_20210101" / "data.csv").exists()
+
+    def test_from_trusted_matches_validated_archive(self, request_helper: Any) -> None:
+        data = {
+            "id": 34,
+            "name": "I90DIA_20210101",
+            "horizon": "D",
+            "archive_type": "zip",
+            "download": {"name": "I90DIA", "url": "/archives/34/download"},
+            "date_times": ["2021-01-01T00:00:00.000+01:00"],
+            "publication_date": ["2021-01-02"],
+            "taxonomy_terms": [
+                {"id_taxonomy_term": 1, "name": "Mercado", "vocabulary_id": 2}
+            ],
+            "vocabularies": [{"id_vocabulary": 2, "name": "Tema", "extra": True}],
+        }
+
+        archive = Archive.from_trusted(data, request_helper)
+
+        assert archive.download.url == "/archives/34/download"
+        assert archive.date_times == [date(2021, 1, 1)]
+        assert archive.publication_date == [date(2021, 1, 2)]
+        assert archive.taxonomy_terms == [TaxonomyTerm(1, "Mercado", 2)]
+        assert archive.vocabularies[0].name == "Tema"
+        assert archive.raw is data
+        assert archive._request_helper is request_helper
+
+    def test_from_trusted_can_drop_raw(self, request_helper: Any) -> None:
+        data = {
+            "id": 34,
+            "name": "I90DIA_20210101",
+            "horizon": "D",
+            "archive_type": "zip",
+            "download": {"name": "I90DIA", "url": "/archives/34/download"},
+        }
+
+        archive = Archive.from_trusted(data, request_helper, keep_raw=False)
+
+        assert archive.raw == {}
+        assert archive.date_times == []
@@ -0,0 +1,332 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from pytest_mock import MockerFixture
+
+from esiosapy.models.indicator.indicator import Indicator
+from esiosapy.models.indicator.output_format import OutputFormat
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.columnar import values_to_columns
+from esiosapy.utils.request_helper import RequestHelper
+
+
+def _value(dt: str, value: float, geo_id: int = 3) -> Dict[str, Any]:
+    return {"value": value, "datetime_utc": dt, "geo_id": geo_id}
+
+
+class TestIndicator:
+    @pytest.fixture
+    def request_helper(self, mocker: MockerFixture) -> Any:
+        return mocker.Mock(spec=RequestHelper)
+
+    @pytest.fixture
+    def indicator(self, request_helper: Any) -> Indicator:
+        data = {"id": 1, "name": "Indicator", "short_name": "I", "description": ""}
+        return Indicator(**data, raw=data, _request_helper=request_helper)
+
+    def _respond_with(
+        self, mocker: MockerFixture, request_helper: Any, chunks: List[Any]
+    ) -> None:
+        bodies = iter([{"indicator": {"id": 1, "values": chunk}} for chunk in chunks])
+
+        def get_json(path: str, params: Any, key_path: Tuple[str, ...]) -> Any:
+            data = next(bodies)
+            for key in key_path:
+                data = data[key]
+            return data
+
+        def get_json_columns(
+            path: str, params: Any, key_path: Tuple[str, ...]
+        ) -> Dict[str, List[Any]]:
+            return values_to_columns(get_json(path, params, key_path))
+
+        request_helper.get_json.side_effect = get_json
+        request_helper.get_json_columns.side_effect = get_json_columns
+
+    def test_get_data_single_request(
+        self, mocker: MockerFixture, request_helper: Any, indicator: Indicator
+    ) -> None:
+        values = [_value("2021-01-01T00:00:00Z", 1.0)]
+        self._respond_with(mocker, request_helper, [values])
+
+        result = indicator.get_data(
+            "2021-01-01", "2021-01-02", time_trunc=TimeTrunc.HOUR
+        )
+
+        assert result == values
+        request_helper.get_json.assert_called_once_with(
+            "/indicators/1",
+            params={
+                "start_date": "2021-01-01",
+                "end_date": "2021-01-02",
+                "time_trunc": "hour",
+            },
+            key_path=("indicator", "values"),
+        )
+
+    def test_get_data_chunked(
+        self, mocker: MockerFixture, request_helper: Any, indicator: Indicator
+    ) -> None:
+        first = [_value("2021-01-01T00:00:00Z", 1.0)]
+        second = [
+            _value("2021-01-01T00:00:00Z", 1.0),
+            _value("2021-01-02T00:00:00Z", 2.0),
+        ]
+        self._respond_with(mocker, request_helper, [first, second])
+
+        result = indicator.get_data(
+            "2021-01-01",
+            "2021-01-02T12:00:00",
+            time_trunc=TimeTrunc.HOUR,
+            chunk_size=TimeTrunc.DAY,
+            max_workers=1,
+        )
+
+        assert result == [first[0], second[1]]
+        params = [
+            call.kwargs["params"] for call in request_helper.get_json.call_args_list
+        ]
+        assert [(p["start_date"], p["end_date"]) for p in params] == [
+            ("2021-01-01T00:00:00.000000", "2021-01-01T23:59:59.000000"),
+            ("2021-01-02T00:00:00.000000", "2021-01-02T12:00:00.000000"),
+        ]
+
+    def test_get_data_chunked_by_rows_with_raw_data(
+        self, mocker: MockerFixture, request_helper: Any, indicator: Indicator
+    ) -> None:
+        chunks = [[_value(f"2021-01-0{day}T00:00:00Z", day)] for day in (1, 2, 3)]
+        self._respond_with(mocker, request_helper, chunks)
+
+        result = indicator.get_data(
+            "2021-01-01",
+            "2021-01-03T23:00:00",
+            time_trunc=TimeTrunc.HOUR,
+            max_rows_per_chunk=24,
+            max_workers=1,
+            all_raw_data=True,
+        )
+
+        assert request_helper.get_json.call_count == 3
+        assert result["indicator"]["id"] == 1
+        assert [value["value"] for value in result["indicator"]["values"]] == [1, 2, 3]
+
+    def test_chunked_raw_data_does_not_mutate_coalesced_responses(
+        self, mocker: MockerFixture
+    ) -> None:
+        request_helper = RequestHelper(
+            "https://api.example.com", "test-token", coalesce_requests=True
+        )
+        assert request_helper.single_flight is not None
+        single_flight = request_helper.single_flight
+        release = threading.Event()
+
+        def get_request(path: str, headers: Any, params: Any) -> Any:
+            release.wait()
+            start = params["start_date"]
+            body = {"indicator": {"id": 1, "values": [_value(start, int(start[8:10]))]}}
+            response = mocker.Mock()
+            response.content = json.dumps(body).encode()
+            return response
+
+        mocker.patch.object(request_helper, "get_request", side_effect=get_request)
+        data = {"id": 1, "name": "Indicator", "short_name": "I", "description": ""}
+        indicator = Indicator(**data, raw=data, _request_helper=request_helper)
+
+        def get_data() -> Any:
+            return indicator.get_data(
+                "2021-01-01",
+                "2021-01-03T23:00:00",
+                time_trunc=TimeTrunc.HOUR,
+                max_rows_per_chunk=24,
+                max_workers=3,
+                all_raw_data=True,
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(get_data) for _ in range(2)]
+            while single_flight.coalesced < 3:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results[0] is not results[1]
+        for result in results:
+            assert [value["value"] for value in result["indicator"]["values"]] == [
+                1,
+                2,
+                3,
+            ]
+
+    def test_iter_values_walks_the_range_lazily(
+        self, request_helper: Any, indicator: Indicator
+    ) -> None:
+        chunks = [
+            [_value("2021-01-01T00:00:00Z", 1.0)],
+            [
+                _value("2021-01-01T00:00:00Z", 1.0),
+                _value("2021-01-02T00:00:00Z", 2.0),
+            ],
+            [_value("2021-01-03T00:00:00Z", 3.0)],
+        ]
+        request_helper.iter_json.side_effect = [iter(chunk) for chunk in chunks]
+
+        values = indicator.iter_values(
+            "2021-01-01",
+            "2021-01-03T12:00:00",
+            time_trunc=TimeTrunc.DAY,
+            chunk_size=TimeTrunc.DAY,
+        )
+
+        assert next(values) == chunks[0][0]
+        assert request_helper.iter_json.call_count == 1
+        assert list(values) == [chunks[1][1], chunks[2][0]]
+        assert request_helper.iter_json.call_count == 3
+        assert request_helper.iter_json.call_args.kwargs["params"] == {
+            "start_date": "2021-01-03T00:00:00.000000",
+            "end_date": "2021-01-03T12:00:00.000000",
+            "time_trunc": "day",
+        }
+
+    def test_get_data_as_pandas(
+        self, mocker: MockerFixture, request_helper: Any, indicator: Indicator
+    ) -> None:
+        pytest.importorskip("pandas")
+        self._respond_with(
+            mocker,
+            request_helper,
+            [
+                [
+                    _value("2021-01-01T00:00:00Z", 1.0),
+                    _value("2021-01-01T01:00:00Z", 2.0),
+                ]
+            ],
+        )
+
+        df = indicator.get_data(
+            "2021-01-01", "2021-01-02", output_format=OutputFormat.PANDAS
+        )
+
+        assert df["value"].tolist() == [1.0, 2.0]
+        assert str(df["datetime_utc"].dt.tz) == "UTC"
+
+    def test_get_data_stitches_columns_of_windows(
+        self, mocker: MockerFixture, request_helper: Any, indicator: Indicator
+    ) -> None:
+        pytest.importorskip("numpy")
+        self._respond_with(
+            mocker,
+            request_helper,
+            [
+                [
+                    _value("2021-01-01T00:00:00Z", 1.0),
+                    _value("2021-01-02T00:00:00Z", 2.0),
+                ],
+                [
+                    _value("2021-01-02T00:00:00Z", 2.0),
+                    _value("2021-01-03T00:00:00Z", 3.0),
+                ],
+            ],
+        )
+
+        columns = indicator.get_data(
+            "2021-01-01",
+            "2021-01-03",
+            chunk_size=timedelta(days=2),
+            max_workers=1,
+            output_format=OutputFormat.NUMPY,
+        )
+
+        assert columns["value"].tolist() == [1.0, 2.0, 3.0]
+        request_helper.get_json.assert_not_called()
+
+    def test_get_data_rejects_raw_data_in_columnar_format(
+        self, indicator: Indicator
+    ) -> None:
+        with pytest.raises(ValueError):
+            indicator.get_data(
+                "2021-01-01",
+                "2021-01-02",
+                all_raw_data=True,
+                output_format=OutputFormat.NUMPY,
+            )
+
+    def test_merge_values_keeps_distinct_geo_ids(self) -> None:
+        chunks = [
+            [_value("2021-01-01T00:00:00Z", 1.0, geo_id=3)],
+            [
+                _value("2021-01-01T00:00:00Z", 1.0, geo_id=3),
+                _value("2021-01-01T00:00:00Z", 5.0, geo_id=8741),
+            ],
+        ]
+
+        assert Indicator.merge_values(chunks) == [chunks[0][0], chunks[1][1]]
+
+    def test_from_trusted_matches_validated_indicator(
+        self, request_helper: Any, indicator: Indicator
+    ) -> None:
+        data = {
+            "id": 1,
+            "name": "Indicator",
+            "short_name": "I",
+            "description": "",
+            "unknown_field": "ignored",
+        }
+
+        trusted = Indicator.from_trusted(data, request_helper)
+
+        assert trusted.model_dump(exclude={"raw"}) == indicator.model_dump(
+            exclude={"raw"}
+        )
+        assert trusted.raw is data
+        assert trusted._request_helper is request_helper
+
+    def test_export_partitioned(
+        self,
+        mocker: MockerFixture,
+        request_helper: Any,
+        indicator: Indicator,
+        tmp_path: Path,
+    ) -> None:
+        pq = pytest.importorskip("pyarrow.parquet")
+        self._respond_with(
+            mocker,
+            request_helper,
+            [
+                [_value("2021-01-31T00:00:00Z", 1.0)],
+                [
+                    _value("2021-01-31T00:00:00Z", 1.0),
+                    _value("2021-02-01T00:00:00Z", 2.0),
+                ],
+                [_value("2021-02-02T00:00:00Z", 3.0)],
+            ],
+        )
+
+        written = indicator.export(
+            "2021-01-31",
+            "2021-02-02T23:59:59",
+            tmp_path,
+            partition_by=TimeTrunc.MONTH,
+            chunk_size=timedelta(days=1),
+            max_workers=1,
+        )
+
+        assert written == 3
+        assert [
+            call.kwargs["params"]["start_date"]
+            for call in request_helper.get_json.call_args_list
+        ] == [
+            "2021-01-31T00:00:00.000000",
+            "2021-02-01T00:00:00.000000",
+            "2021-02-02T00:00:00.000000",
+        ]
+        january = pq.read_table(tmp_path / "2021-01.parquet")
+        february = pq.ParquetFile(tmp_path / "2021-02.parquet")
+        assert january.column("value").to_pylist() == [1.0]
+        assert february.metadata.num_row_groups == 2
+        assert february.read().column("value").to_pylist() == [2.0, 3.0]
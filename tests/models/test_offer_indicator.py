@@ -0,0 +1,129 @@
+import json
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from pytest_mock import MockerFixture
+
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.models.offer_indicator.offer_indicator import OfferIndicator
+from esiosapy.utils.request_helper import RequestHelper
+
+
+class TestOfferIndicator:
+    @pytest.fixture
+    def request_helper(self, mocker: MockerFixture) -> Any:
+        request_helper = mocker.Mock(spec=RequestHelper)
+
+        def get_json(
+            path: str, params: Dict[str, str], key_path: Tuple[str, ...]
+        ) -> Any:
+            day = params["datetime"][:10]
+            return [{"value": 1.0, "datetime": day, "geo_id": 3}] * 2
+
+        request_helper.get_json.side_effect = get_json
+        return request_helper
+
+    @pytest.fixture
+    def offer_indicator(self, request_helper: Any) -> OfferIndicator:
+        data = {"id": 10, "name": "Offer indicator", "description": ""}
+        return OfferIndicator(**data, raw=data, _request_helper=request_helper)
+
+    def test_iter_data_by_day(
+        self, request_helper: Any, offer_indicator: OfferIndicator
+    ) -> None:
+        days = list(
+            offer_indicator.iter_data_by_day(
+                "2021-01-30", "2021-02-02T12:00:00", max_workers=3
+            )
+        )
+
+        assert [day for day, _ in days] == [
+            date(2021, 1, 30),
+            date(2021, 1, 31),
+            date(2021, 2, 1),
+            date(2021, 2, 2),
+        ]
+        assert days[1][1][0]["datetime"] == "2021-01-31"
+        assert request_helper.get_json.call_count == 4
+
+    def test_iter_data_by_day_bounds_days_in_flight(
+        self, request_helper: Any, offer_indicator: OfferIndicator
+    ) -> None:
+        requested: List[str] = []
+        lock = threading.Lock()
+
+        def get_json(path: str, params: Dict[str, str], key_path: Any) -> Any:
+            with lock:
+                requested.append(params["datetime"])
+            return []
+
+        request_helper.get_json.side_effect = get_json
+
+        days = offer_indicator.iter_data_by_day(
+            "2021-01-01", "2021-12-31", max_workers=2, max_days_in_flight=3
+        )
+        next(days)
+        days.close()
+
+        assert len(requested) <= 4
+
+    def test_partitioned_range_and_file(
+        self, offer_indicator: OfferIndicator, tmp_path: Path
+    ) -> None:
+        values = offer_indicator.get_data_by_date_range(
+            "2021-01-01", "2021-01-03", partition_by_day=True
+        )
+        written = offer_indicator.write_data_by_day(
+            "2021-01-01", "2021-01-03", tmp_path / "offers.jsonl"
+        )
+
+        assert [value["datetime"] for value in values] == [
+            "2021-01-01",
+            "2021-01-01",
+            "2021-01-02",
+            "2021-01-02",
+            "2021-01-03",
+            "2021-01-03",
+        ]
+        lines = (tmp_path / "offers.jsonl").read_text().splitlines()
+        assert written == 6
+        assert [json.loads(line) for line in lines] == values
+
+        with pytest.raises(ValueError):
+            offer_indicator.get_data_by_date_range(
+                "2021-01-01", "2021-01-03", all_raw_data=True, partition_by_day=True
+            )
+
+    def test_export_partitioned_by_month(
+        self, offer_indicator: OfferIndicator, tmp_path: Path
+    ) -> None:
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        written = offer_indicator.export(
+            "2021-01-30",
+            "2021-02-02",
+            tmp_path,
+            partition_by=TimeTrunc.MONTH,
+            max_workers=2,
+        )
+
+        assert written == 8
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "2021-01.parquet",
+            "2021-02.parquet",
+        ]
+        february = pq.ParquetFile(tmp_path / "2021-02.parquet")
+        assert february.metadata.num_row_groups == 2
+        assert february.read().column("geo_id").to_pylist() == [3, 3, 3, 3]
+
+    def test_export_rejects_hourly_partitions(
+        self, request_helper: Any, offer_indicator: OfferIndicator, tmp_path: Path
+    ) -> None:
+        with pytest.raises(ValueError):
+            offer_indicator.export(
+                "2021-01-30", "2021-02-02", tmp_path, partition_by=TimeTrunc.HOUR
+            )
+        request_helper.get_json.assert_not_called()
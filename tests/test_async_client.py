@@ -0,0 +1,158 @@
+import asyncio
+import io
+from pathlib import Path
+from typing import Any, Dict, List
+from zipfile import ZipFile
+
+import pytest
+
+from esiosapy.async_client import AsyncESIOSAPYClient
+from esiosapy.models.archive.archive import Archive
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+
+httpx = pytest.importorskip("httpx")
+
+INDICATOR = {"id": 1, "name": "Indicator", "short_name": "I", "description": "<p/>"}
+
+
+def _zip_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("data.csv", "a;b\n1;2\n")
+    return buffer.getvalue()
+
+
+ZIP_CONTENT = _zip_bytes()
+
+
+class TestAsyncESIOSAPYClient:
+    @pytest.fixture
+    def requests_seen(self) -> List[Any]:
+        return []
+
+    @pytest.fixture
+    def esios_client(self, requests_seen: List[Any]) -> AsyncESIOSAPYClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            payload: Dict[str, Any]
+            if request.url.path == "/indicators":
+                payload = {"indicators": [INDICATOR]}
+            elif request.url.path == "/indicators/404":
+                return httpx.Response(404)
+            elif request.url.path == "/archives/34/download":
+                if "Range" not in request.headers:
+                    return httpx.Response(200, content=ZIP_CONTENT)
+                start = int(request.headers["Range"][len("bytes=") : -1])
+                return httpx.Response(
+                    206,
+                    content=ZIP_CONTENT[start:],
+                    headers={
+                        "Content-Range": (
+                            f"bytes {start}-{len(ZIP_CONTENT) - 1}/{len(ZIP_CONTENT)}"
+                        )
+                    },
+                )
+            else:
+                payload = {"indicator": {"values": [{"value": 1.0}]}}
+            return httpx.Response(200, json=payload)
+
+        client = AsyncESIOSAPYClient(
+            token="test-token", base_url="https://api.example.com"
+        )
+        client.request_helper._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return client
+
+    def test_list_all_indicators(self, esios_client: AsyncESIOSAPYClient) -> None:
+        indicators = asyncio.run(esios_client.indicators.list_all())
+
+        assert [indicator.id for indicator in indicators] == [1]
+        assert indicators[0]._request_helper is esios_client.request_helper
+
+    def test_get_data_many_indicators(
+        self, esios_client: AsyncESIOSAPYClient, requests_seen: List[Any]
+    ) -> None:
+        async def fetch_all() -> List[Any]:
+            async with esios_client:
+                return await asyncio.gather(
+                    *(
+                        esios_client.indicators.get_data(
+                            indicator_id,
+                            "2021-01-01",
+                            "2021-01-02",
+                            time_trunc=TimeTrunc.HOUR,
+                        )
+                        for indicator_id in (1, 2, 3)
+                    )
+                )
+
+        results = asyncio.run(fetch_all())
+
+        assert results == [[{"value": 1.0}]] * 3
+        assert sorted(request.url.path for request in requests_seen) == [
+            "/indicators/1",
+            "/indicators/2",
+            "/indicators/3",
+        ]
+        assert requests_seen[0].url.params["time_trunc"] == "hour"
+
+    def test_get_data_many_reports_errors_per_indicator(
+        self, esios_client: AsyncESIOSAPYClient
+    ) -> None:
+        results = asyncio.run(
+            esios_client.indicators.get_data_many([1, 404], "2021-01-01", "2021-01-02")
+        )
+
+        assert results[1].data == [{"value": 1.0}]
+        assert isinstance(results[404].error, httpx.HTTPStatusError)
+
+    def test_download_file(
+        self, esios_client: AsyncESIOSAPYClient, tmp_path: Path
+    ) -> None:
+        data = {
+            "id": 34,
+            "name": "I90DIA_20210101",
+            "horizon": "D",
+            "archive_type": "zip",
+            "download": {"name": "I90DIA", "url": "/archives/34/download"},
+        }
+        archive = Archive(**data, raw=data, _request_helper=esios_client.request_helper)
+        progress: List[int] = []
+
+        asyncio.run(
+            esios_client.archives.download_file(
+                archive,
+                tmp_path,
+                unzip=False,
+                chunk_size=4,
+                progress_callback=lambda done, total: progress.append(done),
+            )
+        )
+
+        assert (tmp_path / "I90DIA_20210101.zip").read_bytes() == ZIP_CONTENT
+        assert progress[-1] == len(ZIP_CONTENT)
+
+    def test_download_file_resumes_partial_file(
+        self,
+        esios_client: AsyncESIOSAPYClient,
+        requests_seen: List[Any],
+        tmp_path: Path,
+    ) -> None:
+        data = {
+            "id": 34,
+            "name": "I90DIA_20210101",
+            "horizon": "D",
+            "archive_type": "zip",
+            "download": {"name": "I90DIA", "url": "/archives/34/download"},
+        }
+        archive = Archive(**data, raw=data, _request_helper=esios_client.request_helper)
+        (tmp_path / "I90DIA_20210101.zip.part").write_bytes(ZIP_CONTENT[:40])
+
+        extract_path = asyncio.run(
+            esios_client.archives.download_file(archive, tmp_path)
+        )
+
+        assert extract_path == tmp_path / "I90DIA_20210101"
+        assert (extract_path / "data.csv").exists()
+        assert requests_seen[0].headers["Range"] == "bytes=40-"
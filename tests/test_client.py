@@ -9,7 +9,7 @@ from esiosapy.client import ESIOSAPYClient
 from esiosapy.managers.archive_manager import ArchiveManager
 from esiosapy.managers.indicator_manager import IndicatorManager
 from esiosapy.managers.offer_indicator_manager import OfferIndicatorManager
-from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.request_helper import DEFAULT_TIMEOUT, RequestHelper
 
 
 class TestESIOSAPYClient:
@@ -28,6 +28,8 @@ class TestESIOSAPYClient:
             "esiosapy.client.OfferIndicatorManager", autospec=True
         )
 
+        mock_request_helper.return_value.session = mocker.Mock(spec=requests.Session)
+        mock_request_helper.return_value.timeout = DEFAULT_TIMEOUT
         mock_add_default_headers = mock_request_helper.return_value.add_default_headers
 
         def add_default_headers_side_effect(headers: Dict[str, str]) -> Dict[str, str]:
@@ -56,7 +58,7 @@ class TestESIOSAPYClient:
     def test_raw_request_with_absolute_url(
         self, esios_client: ESIOSAPYClient, mocker: MockerFixture
     ) -> None:
-        mock_get = mocker.patch("requests.get", autospec=True)
+        mock_get = esios_client.request_helper.session.get
         mock_response = mocker.Mock()
         mock_get.return_value = mock_response
 
@@ -72,13 +74,15 @@ class TestESIOSAPYClient:
             "Custom-Header": "value",
         }
 
-        mock_get.assert_called_once_with(url, headers=expected_headers)
+        mock_get.assert_called_once_with(
+            url, headers=expected_headers, timeout=DEFAULT_TIMEOUT
+        )
         assert response == mock_response
 
     def test_raw_request_with_relative_url(
         self, esios_client: ESIOSAPYClient, mocker: MockerFixture
     ) -> None:
-        mock_get = mocker.patch("requests.get", autospec=True)
+        mock_get = esios_client.request_helper.session.get
         mock_response = mocker.Mock()
         mock_get.return_value = mock_response
 
@@ -94,5 +98,18 @@ class TestESIOSAPYClient:
 
         response: requests.Response = esios_client.raw_request(url, headers)
 
-        mock_get.assert_called_once_with(expected_url, headers=expected_headers)
+        mock_get.assert_called_once_with(
+            expected_url, headers=expected_headers, timeout=DEFAULT_TIMEOUT
+        )
         assert response == mock_response
+
+    def test_close(self, esios_client: ESIOSAPYClient) -> None:
+        esios_client.close()
+
+        esios_client.request_helper.close.assert_called_once()  # type: ignore
+
+    def test_context_manager_closes_client(self, esios_client: ESIOSAPYClient) -> None:
+        with esios_client as client:
+            assert client is esios_client
+
+        esios_client.request_helper.close.assert_called_once()  # type: ignore
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytest
+
+from esiosapy.models.indicator.geo_agg import GeoAgg
+from esiosapy.models.indicator.output_format import OutputFormat
+from esiosapy.models.indicator.time_agg import TimeAgg
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.aggregation import aggregate_values, truncate_utc
+
+np = pytest.importorskip("numpy")
+
+
+def _hourly(start: datetime, hours: int, geos: Dict[int, str]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "value": float(i),
+            "datetime_utc": (start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "geo_id": geo_id,
+            "geo_name": geo_name,
+        }
+        for i in range(hours)
+        for geo_id, geo_name in geos.items()
+    ]
+
+
+@pytest.mark.parametrize(
+    "utc, time_trunc, expected",
+    [
+        ("2021-01-01T00:07:30", TimeTrunc.FIVE_MINUTES, "2021-01-01T00:05:00"),
+        ("2021-01-01T00:59:59", TimeTrunc.FIFTHEEN_MINUTES, "2021-01-01T00:45:00"),
+        ("2021-01-01T22:59:00", TimeTrunc.DAY, "2020-12-31T23:00:00"),
+        ("2021-07-01T22:00:00", TimeTrunc.DAY, "2021-07-01T22:00:00"),
+        ("2021-03-28T01:30:00", TimeTrunc.MONTH, "2021-02-28T23:00:00"),
+        ("2021-12-31T23:00:00", TimeTrunc.YEAR, "2021-12-31T23:00:00"),
+    ],
+)
+def test_truncate_utc_follows_madrid_time(
+    utc: str, time_trunc: TimeTrunc, expected: str
+) -> None:
+    truncated = truncate_utc(np.array([utc], dtype="datetime64[ns]"), time_trunc)
+
+    assert truncated[0] == np.datetime64(expected)
+
+
+def test_daily_sum_on_dst_days() -> None:
+    # 2021-03-28 lasts 23 hours and 2021-10-31 lasts 25 hours in Madrid.
+    spring = _hourly(datetime(2021, 3, 27, 23), 23, {8741: "Península"})
+    autumn = _hourly(datetime(2021, 10, 30, 22), 25, {8741: "Península"})
+
+    result = aggregate_values(spring + autumn, TimeTrunc.DAY, TimeAgg.SUM)
+
+    assert [value["value"] for value in result] == [sum(range(23)), sum(range(25))]
+    assert [value["datetime"] for value in result] == [
+        "2021-03-28T00:00:00.000+01:00",
+        "2021-10-31T00:00:00.000+02:00",
+    ]
+    assert result[0]["datetime_utc"] == "2021-03-27T23:00:00Z"
+    assert result[0]["geo_name"] == "Península"
+
+
+def test_hourly_keeps_repeated_autumn_hour_apart() -> None:
+    values = _hourly(datetime(2021, 10, 31, 0), 2, {8741: "Península"})
+
+    result = aggregate_values(values, TimeTrunc.HOUR)
+
+    assert [value["datetime"] for value in result] == [
+        "2021-10-31T02:00:00.000+02:00",
+        "2021-10-31T02:00:00.000+01:00",
+    ]
+
+
+def test_geo_then_time_aggregation() -> None:
+    values = _hourly(
+        datetime(2020, 12, 31, 23), 4, {8741: "Península", 8742: "Canarias"}
+    )
+    values[0]["value"] = None
+
+    summed = aggregate_values(values, TimeTrunc.DAY, TimeAgg.AVERAGE, GeoAgg.SUM)
+    grouped = aggregate_values(
+        values, geo_agg=GeoAgg.AVERAGE, geo_groups={8741: 3, 8742: 3}
+    )
+
+    assert summed == [
+        {
+            "value": (0 + 2 + 4 + 6) / 4,
+            "datetime": "2021-01-01T00:00:00.000+01:00",
+            "datetime_utc": "2020-12-31T23:00:00Z",
+            "tz_time": "2020-12-31T23:00:00.000Z",
+        }
+    ]
+    assert [(value["geo_id"], value["value"]) for value in grouped] == [
+        (3, 0.0),
+        (3, 1.0),
+        (3, 2.0),
+        (3, 3.0),
+    ]
+    assert "geo_name" not in grouped[0]
+
+
+def test_output_formats() -> None:
+    values = _hourly(datetime(2021, 1, 31), 48, {8741: "Península"})
+
+    assert aggregate_values([], TimeTrunc.DAY) == []
+    columns = aggregate_values(
+        values, TimeTrunc.MONTH, output_format=OutputFormat.NUMPY
+    )
+    assert columns["value"].tolist() == [sum(range(23)), sum(range(23, 48))]
@@ -0,0 +1,103 @@
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from esiosapy.models.archive.archive import Archive
+from esiosapy.models.archive.archive_date_type import ArchiveDateType
+from esiosapy.utils.archive_index import ArchiveIndex
+
+
+def _archive(archive_id: int, name: str, day: str, term: str = "Mercados") -> Archive:
+    data = {
+        "id": archive_id,
+        "name": name,
+        "horizon": "D",
+        "archive_type": "zip",
+        "download": {"name": name, "url": f"/archives/{archive_id}/download"},
+        "date_times": [day],
+        "publication_date": ["2024-03-05"],
+        "taxonomy_terms": [{"id_taxonomy_term": 1, "name": term, "vocabulary_id": 2}],
+    }
+    return Archive(**data, raw=data, _request_helper=None)
+
+
+def _extract(root: Path, name: str, *members: str) -> Path:
+    path = root / name
+    for member in members:
+        (path / member).parent.mkdir(parents=True, exist_ok=True)
+        (path / member).write_text("a;b\n")
+    return path
+
+
+class TestArchiveIndex:
+    @pytest.fixture
+    def index(self, tmp_path: Path) -> Iterator[ArchiveIndex]:
+        index = ArchiveIndex(tmp_path / "index.sqlite")
+        yield index
+        index.close()
+
+    def test_add_and_get(self, index: ArchiveIndex, tmp_path: Path) -> None:
+        path = _extract(tmp_path, "I90DIA_20240301", "b.xls", "nested/a.xls")
+
+        assert index.add(_archive(34, "I90DIA_20240301", "2024-03-01"), path) == 2
+
+        indexed = index.get(34, "I90DIA_20240301")
+        assert indexed is not None
+        assert indexed.path == path
+        assert indexed.files == [path / "b.xls", path / "nested" / "a.xls"]
+        assert index.get(34, "I90DIA_20240302") is None
+        assert len(index) == 1
+
+    def test_find(self, index: ArchiveIndex, tmp_path: Path) -> None:
+        for archive_id, name, day, term in [
+            (34, "I90DIA_20240301", "2024-03-01", "Mercados"),
+            (34, "I90DIA_20240302", "2024-03-02", "Mercados"),
+            (35, "I3DIA_20240301", "2024-03-01", "Programas"),
+        ]:
+            index.add(
+                _archive(archive_id, name, day, term),
+                _extract(tmp_path, name, "data.xls"),
+            )
+
+        def names(**kwargs: Any) -> Any:
+            return [archive.name for archive in index.find(**kwargs)]
+
+        assert names(name_prefix="I90", target_date=date(2024, 3, 1)) == [
+            "I90DIA_20240301"
+        ]
+        assert names(target_date=datetime(2024, 3, 1, 12)) == [
+            "I3DIA_20240301",
+            "I90DIA_20240301",
+        ]
+        assert names(archive_id=34, taxonomy_term="Mercados") == [
+            "I90DIA_20240301",
+            "I90DIA_20240302",
+        ]
+        assert (
+            len(names(target_date="2024-03-05", date_type=ArchiveDateType.PUBLICATION))
+            == 3
+        )
+        assert names(taxonomy_term="Programas", archive_type="zip") == [
+            "I3DIA_20240301"
+        ]
+
+    def test_add_replaces_and_skips_removed_files(
+        self, index: ArchiveIndex, tmp_path: Path
+    ) -> None:
+        zip_path = tmp_path / "I90DIA_20240301.zip"
+        zip_path.write_bytes(b"PK")
+        archive = _archive(34, "I90DIA_20240301", "2024-03-01")
+        index.add(archive, _extract(tmp_path, "I90DIA_20240301", "data.xls"))
+
+        index.add(archive, zip_path)
+        indexed = index.get(34, "I90DIA_20240301")
+        assert indexed is not None and indexed.files == [zip_path]
+
+        zip_path.unlink()
+        assert index.get(34, "I90DIA_20240301") is None
+        assert len(index) == 1
+
+        index.remove(34, "I90DIA_20240301")
+        assert len(index) == 0
@@ -0,0 +1,107 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from esiosapy.utils.async_request_helper import AsyncRequestHelper
+from esiosapy.utils.retry_policy import RetryPolicy
+
+httpx = pytest.importorskip("httpx")
+
+
+class TestAsyncRequestHelper:
+    @pytest.fixture
+    def request_helper(self) -> AsyncRequestHelper:
+        return AsyncRequestHelper(
+            base_url="https://api.example.com", token="test-token", max_concurrency=2
+        )
+
+    def test_aget_request_success(self, request_helper: AsyncRequestHelper) -> None:
+        requests_seen: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            return httpx.Response(200, json={"data": "some data"})
+
+        request_helper._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        response = asyncio.run(
+            request_helper.aget_request(
+                "/data", params={"param1": "value1", "param2": 2}
+            )
+        )
+
+        assert response.json() == {"data": "some data"}
+        assert len(requests_seen) == 1
+        assert str(requests_seen[0].url) == (
+            "https://api.example.com/data?param1=value1&param2=2"
+        )
+        assert requests_seen[0].headers["x-api-key"] == "test-token"
+
+    def test_aget_request_failure(self, request_helper: AsyncRequestHelper) -> None:
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(500)
+
+        request_helper.retry_policy = RetryPolicy(max_attempts=3, backoff_factor=0)
+        request_helper._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(request_helper.aget_request("/data"))
+        assert attempts == 3
+
+    def test_aget_request_retries_transport_errors(
+        self, request_helper: AsyncRequestHelper
+    ) -> None:
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise httpx.ReadTimeout("Timed out", request=request)
+            return httpx.Response(200, json={})
+
+        request_helper.retry_policy = RetryPolicy(backoff_factor=0)
+        request_helper._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        response = asyncio.run(request_helper.aget_request("/data"))
+
+        assert response.status_code == 200
+        assert attempts == 2
+
+    def test_max_concurrency_is_respected(
+        self, request_helper: AsyncRequestHelper
+    ) -> None:
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        async def fetch_all() -> None:
+            request_helper._async_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            await asyncio.gather(
+                *(request_helper.aget_request(f"/data/{i}") for i in range(10))
+            )
+            await request_helper.aclose()
+
+        asyncio.run(fetch_all())
+
+        assert max_in_flight == 2
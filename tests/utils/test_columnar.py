@@ -0,0 +1,104 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from esiosapy.models.indicator.indicator import Indicator
+from esiosapy.models.indicator.output_format import OutputFormat
+from esiosapy.utils.columnar import (
+    check_output_format,
+    convert_values,
+    merge_columns,
+    values_to_columns,
+)
+
+VALUES: List[Dict[str, Any]] = [
+    {
+        "value": 1.5,
+        "datetime": "2021-01-01T01:00:00.000+01:00",
+        "datetime_utc": "2021-01-01T00:00:00Z",
+        "geo_id": 8741,
+        "geo_name": "Península",
+    },
+    {
+        "value": None,
+        "datetime": "2021-01-01T02:00:00.000+01:00",
+        "datetime_utc": "2021-01-01T01:00:00Z",
+        "geo_id": 8741,
+        "geo_name": "Península",
+    },
+]
+
+
+def test_records_are_returned_untouched() -> None:
+    assert convert_values(VALUES, OutputFormat.RECORDS) is VALUES
+
+
+def test_values_to_columns() -> None:
+    assert values_to_columns(VALUES) == {
+        "datetime_utc": ["2021-01-01T00:00:00", "2021-01-01T01:00:00"],
+        "value": [1.5, None],
+        "geo_id": [8741, 8741],
+        "geo_name": ["Península", "Península"],
+        "datetime": [VALUES[0]["datetime"], VALUES[1]["datetime"]],
+    }
+
+
+def test_merge_columns_drops_duplicated_rows() -> None:
+    first = values_to_columns(VALUES)
+    second = values_to_columns([VALUES[1], {**VALUES[1], "geo_id": 3}])
+
+    merged = merge_columns([first, second])
+
+    assert merged["geo_id"] == [8741, 8741, 3]
+    assert merged["value"] == [1.5, None, None]
+
+
+def test_merge_columns_falls_back_to_local_datetimes() -> None:
+    local = [{k: v for k, v in row.items() if k != "datetime_utc"} for row in VALUES]
+    chunks = [local, [local[1], {**local[1], "datetime": "2021-01-01T03:00:00"}]]
+
+    merged = merge_columns([values_to_columns(chunk) for chunk in chunks])
+
+    assert merged == values_to_columns(Indicator.merge_values(chunks))
+    assert len(merged["value"]) == 3
+
+
+def test_raw_data_requires_records() -> None:
+    check_output_format(True, OutputFormat.RECORDS)
+    with pytest.raises(ValueError):
+        check_output_format(True, OutputFormat.NUMPY)
+
+
+def test_numpy_output() -> None:
+    np = pytest.importorskip("numpy")
+
+    columns = convert_values(VALUES, OutputFormat.NUMPY)
+
+    assert columns["datetime_utc"].dtype == np.dtype("datetime64[ns]")
+    assert columns["datetime_utc"][1] == np.datetime64("2021-01-01T01:00:00")
+    assert columns["value"][0] == 1.5
+    assert np.isnan(columns["value"][1])
+    assert columns["geo_id"].tolist() == [8741, 8741]
+    assert columns["geo_name"].tolist() == ["Península", "Península"]
+
+
+def test_pandas_output() -> None:
+    pd = pytest.importorskip("pandas")
+
+    df = convert_values(VALUES, OutputFormat.PANDAS)
+
+    assert list(df.columns) == ["datetime_utc", "value", "geo_id", "geo_name"]
+    assert df["datetime_utc"][0] == pd.Timestamp("2021-01-01T00:00:00Z")
+    assert df["geo_name"].dtype == "category"
+    assert df["value"].isna().tolist() == [False, True]
+
+
+def test_arrow_output() -> None:
+    pa = pytest.importorskip("pyarrow")
+
+    table = convert_values(VALUES, OutputFormat.ARROW)
+
+    assert table.schema.field("datetime_utc").type == pa.timestamp("ns", tz="UTC")
+    assert pa.types.is_dictionary(table.schema.field("geo_name").type)
+    assert table.column("value").null_count == 1
+    assert table.num_rows == 2
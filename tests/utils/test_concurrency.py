@@ -0,0 +1,61 @@
+import threading
+import time
+from typing import Iterator, List
+
+import pytest
+
+from esiosapy.utils.concurrency import bounded_map
+
+
+def test_bounded_map_keeps_order() -> None:
+    def slow_square(x: int) -> int:
+        time.sleep(0.01 * (5 - x))
+        return x * x
+
+    assert list(bounded_map(slow_square, range(5), 4, 4)) == [
+        (x, x * x) for x in range(5)
+    ]
+
+
+def test_bounded_map_unordered_yields_first_completed() -> None:
+    release = threading.Event()
+
+    def fn(x: int) -> int:
+        if x == 0:
+            release.wait()
+        return x
+
+    results = bounded_map(fn, range(3), 3, 3, ordered=False)
+    first = [next(results), next(results)]
+    release.set()
+
+    assert sorted(first) == [(1, 1), (2, 2)]
+    assert list(results) == [(0, 0)]
+
+
+def test_bounded_map_pulls_items_lazily() -> None:
+    pulled: List[int] = []
+
+    def items() -> Iterator[int]:
+        for x in range(100):
+            pulled.append(x)
+            yield x
+
+    results = bounded_map(lambda x: x, items(), 2, 3)
+    next(results)
+    results.close()
+
+    assert len(pulled) <= 4
+
+
+def test_bounded_map_raises_errors() -> None:
+    def fn(x: int) -> int:
+        if x == 1:
+            raise ValueError("Boom")
+        return x
+
+    results = bounded_map(fn, range(10), 2, 2)
+
+    assert next(results) == (0, 0)
+    with pytest.raises(ValueError, match="Boom"):
+        next(results)
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.date_utils import (
+    add_months,
+    estimate_window,
+    format_datetime,
+    parse_datetime,
+    split_date_range,
+)
+
+
+class TestDateUtils:
+    def test_format_datetime(self) -> None:
+        dt = datetime(2021, 1, 1, tzinfo=timezone(timedelta(hours=1)))
+
+        assert format_datetime(dt) == "2021-01-01T00:00:00.000000+0100"
+        assert format_datetime("2021-01-01") == "2021-01-01"
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2021-01-01", datetime(2021, 1, 1)),
+            (
+                "2021-01-01T00:00:00.000+01:00",
+                datetime(2021, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+            ),
+            ("2021-01-01T00:00:00Z", datetime(2021, 1, 1, tzinfo=timezone.utc)),
+        ],
+    )
+    def test_parse_datetime(self, value: str, expected: datetime) -> None:
+        assert parse_datetime(value) == expected
+
+    def test_add_months_clamps_day(self) -> None:
+        assert add_months(datetime(2021, 1, 31), 1) == datetime(2021, 2, 28)
+        assert add_months(datetime(2021, 11, 15), 3) == datetime(2022, 2, 15)
+
+    def test_split_date_range_by_days(self) -> None:
+        windows = split_date_range(
+            datetime(2021, 1, 1), datetime(2021, 1, 3, 12), timedelta(days=1)
+        )
+
+        assert windows == [
+            (datetime(2021, 1, 1), datetime(2021, 1, 1, 23, 59, 59)),
+            (datetime(2021, 1, 2), datetime(2021, 1, 2, 23, 59, 59)),
+            (datetime(2021, 1, 3), datetime(2021, 1, 3, 12)),
+        ]
+
+    def test_split_date_range_by_months(self) -> None:
+        windows = split_date_range(
+            datetime(2021, 1, 1), datetime(2021, 3, 31), TimeTrunc.MONTH
+        )
+
+        assert [window_start for window_start, _ in windows] == [
+            datetime(2021, 1, 1),
+            datetime(2021, 2, 1),
+            datetime(2021, 3, 1),
+        ]
+        assert windows[-1][1] == datetime(2021, 3, 31)
+
+    def test_split_date_range_rejects_tiny_windows(self) -> None:
+        with pytest.raises(ValueError):
+            split_date_range(
+                datetime(2021, 1, 1), datetime(2021, 1, 2), timedelta(seconds=1)
+            )
+
+    def test_estimate_window(self) -> None:
+        assert estimate_window(24, TimeTrunc.HOUR) == timedelta(days=1)
+        assert estimate_window(100, TimeTrunc.HOUR) == timedelta(days=4)
+        assert estimate_window(12, TimeTrunc.FIVE_MINUTES) == timedelta(hours=1)
+        assert estimate_window(48, TimeTrunc.HOUR, n_series=2) == timedelta(days=1)
+        assert estimate_window(10, TimeTrunc.MONTH) == TimeTrunc.YEAR
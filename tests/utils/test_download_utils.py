@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from esiosapy.utils.download_utils import (
+    expected_size,
+    parse_content_range,
+    range_headers,
+)
+
+
+def test_range_headers(tmp_path: Path) -> None:
+    part_path = tmp_path / "file.zip.part"
+    assert range_headers(part_path) == (0, {})
+
+    part_path.write_bytes(b"12345")
+    assert range_headers(part_path) == (5, {"Range": "bytes=5-"})
+
+
+def test_parse_content_range() -> None:
+    assert parse_content_range({"Content-Range": "bytes 5-9/10"}) == (5, 10)
+    assert parse_content_range({"Content-Range": "bytes 5-9/*"}) == (5, None)
+    assert parse_content_range({"Content-Range": "bytes */10"}) == (None, 10)
+    assert parse_content_range({}) == (None, None)
+
+
+def test_expected_size() -> None:
+    partial = {"Content-Range": "bytes 5-9/10", "Content-Length": "5"}
+    assert expected_size(206, partial, 5) == (True, 10)
+    assert expected_size(206, partial, 3) == (False, 5)
+    assert expected_size(200, {"Content-Length": "10"}, 5) == (False, 10)
+    assert expected_size(200, {}, 0) == (False, None)
@@ -0,0 +1,83 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from esiosapy.models.indicator.export_format import ExportFormat
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.export import partition_key, split_by_partition, write_values
+
+
+def _values(day: str, geo_id: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "value": float(hour),
+            "datetime_utc": f"{day}T{hour:02d}:00:00Z",
+            "geo_id": geo_id,
+            "geo_name": f"Zone {geo_id}",
+        }
+        for hour in range(3)
+    ]
+
+
+def test_split_by_partition_aligns_on_calendar() -> None:
+    partitions = split_by_partition(
+        datetime(2021, 1, 15), datetime(2021, 3, 2, 12), TimeTrunc.MONTH
+    )
+
+    assert partitions == [
+        ("2021-01", datetime(2021, 1, 15), datetime(2021, 1, 31, 23, 59, 59)),
+        ("2021-02", datetime(2021, 2, 1), datetime(2021, 2, 28, 23, 59, 59)),
+        ("2021-03", datetime(2021, 3, 1), datetime(2021, 3, 2, 12)),
+    ]
+
+
+def test_partitions_are_daily_at_least() -> None:
+    assert partition_key(datetime(2021, 5, 6), TimeTrunc.YEAR) == "2021"
+    with pytest.raises(ValueError):
+        split_by_partition(datetime(2021, 1, 1), datetime(2021, 1, 2), TimeTrunc.HOUR)
+
+
+def test_write_parquet_row_groups(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "values.parquet"
+
+    written = write_values(
+        [
+            (None, _values("2021-01-01", 1)),
+            (None, []),
+            (None, _values("2021-01-02", 2)),
+        ],
+        path,
+    )
+
+    assert written == 6
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.metadata.num_row_groups == 2
+    table = parquet_file.read()
+    assert str(table.schema.field("datetime_utc").type) == "timestamp[ns, tz=UTC]"
+    assert table.column("geo_name").type.value_type == "string"
+    assert table.column("geo_id").to_pylist() == [1, 1, 1, 2, 2, 2]
+
+
+def test_write_partitioned_arrow_streams(tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+
+    written = write_values(
+        [
+            ("2021-01", _values("2021-01-31", 1)),
+            ("2021-02", _values("2021-02-01", 1)),
+            ("2021-02", _values("2021-02-02", 2)),
+        ],
+        tmp_path / "export",
+        ExportFormat.ARROW,
+    )
+
+    assert written == 9
+    files = sorted(path.name for path in (tmp_path / "export").iterdir())
+    assert files == ["2021-01.arrows", "2021-02.arrows"]
+    with pa.ipc.open_stream(tmp_path / "export" / "2021-02.arrows") as reader:
+        table = reader.read_all()
+    assert table.num_rows == 6
+    assert table.column("geo_name").to_pylist()[-1] == "Zone 2"
@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from esiosapy.models.indicator.time_trunc import TimeTrunc
+from esiosapy.utils.indicator_store import IndicatorStore
+
+
+def _value(dt: str, value: float, geo_id: int = 8741) -> Dict[str, Any]:
+    return {"value": value, "datetime_utc": dt, "geo_id": geo_id}
+
+
+class TestIndicatorStore:
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> IndicatorStore:
+        return IndicatorStore(tmp_path / "store.sqlite")
+
+    def test_upsert_replaces_values_and_moves_the_mark(
+        self, store: IndicatorStore
+    ) -> None:
+        store.upsert_values(
+            1,
+            [_value("2021-01-01T00:00:00Z", 1.0), _value("2021-01-01T01:00:00Z", 2.0)],
+            TimeTrunc.HOUR,
+        )
+        rows = store.upsert_values(
+            1,
+            [_value("2021-01-01T01:00:00Z", 2.5), _value("2021-01-01T02:00:00Z", 3.0)],
+            TimeTrunc.HOUR,
+        )
+
+        assert rows == 2
+        assert [v["value"] for v in store.get_values(1, TimeTrunc.HOUR)] == [
+            1.0,
+            2.5,
+            3.0,
+        ]
+        assert store.high_water_mark(1, TimeTrunc.HOUR) == datetime(
+            2021, 1, 1, 2, tzinfo=timezone.utc
+        )
+        assert store.high_water_mark(1) is None
+
+    def test_mark_never_moves_backwards(self, store: IndicatorStore) -> None:
+        store.upsert_values(1, [_value("2021-01-02T00:00:00Z", 1.0)])
+        store.upsert_values(1, [_value("2021-01-01T00:00:00Z", 1.0)])
+
+        assert store.high_water_mark(1) == datetime(2021, 1, 2, tzinfo=timezone.utc)
+
+    def test_mark_is_the_earliest_of_the_geo_series(
+        self, store: IndicatorStore
+    ) -> None:
+        store.upsert_values(
+            1,
+            [
+                _value("2021-01-02T00:00:00Z", 1.0, geo_id=3),
+                _value("2021-01-01T00:00:00Z", 1.0, geo_id=8741),
+            ],
+        )
+
+        assert store.high_water_mark(1) == datetime(2021, 1, 1, tzinfo=timezone.utc)
+        assert store.high_water_mark(1, geo_ids=[3]) == datetime(
+            2021, 1, 2, tzinfo=timezone.utc
+        )
+        assert store.high_water_mark(1, geo_ids=[3, 4]) is None
+
+    def test_get_values_filters_by_utc_range(self, store: IndicatorStore) -> None:
+        store.upsert_values(
+            1,
+            [
+                {"value": 1.0, "datetime": "2021-01-01T00:00:00.000+01:00"},
+                {"value": 2.0, "datetime": "2021-01-01T01:00:00.000+01:00"},
+            ],
+        )
+
+        values = store.get_values(
+            1, target_dt_start=datetime(2021, 1, 1, tzinfo=timezone.utc)
+        )
+
+        assert [v["value"] for v in values] == [2.0]
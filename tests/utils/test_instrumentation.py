@@ -0,0 +1,177 @@
+import io
+import json
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests.structures import CaseInsensitiveDict
+
+from esiosapy.utils.instrumentation import (
+    CACHE_HIT,
+    CACHE_MISS,
+    MetricsCollector,
+    RequestEvent,
+    RequestHook,
+    endpoint_of,
+)
+from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.response_cache import ResponseCache
+
+
+def _response(status_code: int, payload: Any = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://api.example.com/indicators"
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+    response._content = json.dumps(payload).encode()
+    response.raw = io.BytesIO()
+    return response
+
+
+class RecordingHook(RequestHook):
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Any]] = []
+
+    def before_request(self, event: RequestEvent) -> None:
+        self.calls.append(("before", event.attempts))
+
+    def on_retry(self, event: RequestEvent, delay: float) -> None:
+        self.calls.append(("retry", event.status_code))
+
+    def after_request(self, event: RequestEvent) -> None:
+        self.calls.append(("after", event))
+
+
+def test_endpoint_of() -> None:
+    assert endpoint_of("/indicators/600") == "/indicators/{id}"
+    assert endpoint_of("/archives/34/download") == "/archives/{id}/download"
+    assert endpoint_of("/indicators") == "/indicators"
+
+
+class TestRequestHooks:
+    def test_hooks_see_retries_and_outcome(self, mocker: MockerFixture) -> None:
+        mocker.patch("esiosapy.utils.request_helper.time.sleep")
+        mocker.patch(
+            "requests.Session.get",
+            side_effect=[_response(503), _response(200, {"indicators": []})],
+        )
+        hook = RecordingHook()
+        request_helper = RequestHelper(
+            "https://api.example.com", "test-token", hooks=[hook]
+        )
+
+        request_helper.get_request("/indicators/600", params={"locale": "es"})
+
+        assert [name for name, _ in hook.calls] == ["before", "retry", "after"]
+        assert hook.calls[1][1] == 503
+        event = hook.calls[2][1]
+        assert event.endpoint == "/indicators/{id}"
+        assert event.params == {"locale": "es"}
+        assert event.status_code == 200
+        assert event.retries == 1
+        assert event.bytes_received == len(b'{"indicators": []}')
+        assert event.cache is None
+        assert event.error is None
+        assert event.elapsed >= 0
+
+    def test_hooks_see_errors(self, mocker: MockerFixture) -> None:
+        mocker.patch("requests.Session.get", return_value=_response(404))
+        hook = RecordingHook()
+        request_helper = RequestHelper(
+            "https://api.example.com", "test-token", retry_policy=None, hooks=[hook]
+        )
+
+        with pytest.raises(requests.HTTPError):
+            request_helper.get_request("/indicators/1")
+
+        event = hook.calls[-1][1]
+        assert event.status_code == 404
+        assert isinstance(event.error, requests.HTTPError)
+
+    def test_hooks_see_cache_outcome(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        mocker.patch("requests.Session.get", return_value=_response(200, {}))
+        hook = RecordingHook()
+        request_helper = RequestHelper(
+            "https://api.example.com",
+            "test-token",
+            cache=ResponseCache(tmp_path / "cache.sqlite"),
+            hooks=[hook],
+        )
+
+        request_helper.get_request("/indicators")
+        request_helper.get_request("/indicators")
+
+        miss, hit = (event for name, event in hook.calls if name == "after")
+        assert (miss.cache, miss.attempts, miss.bytes_received) == (CACHE_MISS, 1, 2)
+        assert (hit.cache, hit.attempts, hit.bytes_received) == (CACHE_HIT, 0, 0)
+
+
+class TestMetricsCollector:
+    @pytest.fixture
+    def collector(self) -> MetricsCollector:
+        collector = MetricsCollector(buckets=(0.1, 1.0))
+        for elapsed, status_code, attempts in ((0.05, 200, 1), (0.5, 200, 3)):
+            collector.after_request(
+                RequestEvent(
+                    url="https://api.example.com/indicators/600",
+                    path="/indicators/600",
+                    attempts=attempts,
+                    status_code=status_code,
+                    bytes_received=100,
+                    elapsed=elapsed,
+                )
+            )
+        collector.after_request(
+            RequestEvent(
+                url="https://api.example.com/archives",
+                path="/archives",
+                attempts=4,
+                elapsed=2.0,
+                cache=CACHE_MISS,
+                error=requests.ConnectionError(),
+            )
+        )
+        return collector
+
+    def test_snapshot(self, collector: MetricsCollector) -> None:
+        snapshot = collector.snapshot()
+        indicators = snapshot["endpoints"]["/indicators/{id}"]
+        archives = snapshot["endpoints"]["/archives"]
+
+        assert indicators["requests"] == 2
+        assert indicators["retries"] == 2
+        assert indicators["bytes_received"] == 200
+        assert indicators["statuses"] == {"200": 2}
+        assert indicators["latency"]["buckets"] == {0.1: 1, 1.0: 2, float("inf"): 2}
+        assert indicators["latency"]["mean"] == pytest.approx(0.275)
+        assert indicators["requests_per_second"] > 0
+        assert archives["errors"] == 1
+        assert archives["statuses"] == {"error": 1}
+        assert archives["cache"] == {CACHE_MISS: 1}
+
+        collector.reset()
+        assert collector.snapshot()["endpoints"] == {}
+
+    def test_to_prometheus(self, collector: MetricsCollector) -> None:
+        text = collector.to_prometheus()
+
+        assert "# TYPE esiosapy_request_duration_seconds histogram" in text
+        assert (
+            'esiosapy_request_duration_seconds_bucket{endpoint="/indicators/{id}",'
+            'le="0.1"} 1'
+        ) in text
+        assert (
+            'esiosapy_request_duration_seconds_bucket{endpoint="/archives",le="+Inf"} 1'
+        ) in text
+        assert (
+            'esiosapy_requests_total{endpoint="/indicators/{id}",status="200"} 2'
+        ) in text
+        assert 'esiosapy_request_retries_total{endpoint="/archives"} 3' in text
+        assert (
+            'esiosapy_cache_requests_total{endpoint="/archives",result="miss"} 1'
+        ) in text
+        assert text.endswith("\n")
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from esiosapy.utils.json_backend import JSON_BACKENDS, JsonBackend, get_json_backend
+
+BODY = json.dumps(
+    {"indicator": {"id": 1, "values": [{"value": 1.5, "geo_id": 3}]}}
+).encode()
+
+
+@pytest.mark.parametrize("name", JSON_BACKENDS)
+def test_backends_decode_the_same(name: str) -> None:
+    if name != "json":
+        pytest.importorskip(name)
+    backend = get_json_backend(name)
+
+    assert backend.name == name
+    assert backend.loads(BODY) == json.loads(BODY)
+    assert backend.loads_path(BODY, ("indicator", "values")) == [
+        {"value": 1.5, "geo_id": 3}
+    ]
+    assert backend.loads_path(BODY, ("indicator", "id")) == 1
+    with pytest.raises(KeyError):
+        backend.loads_path(BODY, ("indicator", "missing"))
+
+
+@pytest.mark.parametrize("name", JSON_BACKENDS)
+def test_backends_decode_the_same_columns(name: str) -> None:
+    if name != "json":
+        pytest.importorskip(name)
+    backend = get_json_backend(name)
+    body = json.dumps(
+        {
+            "indicator": {
+                "values": [
+                    {
+                        "value": 1.5,
+                        "datetime_utc": "2021-01-01T00:00:00Z",
+                        "geo_id": 3,
+                        "geo_name": "España",
+                    },
+                    {"value": None, "datetime": "2021-01-01T02:00:00.000+01:00"},
+                ]
+            }
+        }
+    ).encode()
+
+    assert backend.loads_columns(body, ("indicator", "values")) == {
+        "datetime_utc": ["2021-01-01T00:00:00", None],
+        "value": [1.5, None],
+        "geo_id": [3, -1],
+        "geo_name": ["España", ""],
+        "datetime": [None, "2021-01-01T02:00:00.000+01:00"],
+    }
+    with pytest.raises(KeyError):
+        backend.loads_columns(body, ("indicator", "missing"))
+
+
+def test_get_json_backend() -> None:
+    backend = JsonBackend()
+
+    assert get_json_backend(backend) is backend
+    assert get_json_backend().name in JSON_BACKENDS
+    with pytest.raises(ValueError):
+        get_json_backend("yaml")
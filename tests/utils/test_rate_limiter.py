@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from esiosapy.utils.rate_limiter import AdaptiveConcurrency, RateLimiter
+from esiosapy.utils.request_helper import RequestHelper
+
+
+class TestRateLimiter:
+    def test_reserve_allows_a_burst_then_spaces_requests(
+        self, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("esiosapy.utils.rate_limiter.time.time", return_value=1000.0)
+        limiter = RateLimiter(rate=2, burst=3)
+
+        delays = [limiter.reserve() for _ in range(5)]
+
+        assert delays == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+    def test_bucket_refills_over_time(self, mocker: MockerFixture) -> None:
+        now = mocker.patch("esiosapy.utils.rate_limiter.time.time")
+        now.return_value = 1000.0
+        limiter = RateLimiter(rate=1)
+        limiter.reserve()
+
+        now.return_value = 1005.0
+
+        assert limiter.reserve() == 0.0
+
+    def test_sqlite_bucket_is_shared(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        mocker.patch("esiosapy.utils.rate_limiter.time.time", return_value=1000.0)
+        first = RateLimiter(rate=1, path=tmp_path / "rate.sqlite")
+        second = RateLimiter(rate=1, path=tmp_path / "rate.sqlite")
+        other_key = RateLimiter(rate=1, path=tmp_path / "rate.sqlite", key="other")
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == 1.0
+        assert other_key.reserve() == 0.0
+
+    def test_aacquire_reserves_off_the_event_loop(self, mocker: MockerFixture) -> None:
+        limiter = RateLimiter(rate=1)
+        threads = []
+
+        def reserve() -> float:
+            threads.append(threading.get_ident())
+            return 0.0
+
+        mocker.patch.object(limiter, "reserve", side_effect=reserve)
+
+        asyncio.run(limiter.aacquire())
+
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_rejects_invalid_rate(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+
+class TestAdaptiveConcurrency:
+    def test_increases_on_success_and_halves_on_overload(self) -> None:
+        concurrency = AdaptiveConcurrency(initial=2, maximum=8, decrease_cooldown=0)
+
+        for _ in range(6):
+            concurrency.acquire()
+            concurrency.release(200)
+        assert concurrency.limit == 4
+
+        concurrency.acquire()
+        concurrency.release(429)
+        assert concurrency.limit == 2
+
+        concurrency.acquire()
+        concurrency.release(None)
+        assert concurrency.limit == 1
+
+    def test_backs_off_once_per_cooldown(self) -> None:
+        concurrency = AdaptiveConcurrency(initial=8, maximum=8, decrease_cooldown=60)
+
+        for _ in range(3):
+            concurrency.acquire()
+            concurrency.release(503)
+
+        assert concurrency.limit == 4
+
+    def test_acquire_blocks_at_the_limit(self) -> None:
+        concurrency = AdaptiveConcurrency(initial=1)
+        concurrency.acquire()
+        acquired = threading.Event()
+
+        def worker() -> None:
+            concurrency.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.1)
+
+        concurrency.release(200)
+        assert acquired.wait(1)
+        thread.join()
+
+    def test_request_helper_reports_statuses(self, mocker: MockerFixture) -> None:
+        concurrency = AdaptiveConcurrency(initial=4, maximum=8, decrease_cooldown=0)
+        limiter = mocker.Mock(spec=RateLimiter)
+        request_helper = RequestHelper(
+            "https://api.example.com",
+            "test-token",
+            rate_limiter=limiter,
+            concurrency=concurrency,
+            retry_policy=None,
+        )
+        response: Any = mocker.Mock(status_code=429)
+        response.raise_for_status.side_effect = Exception("Too Many Requests")
+        mocker.patch("requests.Session.get", return_value=response)
+
+        with pytest.raises(Exception, match="Too Many Requests"):
+            request_helper.get_request("/indicators")
+
+        limiter.acquire.assert_called_once()
+        assert concurrency.limit == 2
+        assert concurrency.in_flight == 0
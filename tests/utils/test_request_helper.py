@@ -1,3 +1,4 @@
+import io
 from typing import Dict, List, Union
 from urllib.parse import urljoin
 
@@ -5,7 +6,7 @@ import pytest
 import requests
 from pytest_mock import MockerFixture
 
-from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.request_helper import DEFAULT_TIMEOUT, RequestHelper
 
 
 class TestRequestHelper:
@@ -54,10 +55,85 @@ class TestRequestHelper:
 
         assert result == expected_headers
 
+    def test_get_json_decodes_a_sub_tree(
+        self, mocker: MockerFixture, request_helper: RequestHelper
+    ) -> None:
+        mock_get = mocker.patch("requests.Session.get")
+        mock_get.return_value.content = b'{"indicator": {"id": 1, "values": [1, 2]}}'
+
+        values = request_helper.get_json(
+            "/indicators/1", params={"a": 1}, key_path=("indicator", "values")
+        )
+
+        assert values == [1, 2]
+        assert mock_get.call_args.kwargs["params"] == {"a": 1}
+
+    def test_iter_json_streams_the_body(
+        self, mocker: MockerFixture, request_helper: RequestHelper
+    ) -> None:
+        pytest.importorskip("ijson")
+        mock_get = mocker.patch("requests.Session.get")
+        response = mock_get.return_value
+        response.__enter__.return_value = response
+        response.raw = io.BytesIO(
+            b'{"indicator": {"id": 1, "values": [{"value": 1.5}, {"value": 2}]}}'
+        )
+
+        values = request_helper.iter_json(
+            "/indicators/1", key_path=("indicator", "values")
+        )
+
+        assert list(values) == [{"value": 1.5}, {"value": 2}]
+        assert mock_get.call_args.kwargs["stream"] is True
+        response.__exit__.assert_called_once()
+
+    def test_iter_json_without_ijson(
+        self, mocker: MockerFixture, request_helper: RequestHelper
+    ) -> None:
+        mocker.patch(
+            "esiosapy.utils.request_helper.incremental_decoding_available",
+            return_value=False,
+        )
+        mock_get = mocker.patch("requests.Session.get")
+        mock_get.return_value.content = b'{"indicator": {"id": 1, "values": [1, 2]}}'
+
+        values = request_helper.iter_json(
+            "/indicators/1", key_path=("indicator", "values")
+        )
+
+        assert list(values) == [1, 2]
+        assert mock_get.call_args.kwargs["stream"] is False
+
+    @pytest.mark.parametrize("incremental", [True, False])
+    def test_iter_json_raises_on_a_missing_key_path(
+        self, mocker: MockerFixture, request_helper: RequestHelper, incremental: bool
+    ) -> None:
+        if incremental:
+            pytest.importorskip("ijson")
+        mocker.patch(
+            "esiosapy.utils.request_helper.incremental_decoding_available",
+            return_value=incremental,
+        )
+        body = b'{"indicator": {"id": 1, "values": []}, "message": "x"}'
+        mock_get = mocker.patch("requests.Session.get")
+        response = mock_get.return_value
+        response.__enter__.return_value = response
+        response.content = body
+        response.raw = io.BytesIO(body)
+
+        values = request_helper.iter_json(
+            "/indicators/1", key_path=("indicator", "values")
+        )
+        assert list(values) == []
+
+        response.raw = io.BytesIO(body)
+        with pytest.raises(KeyError):
+            list(request_helper.iter_json("/indicators/1", key_path=("values",)))
+
     def test_get_request_success(
         self, mocker: MockerFixture, request_helper: RequestHelper
     ) -> None:
-        mock_get = mocker.patch("requests.get")
+        mock_get = mocker.patch("requests.Session.get")
 
         mock_response = mocker.Mock()
         mock_response.status_code = 200
@@ -82,7 +158,11 @@ class TestRequestHelper:
         response = request_helper.get_request(path, headers, params)
 
         mock_get.assert_called_once_with(
-            expected_url, headers=expected_headers, params=params
+            expected_url,
+            headers=expected_headers,
+            params=params,
+            stream=False,
+            timeout=DEFAULT_TIMEOUT,
         )
 
         assert response == mock_response
@@ -90,8 +170,8 @@ class TestRequestHelper:
     def test_get_request_failure(
         self, mocker: MockerFixture, request_helper: RequestHelper
     ) -> None:
-        # Mock the requests.get method
-        mock_get = mocker.patch("requests.get")
+        # Mock the pooled session get method
+        mock_get = mocker.patch("requests.Session.get")
 
         mock_response = mocker.Mock()
         mock_response.raise_for_status.side_effect = requests.HTTPError("Error")
@@ -108,3 +188,43 @@ class TestRequestHelper:
             request_helper.get_request(path, headers, params)
 
         mock_get.assert_called_once()
+
+    def test_session_is_reused(self, request_helper: RequestHelper) -> None:
+        session = request_helper.session
+
+        assert request_helper.session is session
+        assert isinstance(session, requests.Session)
+
+    def test_session_pool_configuration(self) -> None:
+        request_helper = RequestHelper(
+            base_url="https://api.example.com",
+            token="test-token",
+            pool_connections=3,
+            pool_maxsize=25,
+            pool_block=True,
+        )
+
+        adapter = request_helper.session.get_adapter("https://api.example.com")
+
+        assert adapter._pool_connections == 3  # type: ignore
+        assert adapter._pool_maxsize == 25  # type: ignore
+        assert adapter._pool_block is True  # type: ignore
+
+    def test_session_without_keep_alive(self) -> None:
+        request_helper = RequestHelper(
+            base_url="https://api.example.com", token="test-token", keep_alive=False
+        )
+
+        assert request_helper.session.headers["Connection"] == "close"
+
+    def test_close_discards_session(
+        self, mocker: MockerFixture, request_helper: RequestHelper
+    ) -> None:
+        session = request_helper.session
+        mock_close = mocker.patch.object(session, "close")
+
+        with request_helper:
+            pass
+
+        mock_close.assert_called_once()
+        assert request_helper.session is not session
@@ -0,0 +1,156 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests.structures import CaseInsensitiveDict
+
+from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.response_cache import ResponseCache
+
+
+def _response(
+    payload: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://api.example.com/indicators"
+    response.headers = CaseInsensitiveDict(
+        {"Content-Type": "application/json", **(headers or {})}
+    )
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> ResponseCache:
+        return ResponseCache(tmp_path / "cache.sqlite", default_ttl=60)
+
+    def test_make_key_normalizes_params(self) -> None:
+        key = ResponseCache.make_key("https://a/b", {"x": 1, "y": ["a", "b"]})
+
+        assert key == ResponseCache.make_key("https://a/b", {"y": ["a", "b"], "x": "1"})
+        assert key != ResponseCache.make_key("https://a/b", {"x": 2, "y": ["a"]})
+
+    def test_make_key_depends_on_credentials(self) -> None:
+        key = ResponseCache.make_key("https://a/b", {}, {"x-api-key": "one"})
+
+        assert key == ResponseCache.make_key(
+            "https://a/b", {}, {"X-API-Key": "one", "If-None-Match": '"v1"'}
+        )
+        assert key != ResponseCache.make_key("https://a/b", {}, {"x-api-key": "two"})
+
+    def test_ttl_for_uses_longest_prefix(self, tmp_path: Path) -> None:
+        cache = ResponseCache(
+            tmp_path / "cache.sqlite",
+            default_ttl=10,
+            ttls={"/indicators": 20, "/indicators/1": None},
+        )
+
+        assert cache.ttl_for("/archives") == 10
+        assert cache.ttl_for("/indicators/2") == 20
+        assert cache.ttl_for("/indicators/1") is None
+
+    def test_set_and_get(self, cache: ResponseCache) -> None:
+        cache.set("key", _response({"a": 1}), ttl=60)
+
+        cached = cache.get("key")
+
+        assert cached is not None
+        assert cached.is_fresh
+        assert cached.to_response().json() == {"a": 1}
+
+    def test_persists_between_instances(
+        self, cache: ResponseCache, tmp_path: Path
+    ) -> None:
+        cache.set("key", _response({"a": 1}), ttl=None)
+        cache.close()
+
+        cached = ResponseCache(tmp_path / "cache.sqlite").get("key")
+
+        assert cached is not None
+        assert cached.expires_at is None
+
+    def test_does_not_store_errors_or_non_json(self, cache: ResponseCache) -> None:
+        cache.set("error", _response({}, status_code=500), ttl=60)
+        zip_response = _response({}, headers={"Content-Type": "application/zip"})
+        cache.set("zip", zip_response, ttl=60)
+
+        assert cache.get("error") is None
+        assert cache.get("zip") is None
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        payload = {"data": "x" * 100}
+        size = len(json.dumps(payload))
+        cache = ResponseCache(tmp_path / "cache.sqlite", max_bytes=2 * size)
+
+        cache.set("first", _response(payload), ttl=60)
+        cache.set("second", _response(payload), ttl=60)
+        cache.get("first")
+        cache.set("third", _response(payload), ttl=60)
+
+        assert cache.get("first") is not None
+        assert cache.get("second") is None
+        assert cache.get("third") is not None
+
+
+class TestRequestHelperWithCache:
+    @pytest.fixture
+    def request_helper(self, tmp_path: Path) -> RequestHelper:
+        cache = ResponseCache(tmp_path / "cache.sqlite", default_ttl=60)
+        return RequestHelper("https://api.example.com", "test-token", cache=cache)
+
+    def test_fresh_response_is_served_from_cache(
+        self, mocker: MockerFixture, request_helper: RequestHelper
+    ) -> None:
+        mock_get = mocker.patch(
+            "requests.Session.get", return_value=_response({"a": 1})
+        )
+
+        first = request_helper.get_request("/indicators", params={"text": "price"})
+        second = request_helper.get_request("/indicators", params={"text": "price"})
+
+        mock_get.assert_called_once()
+        assert first.json() == second.json() == {"a": 1}
+
+    def test_expired_response_is_revalidated(
+        self, mocker: MockerFixture, request_helper: RequestHelper
+    ) -> None:
+        assert request_helper.cache is not None
+        request_helper.cache.default_ttl = 0
+        mock_get = mocker.patch(
+            "requests.Session.get",
+            side_effect=[
+                _response({"a": 1}, headers={"ETag": '"v1"'}),
+                _response(None, status_code=304),
+            ],
+        )
+
+        request_helper.get_request("/indicators")
+        response = request_helper.get_request("/indicators")
+
+        assert response.json() == {"a": 1}
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    def test_clients_with_other_tokens_do_not_share_responses(
+        self, mocker: MockerFixture, request_helper: RequestHelper
+    ) -> None:
+        mock_get = mocker.patch(
+            "requests.Session.get",
+            side_effect=[_response({"token": "one"}), _response({"token": "two"})],
+        )
+        other = RequestHelper(
+            "https://api.example.com", "other-token", cache=request_helper.cache
+        )
+
+        first = request_helper.get_request("/indicators")
+        second = other.get_request("/indicators")
+
+        assert mock_get.call_count == 2
+        assert first.json() == {"token": "one"}
+        assert second.json() == {"token": "two"}
@@ -0,0 +1,123 @@
+import io
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, List
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests.structures import CaseInsensitiveDict
+
+from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.retry_policy import RetryPolicy
+
+
+def _response(status_code: int, headers: Any = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = b"{}"
+    response.raw = io.BytesIO()
+    return response
+
+
+class TestRetryPolicy:
+    def test_backoff_grows_exponentially_up_to_the_cap(self) -> None:
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        assert [policy.backoff(attempt) for attempt in range(1, 6)] == [
+            1,
+            2,
+            4,
+            5,
+            5,
+        ]
+
+    def test_jittered_backoff_stays_within_bounds(self) -> None:
+        policy = RetryPolicy(backoff_factor=1)
+
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+
+    def test_response_delay_honors_retry_after(self) -> None:
+        policy = RetryPolicy(max_retry_after=60)
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert policy.response_delay(1, 429, {"Retry-After": "7"}) == 7
+        assert (
+            25
+            < policy.response_delay(  # type: ignore[operator]
+                1, 503, {"Retry-After": format_datetime(retry_at, usegmt=True)}
+            )
+            <= 30
+        )
+        assert policy.response_delay(1, 429, {"Retry-After": "600"}) is None
+
+    def test_response_delay_gives_up(self) -> None:
+        policy = RetryPolicy(max_attempts=2)
+
+        assert policy.response_delay(1, 404, {}) is None
+        assert policy.response_delay(2, 503, {}) is None
+        assert policy.error_delay(2) is None
+
+
+class TestRequestHelperRetries:
+    @pytest.fixture
+    def sleeps(self, mocker: MockerFixture) -> List[float]:
+        delays: List[float] = []
+        mocker.patch(
+            "esiosapy.utils.request_helper.time.sleep", side_effect=delays.append
+        )
+        return delays
+
+    def test_retries_transient_statuses(
+        self, mocker: MockerFixture, sleeps: List[float]
+    ) -> None:
+        mock_get = mocker.patch(
+            "requests.Session.get",
+            side_effect=[
+                _response(503, {"Retry-After": "2"}),
+                _response(502),
+                _response(200),
+            ],
+        )
+        request_helper = RequestHelper(
+            "https://api.example.com",
+            "test-token",
+            retry_policy=RetryPolicy(backoff_factor=1, jitter=False),
+        )
+
+        response = request_helper.get_request("/indicators")
+
+        assert response.status_code == 200
+        assert mock_get.call_count == 3
+        assert sleeps == [2, 2]
+
+    def test_raises_after_the_last_attempt(
+        self, mocker: MockerFixture, sleeps: List[float]
+    ) -> None:
+        mock_get = mocker.patch(
+            "requests.Session.get", side_effect=requests.ConnectTimeout("Timed out")
+        )
+        request_helper = RequestHelper(
+            "https://api.example.com",
+            "test-token",
+            retry_policy=RetryPolicy(max_attempts=3),
+        )
+
+        with pytest.raises(requests.ConnectTimeout):
+            request_helper.get_request("/indicators")
+
+        assert mock_get.call_count == 3
+        assert len(sleeps) == 2
+
+    def test_no_retry_policy(self, mocker: MockerFixture, sleeps: List[float]) -> None:
+        mock_get = mocker.patch("requests.Session.get", return_value=_response(503))
+        request_helper = RequestHelper(
+            "https://api.example.com", "test-token", retry_policy=None
+        )
+
+        with pytest.raises(requests.HTTPError):
+            request_helper.get_request("/indicators")
+
+        assert mock_get.call_count == 1
+        assert sleeps == []
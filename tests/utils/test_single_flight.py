@@ -0,0 +1,100 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pytest_mock import MockerFixture
+
+from esiosapy.utils.request_helper import RequestHelper
+from esiosapy.utils.single_flight import SingleFlight
+
+
+def _wait_for_waiters(single_flight: SingleFlight, count: int) -> None:
+    while single_flight.coalesced < count:
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_are_coalesced(self) -> None:
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls: List[int] = []
+
+        def fn() -> Dict[str, int]:
+            calls.append(1)
+            release.wait()
+            return {"value": 1}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(single_flight.do, "key", fn) for _ in range(4)]
+            _wait_for_waiters(single_flight, 3)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert single_flight.coalesced == 3
+
+    def test_errors_are_shared(self) -> None:
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def fn() -> None:
+            release.wait()
+            raise ValueError("Boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(single_flight.do, "key", fn) for _ in range(2)]
+            _wait_for_waiters(single_flight, 1)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="Boom"):
+                    future.result()
+
+    def test_results_are_not_cached(self) -> None:
+        single_flight = SingleFlight()
+        results = iter([1, 2])
+
+        assert single_flight.do("key", lambda: next(results)) == 1
+        assert single_flight.do("key", lambda: next(results)) == 2
+        assert single_flight.coalesced == 0
+
+
+class TestRequestHelperCoalescing:
+    def test_identical_get_json_calls_share_a_request(
+        self, mocker: MockerFixture
+    ) -> None:
+        request_helper = RequestHelper(
+            "https://api.example.com", "test-token", coalesce_requests=True
+        )
+        assert request_helper.single_flight is not None
+        release = threading.Event()
+
+        def get_request(path: str, headers: Any, params: Any) -> Any:
+            release.wait()
+            response = mocker.Mock()
+            response.content = b'{"indicator": {"values": [1]}}'
+            return response
+
+        mock_get_request = mocker.patch.object(
+            request_helper, "get_request", side_effect=get_request
+        )
+
+        def get_json(params: Optional[Dict[str, Any]]) -> Any:
+            return request_helper.get_json(
+                "/indicators/1", params=params, key_path=("indicator", "values")
+            )
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(get_json, params)
+                for params in ({"geo_ids": 3}, {"geo_ids": "3"}, {"geo_ids": "8741"})
+            ]
+            _wait_for_waiters(request_helper.single_flight, 1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [[1], [1], [1]]
+        assert results[0] is results[1]
+        assert mock_get_request.call_count == 2
@@ -0,0 +1,40 @@
+from pytest_mock import MockerFixture
+
+from esiosapy.utils.ttl_cache import TTLCache, freeze_params
+
+
+class TestTTLCache:
+    def test_get_or_set_memoizes(self, mocker: MockerFixture) -> None:
+        cache = TTLCache()
+        factory = mocker.Mock(return_value=[1, 2])
+
+        assert cache.get_or_set("key", factory) == [1, 2]
+        assert cache.get_or_set("key", factory) == [1, 2]
+        factory.assert_called_once()
+
+    def test_expired_entries_are_recomputed(self, mocker: MockerFixture) -> None:
+        cache = TTLCache(ttl=10)
+        monotonic = mocker.patch("esiosapy.utils.ttl_cache.time.monotonic")
+        monotonic.return_value = 100.0
+        cache.get_or_set("key", lambda: "old")
+
+        monotonic.return_value = 111.0
+
+        assert cache.get_or_set("key", lambda: "new") == "new"
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get_or_set("a", lambda: 0)
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get_or_set("a", lambda: 0) == 1
+        assert cache.get_or_set("b", lambda: 0) == 0
+
+    def test_freeze_params(self) -> None:
+        assert freeze_params({"b": ["x", "y"], "a": 1}) == (
+            ("a", 1),
+            ("b", ("x", "y")),
+        )
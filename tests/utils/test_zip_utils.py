@@ -0,0 +1,77 @@
+import io
+from pathlib import Path, PurePosixPath
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import pytest
+
+from esiosapy.utils.zip_utils import iter_zip_members, recursive_unzip
+
+
+def _zip_bytes(files: dict, compression: int = ZIP_DEFLATED) -> bytes:
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w", compression=compression) as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def nested_zip(tmp_path: Path) -> Path:
+    day = _zip_bytes({"data.csv": "a;b\n1;2\n"})
+    month = _zip_bytes(
+        {"20210101.zip": day, "20210102.zip": day}, compression=ZIP_STORED
+    )
+    zip_path = tmp_path / "archive.zip"
+    zip_path.write_bytes(
+        _zip_bytes({"readme.txt": "hello", "months/202101.zip": month})
+    )
+    return zip_path
+
+
+def test_recursive_unzip_removing_nested_zips(nested_zip: Path, tmp_path: Path) -> None:
+    unzip_path = tmp_path / "archive"
+
+    extracted = recursive_unzip(nested_zip, unzip_path, remove=True)
+
+    assert sorted(extracted) == [
+        unzip_path / "months/202101/20210101/data.csv",
+        unzip_path / "months/202101/20210102/data.csv",
+        unzip_path / "readme.txt",
+    ]
+    assert sorted(p for p in unzip_path.rglob("*") if p.is_file()) == sorted(extracted)
+    assert not nested_zip.exists()
+
+
+def test_recursive_unzip_keeping_nested_zips(nested_zip: Path, tmp_path: Path) -> None:
+    unzip_path = tmp_path / "archive"
+
+    recursive_unzip(nested_zip, unzip_path)
+
+    assert nested_zip.exists()
+    assert (unzip_path / "months/202101.zip").exists()
+    assert (unzip_path / "months/202101/20210101.zip").exists()
+    assert (unzip_path / "months/202101/20210101/data.csv").read_text() == (
+        "a;b\n1;2\n"
+    )
+
+
+def test_recursive_unzip_ignores_unsafe_paths(tmp_path: Path) -> None:
+    zip_path = tmp_path / "evil.zip"
+    zip_path.write_bytes(_zip_bytes({"../../outside.txt": "x", "/abs.txt": "y"}))
+
+    recursive_unzip(zip_path, tmp_path / "out")
+
+    assert (tmp_path / "out/outside.txt").exists()
+    assert (tmp_path / "out/abs.txt").exists()
+    assert not (tmp_path.parent / "outside.txt").exists()
+
+
+def test_iter_zip_members(nested_zip: Path) -> None:
+    members = {path: f.read() for path, f in iter_zip_members(nested_zip)}
+
+    assert members == {
+        PurePosixPath("readme.txt"): b"hello",
+        PurePosixPath("months/202101/20210101/data.csv"): b"a;b\n1;2\n",
+        PurePosixPath("months/202101/20210102/data.csv"): b"a;b\n1;2\n",
+    }
+    assert nested_zip.parent.joinpath("archive").exists() is False